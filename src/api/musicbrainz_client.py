@@ -12,6 +12,7 @@ Features:
 import musicbrainzngs
 import requests
 import logging
+import threading
 import time
 from typing import List, Dict, Optional
 from pathlib import Path
@@ -49,6 +50,8 @@ class MusicBrainzClient:
         # Rate limiting (MusicBrainz allows 1 request/second)
         self._last_request_time = 0
         self._rate_limiter = True
+        # Serializes slot reservation when searches run on worker threads
+        self._rate_lock = threading.Lock()
 
         logger.info(f"MusicBrainzClient initialized: {app_name} v{app_version}")
 
@@ -208,19 +211,24 @@ class MusicBrainzClient:
     def _enforce_rate_limit(self):
         """
         Enforce rate limit (1 request/second for MusicBrainz)
+
+        Thread-safe: each caller reserves the next free 1-second slot under
+        a lock, then sleeps outside it, so concurrent searches start at most
+        once per second while their HTTP round-trips overlap.
         """
         if not self._rate_limiter:
             return
 
-        # Calculate time since last request
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        with self._rate_lock:
+            # Next request may start 1 second after the last reserved slot
+            current_time = time.time()
+            start_time = max(current_time, self._last_request_time + 1.0)
+
+            # Reserve the slot before releasing the lock
+            self._last_request_time = start_time
 
-        # If less than 1 second, wait
-        if time_since_last < 1.0:
-            wait_time = 1.0 - time_since_last
+        # If the slot is in the future, wait for it
+        wait_time = start_time - current_time
+        if wait_time > 0:
             logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
             time.sleep(wait_time)
-
-        # Update last request time
-        self._last_request_time = time.time()
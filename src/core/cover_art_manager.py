@@ -19,6 +19,10 @@ class CoverArtManager:
 
     Uses Cover Art Archive API (no API key needed):
     https://coverartarchive.org/
+
+    MusicBrainz lookups are rate limited (1 req/s, thread-safe) by
+    musicbrainzngs itself. Cover downloads share one keep-alive
+    requests.Session, so DNS/TCP/TLS setup happens once per host.
     """
 
     def __init__(self, cover_art_dir: str = None):
@@ -37,6 +41,9 @@ class CoverArtManager:
         # Create directory if doesn't exist
         self.cover_dir.mkdir(parents=True, exist_ok=True)
 
+        # Reused HTTP connection pool for Cover Art Archive downloads
+        self._session = requests.Session()
+
         logger.info(f"CoverArtManager initialized: {self.cover_dir}")
 
     def get_cover_url(self, artist: str, album: str) -> Optional[str]:
@@ -109,7 +116,7 @@ class CoverArtManager:
                 save_path = album_dir / "cover.jpg"
 
             # Download cover
-            response = requests.get(cover_url, timeout=10)
+            response = self._session.get(cover_url, timeout=10)
 
             if response.status_code == 200:
                 # Save image
@@ -140,7 +147,7 @@ class CoverArtManager:
         try:
             cover_url = f"https://coverartarchive.org/release/{release_mbid}/front"
 
-            response = requests.get(cover_url, timeout=10)
+            response = self._session.get(cover_url, timeout=10)
 
             if response.status_code == 200:
                 # Create directory if needed
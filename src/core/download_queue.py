@@ -9,17 +9,136 @@ Features:
 - Pause/resume/cancel individual downloads
 - Automatic retry on failure
 """
+import os
 import json
 import uuid
 import logging
+import itertools
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
-from PyQt6.QtCore import QObject, pyqtSignal
+from typing import Any, Dict, List, Optional, Callable
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
 from workers.download_worker import DownloadWorker
+from utils.input_sanitizer import sanitize_filename
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Try to import mutagen (needed for auto-import to database)
+try:
+    from mutagen.mp3 import MP3
+    from mutagen.id3 import ID3
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+    logger.warning("mutagen not available - auto-import to database disabled")
+
+# Try to import orjson (faster queue persistence, falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class QueueItem:
+    """
+    Single download in the queue
+
+    Slotted record (no per-item __dict__). Supports dict-style access
+    (item['status'], item.get('metadata', {})) so callers can keep treating
+    items as dicts; keys that are not fields are kept in `extra`.
+    """
+    # Declared by hand: @dataclass(slots=True) needs Python 3.10
+    __slots__ = ('id', 'video_url', 'metadata', 'status', 'progress',
+                 'error', 'retry_count', 'extra')
+
+    def __init__(self, id: str, video_url: str, metadata: dict,
+                 status: str = 'pending', progress: int = 0,
+                 error: Optional[str] = None, retry_count: int = 0,
+                 extra: Optional[dict] = None):
+        self.id = id
+        self.video_url = video_url
+        self.metadata = metadata
+        self.status = status  # pending, downloading, paused, completed, canceled, failed
+        self.progress = progress
+        self.error = error
+        self.retry_count = retry_count
+        self.extra = extra
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"QueueItem({values})"
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    __hash__ = None  # Mutable, like a non-frozen dataclass
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _QUEUE_ITEM_FIELDS:
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in _QUEUE_ITEM_FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return key in _QUEUE_ITEM_FIELDS or (self.extra is not None and key in self.extra)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict:
+        """
+        Convert to a plain dict (for persistence)
+
+        Returns:
+            dict: Item fields (plus any extra keys)
+        """
+        data = {key: getattr(self, key) for key in _QUEUE_ITEM_KEYS}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QueueItem':
+        """
+        Build item from a plain dict (as written by to_dict)
+
+        Args:
+            data (dict): Item data
+
+        Returns:
+            QueueItem: New item
+        """
+        known = {key: value for key, value in data.items() if key in _QUEUE_ITEM_FIELDS}
+        extra = {key: value for key, value in data.items() if key not in _QUEUE_ITEM_FIELDS}
+        return cls(**known, extra=extra or None)
+
+
+# Marker put on the auto-import queue when the download queue completes: the
+# writer thread reports back once every song queued before it is written
+_DB_DRAINED = object()
+
+# Dict-style keys that map to QueueItem attributes (ordered for persistence)
+_QUEUE_ITEM_KEYS = tuple(key for key in QueueItem.__slots__ if key != 'extra')
+_QUEUE_ITEM_FIELDS = frozenset(_QUEUE_ITEM_KEYS)
+
 
 class DownloadQueue(QObject):
     """
@@ -35,13 +154,36 @@ class DownloadQueue(QObject):
         queue.pause(item_id)
         queue.resume(item_id)
         queue.cancel(item_id)
+
+    Threading:
+        _items and _workers are only touched from the thread that owns the
+        queue (the Qt main thread). DownloadWorker signals reach
+        update_progress/mark_completed/_mark_failed through queued
+        connections, so no locking is needed. The only other thread is the
+        auto-import writer, which works on its own queue.Queue and
+        never reads _items.
     """
 
+    # Max songs written per database transaction by the auto-import thread
+    DB_BATCH_SIZE = 256
+
+    # Journaled mutations before the journal is compacted into a full snapshot
+    JOURNAL_COMPACT_EVERY = 500
+
+    # item_progress throttling: emit at most every 100 ms per item unless
+    # progress jumped by PROGRESS_EMIT_STEP points (100% always emitted)
+    PROGRESS_EMIT_INTERVAL = 0.1
+    PROGRESS_EMIT_STEP = 5
+
     # Signals
+    item_progress = pyqtSignal(str, int)    # item_id, percentage
     item_completed = pyqtSignal(str, dict)  # item_id, metadata
     item_failed = pyqtSignal(str, str)      # item_id, error
     queue_completed = pyqtSignal()          # All items done
 
+    # Emitted by the auto-import thread when it reaches _DB_DRAINED
+    _db_drained = pyqtSignal()
+
     def __init__(self, max_concurrent=50, max_retries=3, db_manager=None, config_manager=None):
         """
         Initialize download queue
@@ -58,10 +200,38 @@ class DownloadQueue(QObject):
         self.max_retries = max_retries
         self.db_manager = db_manager
         self.config_manager = config_manager
-        self._items = {}  # item_id -> item_dict
+        self._items = {}  # item_id -> QueueItem
         self._workers = {}  # item_id -> DownloadWorker
+        self._last_progress_emit = {}  # item_id -> (percentage, monotonic time)
+        self._created_dirs = set()  # download dirs already mkdir'd
         self._running = False
 
+        # Fallback download directory (when no config_manager)
+        self._fallback_download_dir = Path.cwd() / "downloads"
+        if not config_manager:
+            logger.warning("No config_manager provided, using fallback downloads/ directory")
+
+        # Item IDs: one random prefix per queue instance + a monotonic counter
+        # (keeps IDs unique across restarts without a uuid4() per item)
+        self._id_prefix = uuid.uuid4().hex[:8]
+        self._id_counter = itertools.count()
+
+        # Auto-import: completed songs are batched into one transaction by a
+        # background writer thread (started on first use)
+        self._db_queue = queue.Queue()
+        self._db_thread = None
+
+        # queue_completed waits for pending imports without blocking the UI:
+        # the writer's _db_drained is delivered to the owning thread
+        self._completion_pending = False
+        self._db_drained.connect(self._on_db_drained, Qt.ConnectionType.QueuedConnection)
+
+        # Persistence: after save()/load(), each mutation is appended to
+        # <filepath>.journal and replayed on load (periodic compaction)
+        self._snapshot_path = None
+        self._journal_path = None
+        self._journal_ops = 0
+
         # Callback for completion (optional)
         self.on_complete = None
 
@@ -79,20 +249,13 @@ class DownloadQueue(QObject):
             str: Unique item ID
         """
         # Generate unique ID
-        item_id = str(uuid.uuid4())
+        item_id = f"{self._id_prefix}-{next(self._id_counter)}"
 
         # Create item
-        item = {
-            'id': item_id,
-            'video_url': video_url,
-            'metadata': metadata,
-            'status': 'pending',  # pending, downloading, paused, completed, canceled, failed
-            'progress': 0,
-            'error': None,
-            'retry_count': 0
-        }
+        item = QueueItem(id=item_id, video_url=video_url, metadata=metadata)
 
         self._items[item_id] = item
+        self._journal_write('add', item)
         logger.info(f"Added to queue: {metadata.get('title', video_url)} (id={item_id})")
 
         # Auto-start if already running
@@ -101,25 +264,25 @@ class DownloadQueue(QObject):
 
         return item_id
 
-    def get_all(self) -> List[dict]:
+    def get_all(self) -> List[QueueItem]:
         """
         Get all items in queue
 
         Returns:
-            list: List of item dicts
+            list: List of QueueItem
         """
         return list(self._items.values())
 
-    def get_all_items(self) -> Dict[str, dict]:
+    def get_all_items(self) -> Dict[str, QueueItem]:
         """
         Get all items in queue as dictionary
 
         Returns:
-            dict: Dictionary of item_id -> item_dict
+            dict: Dictionary of item_id -> QueueItem
         """
         return self._items.copy()
 
-    def get_item(self, item_id: str) -> Optional[dict]:
+    def get_item(self, item_id: str) -> Optional[QueueItem]:
         """
         Get specific item by ID
 
@@ -127,7 +290,7 @@ class DownloadQueue(QObject):
             item_id (str): Item ID
 
         Returns:
-            dict: Item dict or None if not found
+            QueueItem: Item or None if not found
         """
         return self._items.get(item_id)
 
@@ -146,6 +309,12 @@ class DownloadQueue(QObject):
         Stop processing queue (pauses all active downloads)
         """
         self._running = False
+        self.flush()
+
+        # Compact journal into snapshot on shutdown
+        if self._snapshot_path:
+            self.save(self._snapshot_path)
+
         logger.info("Queue stopped")
 
     def is_running(self) -> bool:
@@ -157,14 +326,14 @@ class DownloadQueue(QObject):
         """
         return self._running
 
-    def get_active_downloads(self) -> List[dict]:
+    def get_active_downloads(self) -> List[QueueItem]:
         """
         Get currently downloading items
 
         Returns:
             list: Items with status='downloading'
         """
-        return [item for item in self._items.values() if item['status'] == 'downloading']
+        return [item for item in self._items.values() if item.status == 'downloading']
 
     def pause(self, item_id: str) -> bool:
         """
@@ -188,7 +357,8 @@ class DownloadQueue(QObject):
             del self._workers[item_id]
 
         # Update status
-        item['status'] = 'paused'
+        item.status = 'paused'
+        self._journal_write('update', item)
         logger.info(f"Paused: {item_id}")
 
         return True
@@ -204,11 +374,12 @@ class DownloadQueue(QObject):
             bool: True if resumed successfully
         """
         item = self._items.get(item_id)
-        if not item or item['status'] != 'paused':
+        if not item or item.status != 'paused':
             return False
 
         # Reset to pending
-        item['status'] = 'pending'
+        item.status = 'pending'
+        self._journal_write('update', item)
         logger.info(f"Resumed: {item_id}")
 
         # Process if queue running
@@ -239,7 +410,8 @@ class DownloadQueue(QObject):
             del self._workers[item_id]
 
         # Update status
-        item['status'] = 'canceled'
+        item.status = 'canceled'
+        self._journal_write('update', item)
         logger.info(f"Canceled: {item_id}")
 
         # Process next
@@ -257,11 +429,12 @@ class DownloadQueue(QObject):
         """
         completed_ids = [
             item_id for item_id, item in self._items.items()
-            if item['status'] == 'completed'
+            if item.status == 'completed'
         ]
 
         for item_id in completed_ids:
             del self._items[item_id]
+            self._journal_write('remove', {'id': item_id})
 
         count = len(completed_ids)
         logger.info(f"Cleared {count} completed items")
@@ -276,8 +449,19 @@ class DownloadQueue(QObject):
             percentage (int): Progress 0-100
         """
         item = self._items.get(item_id)
-        if item:
-            item['progress'] = percentage
+        if not item:
+            return
+
+        item.progress = percentage
+
+        # Throttle signal emission (workers can report progress at kHz rates)
+        now = time.monotonic()
+        last = self._last_progress_emit.get(item_id)
+        if (last is None or percentage >= 100
+                or now - last[1] >= self.PROGRESS_EMIT_INTERVAL
+                or abs(percentage - last[0]) >= self.PROGRESS_EMIT_STEP):
+            self._last_progress_emit[item_id] = (percentage, now)
+            self.item_progress.emit(item_id, percentage)
 
     def mark_completed(self, item_id: str, metadata: dict):
         """
@@ -292,11 +476,12 @@ class DownloadQueue(QObject):
             return
 
         # Update status
-        item['status'] = 'completed'
-        item['progress'] = 100
-        item['metadata'].update(metadata)
+        item.status = 'completed'
+        item.progress = 100
+        item.metadata.update(metadata)
+        self._journal_write('update', item)
 
-        logger.info(f"Completed: {item['metadata'].get('title', item_id)}")
+        logger.info(f"Completed: {item.metadata.get('title', item_id)}")
 
         # Auto-import to database if available
         if self.db_manager and 'output_path' in metadata:
@@ -312,6 +497,7 @@ class DownloadQueue(QObject):
         # Cleanup worker
         if item_id in self._workers:
             del self._workers[item_id]
+        self._last_progress_emit.pop(item_id, None)
 
         # Process next
         if self._running:
@@ -331,8 +517,6 @@ class DownloadQueue(QObject):
         Returns:
             Path: Actual file path if found, None otherwise
         """
-        from pathlib import Path
-
         # Convert to Path object
         file_path = Path(reported_path)
 
@@ -376,10 +560,11 @@ class DownloadQueue(QObject):
             file_path (str): Path to downloaded MP3 file (relative or absolute)
             metadata (dict): Song metadata
         """
-        try:
-            from mutagen.mp3 import MP3
-            from mutagen.id3 import ID3
+        if not MUTAGEN_AVAILABLE:
+            logger.error(f"Cannot import - mutagen not installed: {file_path}")
+            return
 
+        try:
             # Find actual file (handles yt-dlp quirks)
             file_path_obj = self._find_downloaded_file(file_path)
             if not file_path_obj:
@@ -420,17 +605,76 @@ class DownloadQueue(QObject):
                 'bitrate': bitrate
             }
 
-            # Insert into database
-            song_id = self.db_manager.add_song(song_data)
-
-            if song_id:
-                logger.info(f"Imported to database (id={song_id}): {artist} - {title}")
-            else:
-                logger.warning(f"Song not imported (duplicate?): {artist} - {title}")
+            # Hand off to the background writer (batched insert)
+            self._ensure_db_thread()
+            self._db_queue.put(song_data)
+            logger.debug(f"Queued for database import: {artist} - {title}")
 
         except Exception as e:
             logger.error(f"Failed to import to database: {e}")
 
+    def _ensure_db_thread(self):
+        """
+        Start the background database writer thread if not already running
+        """
+        if self._db_thread is None or not self._db_thread.is_alive():
+            self._db_thread = threading.Thread(
+                target=self._db_writer_loop,
+                name="DownloadQueueDBWriter",
+                daemon=True
+            )
+            self._db_thread.start()
+
+    def _db_writer_loop(self):
+        """
+        Drain queued songs and insert them in batches (one COMMIT per batch)
+
+        A _DB_DRAINED marker ends the current batch; once that batch is
+        written, _db_drained is emitted.
+        """
+        while True:
+            batch = []
+            drained = False
+            entry = self._db_queue.get()
+
+            # Grab whatever else is already waiting (up to DB_BATCH_SIZE)
+            while True:
+                if entry is _DB_DRAINED:
+                    drained = True
+                    break
+                batch.append(entry)
+                if len(batch) >= self.DB_BATCH_SIZE:
+                    break
+                try:
+                    entry = self._db_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                if batch:
+                    inserted = self.db_manager.add_songs_batch(batch)
+                    logger.info(f"Imported {inserted}/{len(batch)} songs to database")
+            except Exception as e:
+                logger.error(f"Failed to import batch to database: {e}")
+            finally:
+                for _ in batch:
+                    self._db_queue.task_done()
+
+            if drained:
+                # Emit before task_done(): flush() returns with it posted
+                self._db_drained.emit()
+                self._db_queue.task_done()
+
+    def flush(self):
+        """
+        Block until all pending database imports have been written
+
+        Used on stop(); queue completion waits for imports asynchronously
+        (see _process_next).
+        """
+        if self._db_thread is not None and self._db_thread.is_alive():
+            self._db_queue.join()
+
     def _mark_failed(self, item_id: str, error: str):
         """
         Mark download as failed (with auto-retry if attempts remaining)
@@ -444,19 +688,21 @@ class DownloadQueue(QObject):
             return
 
         # Increment retry count
-        item['retry_count'] += 1
-        item['error'] = error
+        item.retry_count += 1
+        item.error = error
 
         # Check if should retry
-        if item['retry_count'] < self.max_retries:
+        if item.retry_count < self.max_retries:
             # Retry download
-            item['status'] = 'pending'
-            item['progress'] = 0
-            logger.warning(f"Retry {item['retry_count']}/{self.max_retries}: {item_id} - {error}")
+            item.status = 'pending'
+            item.progress = 0
+            self._journal_write('update', item)
+            logger.warning(f"Retry {item.retry_count}/{self.max_retries}: {item_id} - {error}")
 
             # Cleanup worker
             if item_id in self._workers:
                 del self._workers[item_id]
+            self._last_progress_emit.pop(item_id, None)
 
             # Process next (will retry this item)
             if self._running:
@@ -464,7 +710,8 @@ class DownloadQueue(QObject):
 
         else:
             # Max retries exhausted
-            item['status'] = 'failed'
+            item.status = 'failed'
+            self._journal_write('update', item)
             logger.error(f"Failed (max retries): {item_id} - {error}")
 
             # Emit signal
@@ -473,6 +720,7 @@ class DownloadQueue(QObject):
             # Cleanup worker
             if item_id in self._workers:
                 del self._workers[item_id]
+            self._last_progress_emit.pop(item_id, None)
 
             # Process next
             if self._running:
@@ -489,41 +737,69 @@ class DownloadQueue(QObject):
             return
 
         # Find next pending item
-        pending = [item for item in self._items.values() if item['status'] == 'pending']
+        pending = [item for item in self._items.values() if item.status == 'pending']
         if not pending:
             # Check if queue completed
-            if active_count == 0 and all(item['status'] in ['completed', 'canceled', 'failed'] for item in self._items.values()):
+            if active_count == 0 and self._all_done():
                 logger.info("Queue completed")
-                self.queue_completed.emit()
+                if self._db_thread is not None and self._db_thread.is_alive():
+                    # Emit queue_completed once queued imports are written
+                    if not self._completion_pending:
+                        self._completion_pending = True
+                        self._db_queue.put(_DB_DRAINED)
+                else:
+                    self.queue_completed.emit()
             return
 
         # Start next download
         item = pending[0]
         self._start_download(item)
 
-    def _start_download(self, item: dict):
+    def _all_done(self) -> bool:
+        """
+        Check if every item reached a final state
+
+        Returns:
+            bool: True if no item is pending, downloading or paused
+        """
+        return all(item.status in ['completed', 'canceled', 'failed'] for item in self._items.values())
+
+    def _on_db_drained(self):
+        """
+        Emit queue_completed after pending imports were written (runs on
+        the queue's thread via a queued connection)
+        """
+        self._completion_pending = False
+
+        # Items added while the imports were written reopen the queue
+        if self._all_done():
+            self.queue_completed.emit()
+
+    def _start_download(self, item: QueueItem):
         """
         Start downloading item
 
         Args:
-            item (dict): Item to download
+            item (QueueItem): Item to download
         """
-        item_id = item['id']
+        item_id = item.id
 
         # Get download directory from config (or use fallback)
         if self.config_manager:
             download_dir = Path(self.config_manager.get_download_directory())
         else:
             # Fallback to downloads/ in current directory
-            download_dir = Path.cwd() / "downloads"
-            logger.warning("No config_manager provided, using fallback downloads/ directory")
+            download_dir = self._fallback_download_dir
 
-        # Create output path
-        output_path = download_dir / f"{item['metadata'].get('title', item_id)}.mp3"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create output path (sanitized title keeps the file inside download_dir)
+        safe_title = sanitize_filename(item.metadata.get('title') or item_id)
+        output_path = download_dir / f"{safe_title}.mp3"
+        if download_dir not in self._created_dirs:
+            download_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(download_dir)
 
         # Create worker
-        worker = DownloadWorker(item['video_url'], str(output_path))
+        worker = DownloadWorker(item.video_url, str(output_path))
 
         # Connect signals (use default argument to capture item_id by value, not reference)
         worker.progress.connect(lambda p, id=item_id: self.update_progress(id, p))
@@ -534,47 +810,150 @@ class DownloadQueue(QObject):
         self._workers[item_id] = worker
 
         # Update status
-        item['status'] = 'downloading'
+        item.status = 'downloading'
 
         # Start download
         worker.start()
-        logger.info(f"Started download: {item['metadata'].get('title', item_id)}")
+        logger.info(f"Started download: {item.metadata.get('title', item_id)}")
 
     def save(self, filepath: str):
         """
         Save queue to JSON file (persistence)
 
+        Writes a full snapshot atomically (temp file + rename) and truncates
+        the journal. Subsequent mutations are appended to <filepath>.journal.
+        Active downloads are saved as 'pending' (resumed on load, as journal
+        replay does), so periodic compaction never drops them.
+
         Args:
             filepath (str): Path to JSON file
         """
-        # Only save items that are not actively downloading
-        saveable_items = [
-            item for item in self._items.values()
-            if item['status'] != 'downloading'
-        ]
+        saveable_items = []
+        for item in self._items.values():
+            item_data = item.to_dict()
+            if item.status == 'downloading':
+                item_data['status'] = 'pending'
+            saveable_items.append(item_data)
 
         data = {
             'max_concurrent': self.max_concurrent,
             'items': saveable_items
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        tmp_path = f"{filepath}.tmp"
+        if ORJSON_AVAILABLE:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+        os.replace(tmp_path, filepath)
+
+        # Snapshot is now authoritative - start a fresh journal
+        self._attach_journal(filepath)
+        open(self._journal_path, 'wb').close()
+        self._journal_ops = 0
 
         logger.info(f"Queue saved to {filepath} ({len(saveable_items)} items)")
 
     def load(self, filepath: str):
         """
-        Load queue from JSON file
+        Load queue from JSON file (and replay its journal, if any)
 
         Args:
             filepath (str): Path to JSON file
         """
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filepath, 'r') as f:
+                data = json.load(f)
 
         # Restore items
-        for item in data.get('items', []):
-            self._items[item['id']] = item
+        for item_data in data.get('items', []):
+            item = QueueItem.from_dict(item_data)
+            self._items[item.id] = item
+
+        # Replay mutations recorded since the snapshot
+        self._attach_journal(filepath)
+        replayed = self._replay_journal()
+
+        logger.info(f"Queue loaded from {filepath} ({len(self._items)} items, {replayed} journal entries)")
+
+    def _attach_journal(self, filepath: str):
+        """
+        Enable journaling next to the snapshot file
 
-        logger.info(f"Queue loaded from {filepath} ({len(self._items)} items)")
+        Args:
+            filepath (str): Path to JSON snapshot file
+        """
+        self._snapshot_path = filepath
+        self._journal_path = f"{filepath}.journal"
+
+    def _journal_write(self, op: str, item: dict):
+        """
+        Append one mutation to the journal (no-op until save/load is called)
+
+        Args:
+            op (str): 'add', 'update' (full item upsert) or 'remove'
+            item (dict): Item dict (only 'id' is needed for 'remove')
+        """
+        if not self._journal_path:
+            return
+
+        entry = {'op': op, 'item': item.to_dict() if isinstance(item, QueueItem) else item}
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(entry) + b"\n"
+        else:
+            line = json.dumps(entry).encode('utf-8') + b"\n"
+
+        try:
+            with open(self._journal_path, 'ab') as f:
+                f.write(line)
+        except OSError as e:
+            logger.error(f"Failed to write queue journal: {e}")
+            return
+
+        # Periodic compaction keeps replay time bounded
+        self._journal_ops += 1
+        if self._journal_ops >= self.JOURNAL_COMPACT_EVERY:
+            self.save(self._snapshot_path)
+
+    def _replay_journal(self) -> int:
+        """
+        Apply journal entries on top of the loaded snapshot
+
+        Returns:
+            int: Number of entries applied
+        """
+        if not self._journal_path or not os.path.exists(self._journal_path):
+            return 0
+
+        applied = 0
+        with open(self._journal_path, 'rb') as f:
+            for line in f:
+                try:
+                    entry = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+                except ValueError:
+                    # Torn write from a crash - ignore the partial line
+                    logger.warning("Skipping corrupt queue journal entry")
+                    continue
+
+                item = entry.get('item') or {}
+                item_id = item.get('id')
+                if not item_id:
+                    continue
+
+                if entry.get('op') == 'remove':
+                    self._items.pop(item_id, None)
+                else:
+                    item = QueueItem.from_dict(item)
+                    # Interrupted downloads resume as pending
+                    if item.status == 'downloading':
+                        item.status = 'pending'
+                    self._items[item_id] = item
+                applied += 1
+
+        self._journal_ops = applied
+        return applied
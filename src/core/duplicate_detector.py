@@ -3,22 +3,232 @@ Duplicate Detector - Phase 5.1
 
 Detect duplicate songs using multiple methods:
 - Method 1: Metadata comparison (fuzzy string matching)
-- Method 2: Audio fingerprinting (acoustid/chromaprint)
+- Method 2: Audio fingerprinting (chromaprint/fpcalc)
 - Method 3: File size comparison (quick pre-filter)
 
 Created: November 13, 2025
 Updated: November 19, 2025 (Fixed fpcalc path passing)
 """
+import base64
+import json
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from difflib import SequenceMatcher
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import os
+import subprocess
+
+import numpy as np
 
 from utils.fpcalc_checker import FpcalcChecker
 
 logger = logging.getLogger(__name__)
 
+# Try to import rapidfuzz (C++ fuzzy matching, falls back to difflib)
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    logger.warning("rapidfuzz not available - using slower difflib matching")
+
+
+# Rows per rapidfuzz.process.cdist call (bounds the N x N matrix memory)
+CDIST_CHUNK_SIZE = 1024
+
+# Max memoized (title, artist) pair scores (Python loop path), per scan and
+# in the FIFO cache kept across rescans
+SIMILARITY_CACHE_SIZE = 1_000_000
+
+# Concurrent fpcalc subprocesses during fingerprint detection
+FINGERPRINT_WORKERS = os.cpu_count() or 4
+# Seconds of audio fingerprinted (same as acoustid's default, keeps cached
+# fingerprints comparable) and per-file fpcalc timeout
+FINGERPRINT_MAX_LENGTH = 120
+FPCALC_TIMEOUT = 60
+
+# Concurrent stat() calls during file size detection (I/O bound, releases the GIL)
+STAT_WORKERS = 32
+# Directories with at least this many library songs are listed once with
+# os.scandir instead of stat-ing each file - only where DirEntry.stat() is
+# served from the directory listing (Windows); elsewhere it is a stat() anyway
+SCANDIR_MIN_FILES = 16
+_SCANDIR_CACHES_STAT = os.name == 'nt'
+
+# Fingerprint matching: bit error rate below this means same recording
+FINGERPRINT_MAX_BER = 0.35
+# Alignment search window in sub-fingerprints (~0.124 s each, so ~3 s)
+FINGERPRINT_MAX_OFFSET = 24
+# Minimum overlapping sub-fingerprints for a meaningful BER
+FINGERPRINT_MIN_OVERLAP = 16
+# Only fingerprints of songs within this duration (seconds) are compared
+FINGERPRINT_DURATION_TOLERANCE = 3
+
+_NORMAL_BIT_WEIGHTS = np.array([1, 2, 4])
+_EXCEPTION_BIT_WEIGHTS = np.array([1, 2, 4, 8, 16])
+
+
+def _string_ratio(a: str, b: str) -> float:
+    """
+    Similarity ratio between two strings (0.0 - 1.0)
+
+    rapidfuzz's fuzz.ratio is the same normalized Indel similarity as
+    difflib.SequenceMatcher.ratio(), computed in C++.
+    """
+    # Exact match (re-rips, same tags) needs no fuzzy matching
+    if a == b:
+        return 1.0
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _duration_similarity(duration1: int, duration2: int) -> float:
+    """Duration score: 1.0 within ±3 s, 0.5 within ±10 s, else 0.0"""
+    duration_diff = abs(duration1 - duration2)
+
+    if duration_diff <= 3:
+        return 1.0
+    elif duration_diff <= 10:
+        return 0.5
+    return 0.0
+
+
+def _decode_fingerprint(fingerprint: str) -> Optional[np.ndarray]:
+    """
+    Decode a compressed Chromaprint fingerprint into raw sub-fingerprints
+
+    Numpy port of chromaprint's fingerprint decompressor, so no
+    libchromaprint is needed. Format (after URL-safe base64): 1 byte
+    algorithm, 3 bytes count, then per sub-fingerprint the gaps between
+    set bits of (value XOR previous value) as 3-bit codes ending in 0,
+    with gaps >= 7 continued in a trailing 5-bit section.
+
+    Args:
+        fingerprint: Compressed fingerprint string (fpcalc output)
+
+    Returns:
+        uint32 array of sub-fingerprints, or None if malformed
+    """
+    try:
+        data = base64.urlsafe_b64decode(fingerprint + '=' * (-len(fingerprint) % 4))
+    except (ValueError, TypeError):
+        return None
+
+    if len(data) < 4:
+        return None
+
+    size = int.from_bytes(data[1:4], 'big')
+    if size == 0:
+        return np.zeros(0, dtype=np.uint32)
+
+    bits = np.unpackbits(np.frombuffer(data[4:], dtype=np.uint8), bitorder='little')
+    values = bits[:len(bits) // 3 * 3].reshape(-1, 3) @ _NORMAL_BIT_WEIGHTS
+
+    # Each sub-fingerprint ends with a 0 code
+    ends = np.flatnonzero(values == 0)
+    if len(ends) < size:
+        return None
+    count = int(ends[size - 1]) + 1
+    values = values[:count]
+
+    exceptions = np.flatnonzero(values == 7)
+    if len(exceptions):
+        offset = 4 + (count * 3 + 7) // 8
+        bits = np.unpackbits(np.frombuffer(data[offset:], dtype=np.uint8), bitorder='little')
+        extra = bits[:len(bits) // 5 * 5].reshape(-1, 5) @ _EXCEPTION_BIT_WEIGHTS
+        if len(extra) < len(exceptions):
+            return None
+        values[exceptions] += extra[:len(exceptions)]
+
+    # Bit positions are running sums of gaps, restarting after each 0
+    ends = ends[:size]
+    segment = np.concatenate(([0], np.cumsum(values == 0)[:-1]))
+    totals = np.cumsum(values)
+    positions = totals - np.concatenate(([0], totals[ends[:-1]]))[segment]
+
+    is_bit = values != 0
+    if is_bit.any() and positions[is_bit].max() > 32:
+        return None
+
+    xored = np.zeros(size, dtype=np.uint32)
+    np.bitwise_or.at(
+        xored, segment[is_bit],
+        np.left_shift(np.uint32(1), (positions[is_bit] - 1).astype(np.uint32))
+    )
+    return np.bitwise_xor.accumulate(xored)
+
+
+def _popcount(values: np.ndarray) -> int:
+    """Total number of set bits in a uint32 array"""
+    if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+        return int(np.bitwise_count(values).sum())
+    return int(np.unpackbits(values.view(np.uint8)).sum())
+
+
+def _fingerprint_ber(fp1: np.ndarray, fp2: np.ndarray,
+                     max_offset: int = FINGERPRINT_MAX_OFFSET) -> float:
+    """
+    Lowest bit error rate between two raw fingerprints over alignments
+
+    Args:
+        fp1, fp2: Raw uint32 sub-fingerprints
+        max_offset: Largest shift (in sub-fingerprints) tried either way
+
+    Returns:
+        Best BER (0.0 identical, ~0.5 unrelated audio); 1.0 if no
+        alignment overlaps enough to compare
+    """
+    best = 1.0
+    for offset in range(-max_offset, max_offset + 1):
+        a = fp1[offset:] if offset > 0 else fp1
+        b = fp2[-offset:] if offset < 0 else fp2
+        overlap = min(len(a), len(b))
+        if overlap < FINGERPRINT_MIN_OVERLAP:
+            continue
+        errors = _popcount(a[:overlap] ^ b[:overlap])
+        best = min(best, errors / (32 * overlap))
+    return best
+
+
+def _scandir_sizes(directory: str) -> Dict[str, int]:
+    """
+    Sizes of all files in a directory from one directory listing
+
+    Returns:
+        Dict of normcase'd file name -> size in bytes (empty if unreadable)
+    """
+    sizes = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        sizes[os.path.normcase(entry.name)] = entry.stat().st_size
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.warning(f"Failed to list directory {directory}: {e}")
+    return sizes
+
+
+def _file_size(file_path: str) -> Optional[int]:
+    """
+    File size in bytes from a single stat() call
+
+    Returns:
+        Size in bytes, or None if the file is missing or unreadable
+    """
+    try:
+        return os.stat(file_path).st_size
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to get file size for {file_path}: {e}")
+        return None
+
 
 class DuplicateDetector:
     """
@@ -50,6 +260,10 @@ class DuplicateDetector:
         self.db = db_manager
         self.similarity_threshold = similarity_threshold
 
+        # (title1, artist1, title2, artist2) -> title/artist score, FIFO-bounded.
+        # Kept across scans so a rescan after small library changes reuses prior work
+        self._similarity_cache = OrderedDict()
+
         # Initialize fpcalc checker for audio fingerprinting
         self.fpcalc_checker = FpcalcChecker()
         if self.fpcalc_checker.is_available():
@@ -84,7 +298,7 @@ class DuplicateDetector:
         """
         Detect duplicates by comparing metadata (title, artist, duration)
 
-        Uses fuzzy string matching for title/artist comparison.
+        Uses fuzzy string matching (rapidfuzz, difflib fallback) for title/artist comparison.
         Duration tolerance: ±3 seconds
 
         Returns:
@@ -100,39 +314,22 @@ class DuplicateDetector:
             logger.info("Single song - no duplicates")
             return []
 
-        duplicate_groups = []
-        processed = set()
-
-        # Compare each song with every other song
-        for i, song1 in enumerate(songs):
-            if song1['id'] in processed:
-                continue
-
-            duplicates = [song1]
-
-            for j, song2 in enumerate(songs[i + 1:], start=i + 1):
-                if song2['id'] in processed:
-                    continue
-
-                # Calculate similarity
-                similarity = self._calculate_metadata_similarity(song1, song2)
-
-                if similarity >= self.similarity_threshold:
-                    duplicates.append(song2)
-                    processed.add(song2['id'])
-
-            # If found duplicates (more than original song)
-            if len(duplicates) > 1:
-                processed.add(song1['id'])
+        # Find all song pairs above threshold: (i, j, similarity) with i < j
+        if RAPIDFUZZ_AVAILABLE:
+            pairs = self._find_similar_pairs_cdist(songs)
+        else:
+            pairs = self._find_similar_pairs_loop(songs)
 
-                # Sort by quality (bitrate)
-                sorted_duplicates = self._sort_by_quality(duplicates)
+        duplicate_groups = []
+        for members, confidence in self._group_pairs(pairs):
+            # Sort by quality (bitrate)
+            sorted_duplicates = self._sort_by_quality([songs[i] for i in members])
 
-                duplicate_groups.append({
-                    'songs': sorted_duplicates,
-                    'confidence': similarity,
-                    'method': 'metadata'
-                })
+            duplicate_groups.append({
+                'songs': sorted_duplicates,
+                'confidence': confidence,
+                'method': 'metadata'
+            })
 
         logger.info(f"Metadata detection: Found {len(duplicate_groups)} duplicate groups")
         return duplicate_groups
@@ -141,7 +338,7 @@ class DuplicateDetector:
         """
         Detect duplicates using audio fingerprinting
 
-        Uses acoustid/chromaprint for audio signature comparison.
+        Uses chromaprint (fpcalc) for audio signature comparison.
         High accuracy (99%) but slower than metadata.
 
         Returns:
@@ -152,34 +349,48 @@ class DuplicateDetector:
         if len(songs) == 0:
             return []
 
-        # Generate fingerprints for all songs
+        # Reuse cached fingerprints, collect the songs that need fpcalc
         fingerprints = {}
+        to_generate = []
         for song in songs:
-            try:
-                fp = self._generate_fingerprint(song['file_path'])
-                if fp:
-                    fingerprints[song['id']] = fp
-            except Exception as e:
-                logger.warning(f"Failed to generate fingerprint for {song['file_path']}: {e}")
-                continue
-
-        # Group songs by fingerprint
-        fp_groups = defaultdict(list)
-        for song in songs:
-            if song['id'] in fingerprints:
-                fp = fingerprints[song['id']]
-                fp_groups[fp].append(song)
+            fp, stat = self._get_cached_fingerprint(song)
+            if fp:
+                fingerprints[song['id']] = fp
+            else:
+                to_generate.append((song, stat))
+
+        # fpcalc runs as a subprocess, so threads fingerprint files in parallel.
+        # Results are cached from this thread (DB connections are per-thread)
+        if to_generate:
+            with ThreadPoolExecutor(max_workers=FINGERPRINT_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._generate_fingerprint, song['file_path']): (song, stat)
+                    for song, stat in to_generate
+                }
+                for future in as_completed(futures):
+                    song, stat = futures[future]
+                    try:
+                        fp = future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to generate fingerprint for {song['file_path']}: {e}")
+                        continue
+
+                    if fp:
+                        fingerprints[song['id']] = fp
+                        if stat is not None:
+                            self.db.update_fingerprint(song['id'], fp, stat.st_mtime, stat.st_size)
+
+        # Match fingerprints (exact or low bit error rate) and group songs
+        pairs = self._find_fingerprint_pairs(songs, fingerprints)
 
-        # Build duplicate groups
         duplicate_groups = []
-        for fp, songs_list in fp_groups.items():
-            if len(songs_list) > 1:
-                sorted_songs = self._sort_by_quality(songs_list)
-                duplicate_groups.append({
-                    'songs': sorted_songs,
-                    'confidence': 0.99,  # Fingerprint is highly accurate
-                    'method': 'fingerprint'
-                })
+        for members, _ in self._group_pairs(pairs):
+            sorted_songs = self._sort_by_quality([songs[i] for i in members])
+            duplicate_groups.append({
+                'songs': sorted_songs,
+                'confidence': 0.99,  # Fingerprint is highly accurate
+                'method': 'fingerprint'
+            })
 
         logger.info(f"Fingerprint detection: Found {len(duplicate_groups)} duplicate groups")
         return duplicate_groups
@@ -199,18 +410,42 @@ class DuplicateDetector:
         if len(songs) == 0:
             return []
 
+        paths = [song['file_path'] for song in songs]
+        sizes = [None] * len(songs)
+
+        # Big directories: one listing; everything else: one stat per file
+        stat_indices = list(range(len(songs)))
+        listed_dirs = {}
+        if _SCANDIR_CACHES_STAT:
+            by_dir = defaultdict(list)
+            for index, path in enumerate(paths):
+                if path:
+                    by_dir[os.path.dirname(path)].append(index)
+            listed_dirs = {d: idx for d, idx in by_dir.items() if len(idx) >= SCANDIR_MIN_FILES}
+            if listed_dirs:
+                listed = {index for idx in listed_dirs.values() for index in idx}
+                stat_indices = [index for index in stat_indices if index not in listed]
+
+        # Run listings and stats concurrently (overlaps disk/network latency)
+        with ThreadPoolExecutor(max_workers=min(STAT_WORKERS, len(paths))) as executor:
+            listing_results = executor.map(_scandir_sizes, listed_dirs)
+            stat_results = executor.map(_file_size, [paths[index] for index in stat_indices])
+
+            listings = dict(zip(listed_dirs, listing_results))
+            for index, size in zip(stat_indices, stat_results):
+                sizes[index] = size
+
+        for directory, indices in listed_dirs.items():
+            listing = listings[directory]
+            for index in indices:
+                sizes[index] = listing.get(os.path.normcase(os.path.basename(paths[index])))
+
         # Group songs by file size
         size_groups = defaultdict(list)
 
-        for song in songs:
-            try:
-                file_path = song['file_path']
-                if os.path.exists(file_path):
-                    size = os.path.getsize(file_path)
-                    size_groups[size].append(song)
-            except Exception as e:
-                logger.warning(f"Failed to get file size for {song['file_path']}: {e}")
-                continue
+        for song, size in zip(songs, sizes):
+            if size is not None:
+                size_groups[size].append(song)
 
         # Build duplicate groups
         duplicate_groups = []
@@ -226,6 +461,300 @@ class DuplicateDetector:
         logger.info(f"File size detection: Found {len(duplicate_groups)} duplicate groups")
         return duplicate_groups
 
+    def _group_pairs(self, pairs: List[Tuple[int, int, float]]) -> List[Tuple[List[int], float]]:
+        """
+        Group matched pairs into connected components (Union-Find)
+
+        Matches are transitive: if A~B and B~C, all three form one group.
+        Group confidence is the mean similarity of the group's matched pairs.
+
+        Args:
+            pairs: (i, j, similarity) with i < j
+
+        Returns:
+            List of (sorted song indices, confidence) for groups of 2+ songs,
+            ordered by first song index
+        """
+        parent = {}
+
+        def find(x: int) -> int:
+            root = x
+            while parent.get(root, root) != root:
+                root = parent[root]
+            # Path compression
+            while x != root:
+                parent[x], x = root, parent[x]
+            return root
+
+        for i, j, _ in pairs:
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                # Lowest index becomes root (deterministic group order)
+                if root_i < root_j:
+                    parent[root_j] = root_i
+                else:
+                    parent[root_i] = root_j
+
+        members = defaultdict(list)
+        for index in {i for i, _, _ in pairs} | {j for _, j, _ in pairs}:
+            members[find(index)].append(index)
+
+        similarity_sum = defaultdict(float)
+        edge_count = defaultdict(int)
+        for i, _, similarity in pairs:
+            root = find(i)
+            similarity_sum[root] += similarity
+            edge_count[root] += 1
+
+        return [
+            (sorted(members[root]), similarity_sum[root] / edge_count[root])
+            for root in sorted(members)
+        ]
+
+    def _find_fingerprint_pairs(self, songs: List[Dict],
+                                fingerprints: Dict) -> List[Tuple[int, int, float]]:
+        """
+        Find song pairs whose audio fingerprints match
+
+        Identical fingerprint strings always match. Otherwise the decoded
+        fingerprints of songs within FINGERPRINT_DURATION_TOLERANCE seconds
+        are compared by bit error rate, so re-encodes that differ in a few
+        bits still match.
+
+        Args:
+            songs: Songs to compare
+            fingerprints: Song ID -> compressed fingerprint string
+
+        Returns:
+            List of (i, j, 1 - BER) with i < j, sorted
+        """
+        indices = [i for i, song in enumerate(songs) if song['id'] in fingerprints]
+        fps = {i: fingerprints[songs[i]['id']] for i in indices}
+
+        pairs = {}
+
+        # Exact matches, regardless of duration
+        by_fingerprint = defaultdict(list)
+        for i in indices:
+            by_fingerprint[fps[i]].append(i)
+        for members in by_fingerprint.values():
+            for a, i in enumerate(members):
+                for j in members[a + 1:]:
+                    pairs[(i, j)] = 1.0
+
+        # Near matches, only between songs of similar duration
+        decoded = {}
+        for fp, members in by_fingerprint.items():
+            raw = _decode_fingerprint(fp)
+            if raw is not None:
+                for i in members:
+                    decoded[i] = raw
+
+        order = sorted(decoded, key=lambda i: songs[i].get('duration') or 0)
+        for a, i in enumerate(order):
+            duration_i = songs[i].get('duration') or 0
+            for j in order[a + 1:]:
+                if (songs[j].get('duration') or 0) - duration_i > FINGERPRINT_DURATION_TOLERANCE:
+                    break
+                key = (i, j) if i < j else (j, i)
+                if key in pairs:
+                    continue
+                ber = _fingerprint_ber(decoded[key[0]], decoded[key[1]])
+                if ber < FINGERPRINT_MAX_BER:
+                    pairs[key] = 1.0 - ber
+
+        return sorted((i, j, similarity) for (i, j), similarity in pairs.items())
+
+    def _find_similar_pairs_loop(self, songs: List[Dict]) -> List[Tuple[int, int, float]]:
+        """
+        Find similar song pairs by comparing pairs in Python
+
+        Fallback when rapidfuzz is not installed. Songs are visited in order of
+        title length: a title ratio can never exceed 2*min(len)/(len1+len2), so
+        once the partner title is too long for the pair to reach the threshold
+        (with artist and duration scoring perfectly) the rest are skipped.
+
+        Args:
+            songs: Song dictionaries
+
+        Returns:
+            List of (i, j, similarity) with i < j and similarity >= threshold
+        """
+        threshold = self.similarity_threshold
+
+        # Normalize once per song instead of once per pair
+        titles = [(song.get('title') or '').lower() for song in songs]
+        artists = [(song.get('artist') or '').lower() for song in songs]
+        durations = [song.get('duration') or 0 for song in songs]
+
+        # Intern (title, artist) so re-uploads/compilations share one key
+        interned = {}
+        keys = [interned.setdefault(fields, len(interned)) for fields in zip(titles, artists)]
+        fields_by_key = list(interned)
+
+        similarity_cache = self._similarity_cache
+
+        # Memoized title/artist part of _weighted_similarity (scoped to this scan),
+        # backed by the cross-scan cache
+        @lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
+        def text_similarity(key1: int, key2: int) -> float:
+            fields = fields_by_key[key1] + fields_by_key[key2]
+            score = similarity_cache.get(fields)
+            if score is None:
+                title1, artist1, title2, artist2 = fields
+                score = (_string_ratio(title1, title2) * 0.5) + (_string_ratio(artist1, artist2) * 0.3)
+                similarity_cache[fields] = score
+                if len(similarity_cache) > SIMILARITY_CACHE_SIZE:
+                    similarity_cache.popitem(last=False)
+            return score
+
+        # Title ratio needed for the pair to still reach the threshold
+        # (small epsilon so float rounding never drops a boundary pair)
+        min_title_ratio = (threshold - 0.5) / 0.5 - 1e-9
+
+        max_gap = self._max_duration_gap()
+
+        order = sorted(range(len(songs)), key=lambda index: len(titles[index]))
+
+        pairs = []
+        for position, i in enumerate(order):
+            len_i = len(titles[i])
+
+            for j in order[position + 1:]:
+                len_j = len(titles[j])
+                if len_i + len_j and 2 * len_i / (len_i + len_j) < min_title_ratio:
+                    break  # Every remaining title is at least this long
+
+                # Durations too far apart can never reach the threshold
+                if max_gap is not None and abs(durations[i] - durations[j]) > max_gap:
+                    continue
+
+                # Keep library order (difflib's ratio is not symmetric)
+                a, b = (i, j) if i < j else (j, i)
+                similarity = text_similarity(keys[a], keys[b]) + (
+                    _duration_similarity(durations[a], durations[b]) * 0.2
+                )
+                if similarity >= threshold:
+                    pairs.append((a, b, similarity))
+
+        text_similarity.cache_clear()
+
+        pairs.sort()
+        return pairs
+
+    def _find_similar_pairs_cdist(self, songs: List[Dict]) -> List[Tuple[int, int, float]]:
+        """
+        Find similar song pairs with rapidfuzz.process.cdist
+
+        Computes title/artist similarity matrices in native code (multi-threaded,
+        row chunks of CDIST_CHUNK_SIZE) and the duration score with numpy, using
+        the same weights as _calculate_metadata_similarity.
+
+        Args:
+            songs: Song dictionaries
+
+        Returns:
+            List of (i, j, similarity) with i < j and similarity >= threshold
+        """
+        threshold = self.similarity_threshold
+        titles = [(song.get('title') or '').lower() for song in songs]
+        artists = [(song.get('artist') or '').lower() for song in songs]
+        durations = np.array([song.get('duration') or 0 for song in songs], dtype=np.float64)
+
+        # Minimum score each component needs for the pair to still reach the
+        # threshold (everything else maxed) - lets rapidfuzz exit early
+        title_cutoff = max(0.0, (threshold - 0.5) / 0.5 * 100 - 1e-6)
+        artist_cutoff = max(0.0, (threshold - 0.7) / 0.3 * 100 - 1e-6)
+
+        # Score each distinct string once (exact duplicates share a column)
+        unique_titles, title_index = self._dedupe_strings(titles)
+        unique_artists, artist_index = self._dedupe_strings(artists)
+
+        # Visit songs by duration so each row chunk only scores the songs
+        # whose duration can still reach the threshold
+        max_gap = self._max_duration_gap()
+        if max_gap is None:
+            order = np.arange(len(songs))
+        else:
+            order = np.argsort(durations, kind='stable')
+        sorted_durations = durations[order]
+
+        pairs = []
+        for start in range(0, len(songs), CDIST_CHUNK_SIZE):
+            stop = min(start + CDIST_CHUNK_SIZE, len(songs))
+            rows = order[start:stop]
+
+            if max_gap is None:
+                cols = order
+            else:
+                lo = np.searchsorted(sorted_durations, sorted_durations[start] - max_gap, side='left')
+                hi = np.searchsorted(sorted_durations, sorted_durations[stop - 1] + max_gap, side='right')
+                cols = order[lo:hi]
+
+            col_titles, col_title_index = np.unique(title_index[cols], return_inverse=True)
+            col_artists, col_artist_index = np.unique(artist_index[cols], return_inverse=True)
+
+            title_sim = process.cdist(
+                [titles[i] for i in rows.tolist()], [unique_titles[k] for k in col_titles.tolist()],
+                scorer=fuzz.ratio, dtype=np.float64, workers=-1, score_cutoff=title_cutoff
+            )[:, col_title_index] / 100.0
+            artist_sim = process.cdist(
+                [artists[i] for i in rows.tolist()], [unique_artists[k] for k in col_artists.tolist()],
+                scorer=fuzz.ratio, dtype=np.float64, workers=-1, score_cutoff=artist_cutoff
+            )[:, col_artist_index] / 100.0
+
+            duration_diff = np.abs(durations[rows, None] - durations[None, cols])
+            duration_sim = np.where(duration_diff <= 3, 1.0, np.where(duration_diff <= 10, 0.5, 0.0))
+
+            similarity = (title_sim * 0.5) + (artist_sim * 0.3) + (duration_sim * 0.2)
+
+            # Each unordered pair once (i < j in library order)
+            row_pos, col_pos = np.nonzero(similarity >= threshold)
+            first, second = rows[row_pos], cols[col_pos]
+            upper = first < second
+            for r, c, i, j in zip(row_pos[upper].tolist(), col_pos[upper].tolist(),
+                                  first[upper].tolist(), second[upper].tolist()):
+                pairs.append((i, j, float(similarity[r, c])))
+
+        pairs.sort()
+        return pairs
+
+    def _max_duration_gap(self) -> Optional[int]:
+        """
+        Largest duration difference (seconds) that can still reach the threshold
+
+        Title and artist contribute at most 0.8, so pairs more than 10 s apart
+        (duration score 0.0) need a threshold <= 0.8, and pairs more than 3 s
+        apart (score 0.5) need a threshold <= 0.9.
+
+        Returns:
+            3, 10, or None if duration cannot rule out any pair
+        """
+        threshold = self.similarity_threshold - 1e-9
+        if threshold > 0.9:
+            return 3
+        if threshold > 0.8:
+            return 10
+        return None
+
+    @staticmethod
+    def _dedupe_strings(values: List[str]) -> Tuple[List[str], np.ndarray]:
+        """
+        Distinct strings (first-seen order) plus each value's index into them
+
+        Args:
+            values: Strings to deduplicate
+
+        Returns:
+            (unique values, index array) with unique[index[k]] == values[k]
+        """
+        positions = {}
+        index = np.fromiter(
+            (positions.setdefault(value, len(positions)) for value in values),
+            dtype=np.intp, count=len(values)
+        )
+        return list(positions), index
+
     def _calculate_metadata_similarity(self, song1: Dict, song2: Dict) -> float:
         """
         Calculate similarity score between two songs based on metadata
@@ -233,36 +762,70 @@ class DuplicateDetector:
         Args:
             song1, song2: Song dictionaries
 
+        Returns:
+            Similarity score (0.0 - 1.0)
+        """
+        return self._weighted_similarity(
+            (song1.get('title') or '').lower(),
+            (song2.get('title') or '').lower(),
+            (song1.get('artist') or '').lower(),
+            (song2.get('artist') or '').lower(),
+            song1.get('duration') or 0,
+            song2.get('duration') or 0
+        )
+
+    def _weighted_similarity(self, title1: str, title2: str, artist1: str, artist2: str,
+                             duration1: int, duration2: int) -> float:
+        """
+        Weighted similarity of already-normalized (lowercased) fields
+
+        Args:
+            title1, title2: Lowercased titles
+            artist1, artist2: Lowercased artists
+            duration1, duration2: Durations in seconds
+
         Returns:
             Similarity score (0.0 - 1.0)
         """
         # Title similarity (50% weight)
-        title1 = song1.get('title', '').lower()
-        title2 = song2.get('title', '').lower()
-        title_sim = SequenceMatcher(None, title1, title2).ratio()
+        title_sim = _string_ratio(title1, title2)
 
         # Artist similarity (30% weight)
-        artist1 = song1.get('artist', '').lower()
-        artist2 = song2.get('artist', '').lower()
-        artist_sim = SequenceMatcher(None, artist1, artist2).ratio()
+        artist_sim = _string_ratio(artist1, artist2)
 
         # Duration similarity (20% weight) - ±3 seconds tolerance
-        duration1 = song1.get('duration', 0)
-        duration2 = song2.get('duration', 0)
-        duration_diff = abs(duration1 - duration2)
-
-        if duration_diff <= 3:
-            duration_sim = 1.0
-        elif duration_diff <= 10:
-            duration_sim = 0.5
-        else:
-            duration_sim = 0.0
+        duration_sim = _duration_similarity(duration1, duration2)
 
         # Weighted average
         similarity = (title_sim * 0.5) + (artist_sim * 0.3) + (duration_sim * 0.2)
 
         return similarity
 
+    def _get_cached_fingerprint(self, song: Dict) -> Tuple[Optional[str], Optional[os.stat_result]]:
+        """
+        Get the cached fingerprint for a song if it is still valid
+
+        The cached fingerprint is valid while the file's mtime and size
+        match the values it was computed for.
+
+        Args:
+            song: Song dictionary (from get_all_songs)
+
+        Returns:
+            (cached fingerprint or None, file stat or None if missing)
+        """
+        try:
+            stat = os.stat(song['file_path'])
+        except OSError:
+            return None, None
+
+        if (song.get('fingerprint')
+                and song.get('fingerprint_mtime') == stat.st_mtime
+                and song.get('fingerprint_size') == stat.st_size):
+            return song['fingerprint'], stat
+
+        return None, stat
+
     def _generate_fingerprint(self, file_path: str) -> Optional[str]:
         """
         Generate audio fingerprint for a file
@@ -273,7 +836,8 @@ class DuplicateDetector:
         Returns:
             Fingerprint string or None if failed
 
-        Note: Requires acoustid library and fpcalc binary
+        Note: Requires fpcalc binary (called directly, so the path is passed
+        per call instead of through the process-wide FPCALC env var)
         """
         if not os.path.exists(file_path):
             return None
@@ -284,27 +848,18 @@ class DuplicateDetector:
             return None
 
         try:
-            import acoustid
-
-            # CRITICAL: acoustid.fingerprint_file() doesn't accept fpcalc parameter
-            # Instead, it reads from FPCALC environment variable
-            # Set it temporarily for this call
-            old_fpcalc = os.environ.get('FPCALC')
-            os.environ['FPCALC'] = self.fpcalc_checker.fpcalc_path
-
-            try:
-                duration, fingerprint = acoustid.fingerprint_file(file_path)
-                return fingerprint
-            finally:
-                # Restore original environment variable
-                if old_fpcalc is not None:
-                    os.environ['FPCALC'] = old_fpcalc
-                else:
-                    os.environ.pop('FPCALC', None)
+            result = subprocess.run(
+                [self.fpcalc_checker.fpcalc_path, '-json',
+                 '-length', str(FINGERPRINT_MAX_LENGTH), file_path],
+                capture_output=True,
+                timeout=FPCALC_TIMEOUT
+            )
+            if result.returncode != 0:
+                logger.warning(f"fpcalc exited with status {result.returncode} for {file_path}")
+                return None
+
+            return json.loads(result.stdout)['fingerprint']
 
-        except ImportError:
-            logger.warning("acoustid not installed - fingerprint detection unavailable")
-            return None
         except Exception as e:
             logger.warning(f"Failed to generate fingerprint: {e}")
             return None
@@ -15,12 +15,20 @@ Usage:
 """
 
 import logging
+from functools import partial
 from PyQt6.QtCore import QObject, Qt, QEvent, pyqtSignal
 from PyQt6.QtWidgets import QLineEdit, QTextEdit, QPlainTextEdit, QApplication
 from PyQt6.QtGui import QAction, QKeySequence
 
 logger = logging.getLogger(__name__)
 
+# Modifiers that are never part of a shortcut handled by the event filter
+_UNHANDLED_MODIFIERS = (
+    Qt.KeyboardModifier.ShiftModifier
+    | Qt.KeyboardModifier.AltModifier
+    | Qt.KeyboardModifier.MetaModifier
+)
+
 
 class KeyboardShortcutManager(QObject):
     """
@@ -48,6 +56,29 @@ class KeyboardShortcutManager(QObject):
         """Initialize keyboard shortcuts manager"""
         super().__init__(parent)
         self._actions = []  # Store QAction instances
+
+        # Dispatch tables: key -> (pre-bound emit, log description)
+        # Left/Right are handled by QAction (see setup_shortcuts) for higher priority
+        self._plain_table = {
+            Qt.Key.Key_Space: (self.play_pause_requested.emit, "Space (Play/Pause)"),
+            Qt.Key.Key_Up: (partial(self.volume_change_requested.emit, 10), "Up Arrow (Volume +10%)"),
+            Qt.Key.Key_Down: (partial(self.volume_change_requested.emit, -10), "Down Arrow (Volume -10%)"),
+            Qt.Key.Key_M: (self.mute_toggled.emit, "M (Mute Toggle)"),
+        }
+        self._ctrl_table = {
+            Qt.Key.Key_F: (self.focus_search_requested.emit, "Ctrl+F (Focus Search)"),
+            Qt.Key.Key_L: (partial(self.switch_to_tab_requested.emit, 'library'), "Ctrl+L (Library Tab)"),
+            Qt.Key.Key_D: (partial(self.switch_to_tab_requested.emit, 'queue'), "Ctrl+D (Queue Tab)"),
+        }
+        self._handled_keys = frozenset(self._plain_table) | frozenset(self._ctrl_table)
+
+        # Typing context is re-evaluated on focus changes, not on every key press
+        app = QApplication.instance()
+        self._tracks_focus = app is not None
+        self._is_typing = self._is_text_input(QApplication.focusWidget()) if app else False
+        if app:
+            app.focusChanged.connect(self._on_focus_changed)
+
         logger.info("KeyboardShortcutManager initialized")
 
     def setup_shortcuts(self, main_window):
@@ -105,23 +136,36 @@ class KeyboardShortcutManager(QObject):
         if event.type() != QEvent.Type.KeyPress:
             return False
 
-        # Ignore shortcuts when typing in text fields
-        if self._is_typing_context(obj):
+        # Fast path: most key presses (typing) are not shortcuts at all
+        key = event.key()
+        if key not in self._handled_keys:
             return False
 
-        key = event.key()
         modifiers = event.modifiers()
+        if modifiers & _UNHANDLED_MODIFIERS:
+            return False
 
-        # Handle Ctrl+Key shortcuts
+        # Ignore shortcuts when typing in text fields
+        if self._is_typing_context(obj):
+            return False
+
+        # Ctrl+Key shortcuts or plain key shortcuts - one dict lookup
         if modifiers & Qt.KeyboardModifier.ControlModifier:
-            if self._handle_ctrl_shortcut(key):
-                return True  # Consume event
+            table = self._ctrl_table
+        else:
+            table = self._plain_table
+
+        return self._dispatch(table, key)  # True consumes the event
 
-        # Handle plain key shortcuts
-        elif self._handle_shortcut(key):
-            return True  # Consume event
+    def _on_focus_changed(self, old, new):
+        """
+        Update cached typing context when application focus moves
 
-        return False  # Let event propagate
+        Args:
+            old: Widget that lost focus (unused)
+            new: Widget that gained focus (None if focus left the app)
+        """
+        self._is_typing = self._is_text_input(new)
 
     def _is_typing_context(self, widget):
         """
@@ -133,10 +177,23 @@ class KeyboardShortcutManager(QObject):
         Returns:
             bool: True if focused widget or its parent is a text field
         """
-        # Get the widget that actually has focus (not obj from eventFilter)
-        focus_widget = QApplication.focusWidget()
+        if self._tracks_focus:
+            return self._is_typing
+
+        # No QApplication when created - check the focus widget directly
+        return self._is_text_input(QApplication.focusWidget())
+
+    @staticmethod
+    def _is_text_input(focus_widget):
+        """
+        Check if a widget or one of its parents is a text input field
+
+        Args:
+            focus_widget: Focused widget (or None)
 
-        # Check if focus widget is a text input field
+        Returns:
+            bool: True if widget or its parent is a text field
+        """
         while focus_widget:
             if isinstance(focus_widget, (QLineEdit, QTextEdit, QPlainTextEdit)):
                 logger.debug(f"Typing context detected: {focus_widget.__class__.__name__}")
@@ -145,42 +202,39 @@ class KeyboardShortcutManager(QObject):
 
         return False
 
-    def _handle_shortcut(self, key):
+    def _dispatch(self, table, key):
         """
-        Handle plain key shortcuts (no modifiers)
+        Emit the shortcut signal mapped to key in a dispatch table
 
         Args:
+            table: Dispatch table (key -> (emit callable, description))
             key: Qt key code
 
         Returns:
             bool: True if shortcut was handled
-
-        Note: Left/Right are handled by QShortcut (setup_shortcuts) for higher priority
         """
-        if key == Qt.Key.Key_Space:
-            self.play_pause_requested.emit()
-            logger.debug("Shortcut: Space (Play/Pause)")
-            return True
+        entry = table.get(key)
+        if entry is None:
+            return False
 
-        # Left/Right handled by QShortcut (see setup_shortcuts)
-        # This avoids conflicts with table/list navigation
+        emit, description = entry
+        emit()
+        logger.debug(f"Shortcut: {description}")
+        return True
 
-        elif key == Qt.Key.Key_Up:
-            self.volume_change_requested.emit(10)
-            logger.debug("Shortcut: Up Arrow (Volume +10%)")
-            return True
+    def _handle_shortcut(self, key):
+        """
+        Handle plain key shortcuts (no modifiers)
 
-        elif key == Qt.Key.Key_Down:
-            self.volume_change_requested.emit(-10)
-            logger.debug("Shortcut: Down Arrow (Volume -10%)")
-            return True
+        Args:
+            key: Qt key code
 
-        elif key == Qt.Key.Key_M:
-            self.mute_toggled.emit()
-            logger.debug("Shortcut: M (Mute Toggle)")
-            return True
+        Returns:
+            bool: True if shortcut was handled
 
-        return False
+        Note: Left/Right are handled by QShortcut (setup_shortcuts) for higher priority
+        """
+        return self._dispatch(self._plain_table, key)
 
     def _handle_ctrl_shortcut(self, key):
         """
@@ -192,22 +246,7 @@ class KeyboardShortcutManager(QObject):
         Returns:
             bool: True if shortcut was handled
         """
-        if key == Qt.Key.Key_F:
-            self.focus_search_requested.emit()
-            logger.debug("Shortcut: Ctrl+F (Focus Search)")
-            return True
-
-        elif key == Qt.Key.Key_L:
-            self.switch_to_tab_requested.emit('library')
-            logger.debug("Shortcut: Ctrl+L (Library Tab)")
-            return True
-
-        elif key == Qt.Key.Key_D:
-            self.switch_to_tab_requested.emit('queue')
-            logger.debug("Shortcut: Ctrl+D (Queue Tab)")
-            return True
-
-        return False
+        return self._dispatch(self._ctrl_table, key)
 
     def get_shortcuts(self):
         """
@@ -10,15 +10,132 @@ Organize music library into structured folder hierarchy:
 
 Created: November 13, 2025
 """
+import errno
 import logging
 import os
 import shutil
 import re
-from pathlib import Path
-from typing import List, Dict, Optional
+import string
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Placeholders available to path templates, with the value used when a song lacks them
+_FIELD_DEFAULTS = {
+    'artist': 'Unknown Artist',
+    'album': 'Unknown Album',
+    'title': 'Unknown',
+    'year': 'Unknown',
+    'genre': 'Unknown',
+    'track': 0,
+}
+TEMPLATE_FIELDS = frozenset(_FIELD_DEFAULTS)
+
+# Placeholders whose values are passed through _sanitize_path
+_SANITIZED_FIELDS = frozenset({'artist', 'album', 'title', 'genre'})
+
+# Format-string conversion flag -> builtin used by compiled templates
+_CONVERSIONS = {'s': 'str', 'r': 'repr', 'a': 'ascii'}
+
+_FORMATTER = string.Formatter()
+
+# Compiled once at import (run for every path component of every song)
+_INVALID_PATH_CHARS_RE = re.compile(r'[/\\:*?"<>|]')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+
+# Max memoized _sanitize_path results (artist/album/genre repeat across songs)
+SANITIZE_CACHE_SIZE = 4096
+
+# Concurrent file moves/copies in organize() (I/O-bound, so above CPU count)
+ORGANIZE_WORKERS = (os.cpu_count() or 4) * 2
+
+# Songs planned and transferred per batch in organize() (bounds memory for
+# huge or lazily generated song iterables)
+ORGANIZE_CHUNK_SIZE = 1000
+
+# Source existence checks kept in flight at once before planning
+# (I/O bound, releases the GIL; deep queues help network shares and NCQ disks)
+STAT_WORKERS = 32
+
+# In-kernel file copies (Linux; reflinks on btrfs/XFS), else shutil.copy2
+COPY_FILE_RANGE_AVAILABLE = hasattr(os, 'copy_file_range')
+
+# Bytes per os.copy_file_range call
+COPY_CHUNK_SIZE = 1 << 30
+
+# copy_file_range errors meaning "not supported for these files"
+_COPY_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP})
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    """
+    Split an iterable into lists of at most size items, lazily
+
+    Returns:
+        Iterator over the chunks
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _name_key(name: str) -> str:
+    """
+    Comparison key for file names/paths when detecting conflicts
+
+    Case-folded on every platform: the default filesystems on macOS and
+    Windows are case-insensitive (os.path.normcase doesn't fold on macOS),
+    and a rename onto a differently-cased existing name would overwrite
+    it. An extra "_1" on a case-sensitive filesystem is harmless.
+    """
+    return os.path.normcase(name).casefold()
+
+
+def _directory_names(directory: str) -> set:
+    """
+    Names of all entries in a directory from one os.scandir() listing
+
+    Returns:
+        Set of _name_key'd entry names (empty if the directory does not exist)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {_name_key(entry.name) for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def _copy_file_range(source: str, target: str) -> bool:
+    """
+    Copy file contents inside the kernel with os.copy_file_range
+
+    Returns:
+        True if copied, False if unsupported here (caller falls back to a
+        regular copy, which overwrites whatever was written)
+    """
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        expected = os.fstat(src_fd).st_size
+        copied = 0
+        try:
+            while True:
+                count = os.copy_file_range(src_fd, dst_fd, COPY_CHUNK_SIZE)
+                if count == 0:
+                    break
+                copied += count
+        except OSError as e:
+            if e.errno in _COPY_FALLBACK_ERRNOS:
+                return False
+            raise
+
+    # Some filesystems report EOF immediately instead of an error
+    return copied > 0 or expected == 0
+
 
 class LibraryOrganizer:
     """
@@ -66,19 +183,35 @@ class LibraryOrganizer:
         """
         self.db = db_manager
         self._history = []  # For rollback
+        # template -> (parsed (literal, field, spec, conversion) parts, unknown fields)
+        self._template_cache = {}
+        # template -> compiled build(song, sanitize) function, or None if not compilable
+        self._compiled_templates = {}
+        # raw text -> _sanitize_path result, cleared when it outgrows SANITIZE_CACHE_SIZE
+        self._sanitize_cache = {}
+        # Directories already ensured during the current organize() run
+        self._dirs_created = set()
+        # (source dir, target dir) pairs known to be on different filesystems
+        self._cross_device_dirs = set()
         logger.info("LibraryOrganizer initialized")
 
-    def organize(self, base_path: str, template: str, songs: List[Dict],
-                 move: bool = True, dry_run: bool = False) -> Dict:
+    def organize(self, base_path: str, template: str, songs: Iterable[Dict],
+                 move: bool = True, dry_run: bool = False,
+                 on_preview: Optional[Callable[[Dict], None]] = None) -> Dict:
         """
         Organize songs into folder structure
 
+        Songs are consumed lazily, ORGANIZE_CHUNK_SIZE at a time, so a
+        generator over a huge library is never held in memory at once.
+
         Args:
             base_path: Root directory (e.g., /music/organized)
             template: Path template string
-            songs: List of song dictionaries
+            songs: Song dictionaries (list or any iterable)
             move: True = move files, False = copy files
             dry_run: If True, preview without actual changes
+            on_preview: Called with each preview entry instead of collecting
+                        them in result['preview'] (dry_run only, optional)
 
         Returns:
             {
@@ -88,7 +221,7 @@ class LibraryOrganizer:
                 'preview': [{'old': '...', 'new': '...'}]  # If dry_run
             }
         """
-        logger.info(f"Organizing {len(songs)} songs (dry_run={dry_run})")
+        logger.info(f"Organizing songs (dry_run={dry_run})")
 
         result = {
             'success': 0,
@@ -98,66 +231,125 @@ class LibraryOrganizer:
         }
 
         self._history = []
+        self._dirs_created = set()
+
+        if on_preview is None:
+            on_preview = result['preview'].append
+
+        # Targets claimed so far and target directory -> entry names (listed
+        # once instead of a stat per song); both span chunks so conflict
+        # resolution (and the resulting names) stays deterministic
+        planned_targets = set()
+        listings = {}
+
+        for chunk in _chunked(songs, ORGANIZE_CHUNK_SIZE):
+            # (song, old_path, target_path) per file to move/copy, planned serially
+            jobs = []
+
+            # Check every source file up front, many stat() calls in flight at once
+            if dry_run:
+                sources_exist = [None] * len(chunk)
+            else:
+                with ThreadPoolExecutor(max_workers=min(STAT_WORKERS, len(chunk))) as executor:
+                    sources_exist = list(executor.map(
+                        lambda path: bool(path) and os.path.exists(path),
+                        [song.get('file_path', '') for song in chunk]
+                    ))
+
+            for song, source_exists in zip(chunk, sources_exist):
+                try:
+                    # Build target path
+                    target_path = self.build_path(base_path, template, song)
+
+                    old_path = song.get('file_path', '')
+
+                    if dry_run:
+                        # Preview mode - don't move files
+                        on_preview({
+                            'old': old_path,
+                            'new': target_path,
+                            'song': song
+                        })
+                        result['success'] += 1
+                    elif source_exists:
+                        # Songs without an ID cannot be updated in the database
+                        if 'id' not in song:
+                            result['failed'] += 1
+                            result['errors'].append(f"Error: {old_path}: song has no database ID")
+                            continue
 
-        for song in songs:
-            try:
-                # Build target path
-                target_path = self.build_path(base_path, template, song)
-
-                old_path = song.get('file_path', '')
-
-                if dry_run:
-                    # Preview mode - don't move files
-                    result['preview'].append({
-                        'old': old_path,
-                        'new': str(target_path),
-                        'song': song
-                    })
-                    result['success'] += 1
-                else:
-                    # Actually move/copy file
-                    if os.path.exists(old_path):
                         # Create target directory
                         self._create_directories(os.path.dirname(target_path))
 
-                        # Handle name conflicts
-                        if os.path.exists(target_path):
-                            target_path = self._handle_name_conflict(target_path)
-
-                        # Move or copy
-                        if move:
-                            success = self._move_file(old_path, str(target_path))
-                        else:
-                            success = self._copy_file(old_path, str(target_path))
-
-                        if success:
-                            # Update database
-                            self._update_database_path(song['id'], str(target_path))
-
-                            # Store for rollback
-                            self._history.append({
-                                'old': old_path,
-                                'new': str(target_path),
-                                'song_id': song['id']
-                            })
-
-                            result['success'] += 1
-                        else:
-                            result['failed'] += 1
-                            result['errors'].append(f"Failed to move: {old_path}")
+                        # Handle name conflicts (existing files and earlier targets of this run)
+                        directory, name = os.path.split(target_path)
+                        existing = listings.get(directory)
+                        if existing is None:
+                            existing = listings[directory] = _directory_names(directory)
+                        if _name_key(target_path) in planned_targets or _name_key(name) in existing:
+                            target_path = self._handle_name_conflict(target_path, planned_targets, existing)
+                        planned_targets.add(_name_key(target_path))
+
+                        jobs.append((song, old_path, target_path))
                     else:
                         result['failed'] += 1
                         result['errors'].append(f"File not found: {old_path}")
 
-            except Exception as e:
-                result['failed'] += 1
-                result['errors'].append(f"Error: {song.get('file_path', 'unknown')}: {str(e)}")
-                logger.error(f"Organization error: {e}")
+                except Exception as e:
+                    result['failed'] += 1
+                    result['errors'].append(f"Error: {song.get('file_path', 'unknown')}: {str(e)}")
+                    logger.error(f"Organization error: {e}")
+
+            if jobs:
+                self._transfer_files(jobs, move, result)
 
         logger.info(f"Organization complete: {result['success']} success, {result['failed']} failed")
         return result
 
-    def build_path(self, base_path: str, template: str, song: Dict) -> Path:
+    def _transfer_files(self, jobs: List[Tuple[Dict, str, str]], move: bool, result: Dict):
+        """
+        Move/copy planned files, update the database and record history
+
+        Args:
+            jobs: (song, old_path, target_path) per file, conflicts resolved
+            move: True = move files, False = copy files
+            result: organize() result dict, updated in place
+        """
+        # Move or copy concurrently (map keeps job order)
+        transfer = self._move_file if move else self._copy_file
+        with ThreadPoolExecutor(max_workers=ORGANIZE_WORKERS) as executor:
+            outcomes = list(executor.map(lambda job: transfer(job[1], job[2]), jobs))
+
+        moved = []
+        for (song, old_path, target_path), success in zip(jobs, outcomes):
+            if success:
+                moved.append((song, old_path, target_path))
+            else:
+                result['failed'] += 1
+                result['errors'].append(f"Failed to move: {old_path}")
+
+        # Update database (one transaction per chunk)
+        db_errors = self._update_database_paths(
+            [(song['id'], target_path) for song, _, target_path in moved]
+        )
+
+        for song, old_path, target_path in moved:
+            error = db_errors.get(song['id'])
+            if error is not None:
+                result['failed'] += 1
+                result['errors'].append(f"Error: {old_path}: {error}")
+                continue
+
+            # Store for rollback
+            self._history.append({
+                'old': old_path,
+                'new': target_path,
+                'song_id': song['id']
+            })
+
+            result['success'] += 1
+
+    def build_path(self, base_path: str, template: str, song: Dict) -> str:
         """
         Build target path from template and song metadata
 
@@ -167,30 +359,110 @@ class LibraryOrganizer:
             song: Song metadata dictionary
 
         Returns:
-            Path object for target file
+            Normalized target file path
         """
+        # Fast path: template specialized into a plain Python function
+        build = self._compile_template(template)
+        if build is not None:
+            return os.path.normpath(os.path.join(base_path, build(song, self._sanitize_path)))
+
         # Get metadata with fallbacks
         metadata = {
-            'artist': self._sanitize_path(song.get('artist', 'Unknown Artist')),
-            'album': self._sanitize_path(song.get('album', 'Unknown Album')),
-            'title': self._sanitize_path(song.get('title', 'Unknown')),
-            'year': song.get('year', 'Unknown'),
-            'genre': self._sanitize_path(song.get('genre', 'Unknown')),
-            'track': song.get('track', 0)
+            field: self._sanitize_path(song.get(field, default)) if field in _SANITIZED_FIELDS
+            else song.get(field, default)
+            for field, default in _FIELD_DEFAULTS.items()
         }
 
-        # Format template
-        try:
-            relative_path = template.format(**metadata)
-        except KeyError as e:
-            logger.warning(f"Missing template key: {e}, using fallback")
+        # Format template (parsed once per template string)
+        parts, unknown_fields = self._parse_template(template)
+        if unknown_fields:
+            logger.warning(f"Missing template key: {', '.join(unknown_fields)}, using fallback")
             # Fallback to simple template
             relative_path = f"{metadata['artist']}/{metadata['title']}.mp3"
+        else:
+            pieces = []
+            for literal, field, spec, conversion in parts:
+                pieces.append(literal)
+                if field is not None:
+                    value, _ = _FORMATTER.get_field(field, (), metadata)
+                    value = _FORMATTER.convert_field(value, conversion)
+                    pieces.append(format(value, spec))
+            relative_path = ''.join(pieces)
 
         # Combine with base path
-        full_path = Path(base_path) / relative_path
+        return os.path.normpath(os.path.join(base_path, relative_path))
 
-        return full_path
+    def _parse_template(self, template: str) -> Tuple[List[Tuple], List[str]]:
+        """
+        Parse a path template once and cache the result
+
+        Args:
+            template: Path template
+
+        Returns:
+            (list of (literal, field, spec, conversion) parts,
+             list of placeholders that are not TEMPLATE_FIELDS)
+        """
+        cached = self._template_cache.get(template)
+        if cached is None:
+            parts = list(_FORMATTER.parse(template))
+            unknown_fields = [
+                field for _, field, _, _ in parts
+                if field is not None and re.split(r'[.\[]', field, 1)[0] not in TEMPLATE_FIELDS
+            ]
+            cached = (parts, unknown_fields)
+            self._template_cache[template] = cached
+        return cached
+
+    def _compile_template(self, template: str) -> Optional[Callable[[Dict, Callable], str]]:
+        """
+        Specialize a path template into a Python function, once per template
+
+        "{artist}/{track:02d} - {title}.mp3" becomes roughly
+        ``''.join([sanitize(song.get('artist', ...)), '/', format(song.get('track', 0), '02d'), ...])``,
+        skipping the metadata dict and the generic Formatter loop. Only plain
+        placeholders are compiled; attribute/index lookups, nested format
+        specs and unknown fields return None (generic path in build_path).
+
+        Args:
+            template: Path template
+
+        Returns:
+            build(song, sanitize) -> relative path, or None if not compilable
+        """
+        if template in self._compiled_templates:
+            return self._compiled_templates[template]
+
+        build = None
+        parts, unknown_fields = self._parse_template(template)
+        compilable = not unknown_fields and all(
+            field is None or (field in TEMPLATE_FIELDS and '{' not in spec
+                              and (conversion is None or conversion in _CONVERSIONS))
+            for _, field, spec, conversion in parts
+        )
+
+        if compilable:
+            # Literals and defaults are embedded via repr(), so template text never runs as code
+            expressions = []
+            for literal, field, spec, conversion in parts:
+                if literal:
+                    expressions.append(repr(literal))
+                if field is None:
+                    continue
+                value = f"song.get({field!r}, {_FIELD_DEFAULTS[field]!r})"
+                if field in _SANITIZED_FIELDS:
+                    value = f"sanitize({value})"
+                if conversion is not None:
+                    value = f"{_CONVERSIONS[conversion]}({value})"
+                expressions.append(f"format({value}, {spec!r})")
+
+            source = f"def build(song, sanitize):\n    return ''.join([{', '.join(expressions)}])\n"
+            namespace = {}
+            exec(compile(source, '<path template>', 'exec'), namespace)
+            build = namespace['build']
+
+        self._compiled_templates[template] = build
+        return build
 
     def _sanitize_path(self, text: str) -> str:
         """
@@ -205,18 +477,28 @@ class LibraryOrganizer:
         if not text:
             return "Unknown"
 
+        # Same artist/album/genre across many songs: sanitize once
+        cached = self._sanitize_cache.get(text)
+        if cached is not None:
+            return cached
+        raw = text
+
         # Remove/replace invalid filesystem characters
         # Invalid: / \ : * ? " < > |
-        text = re.sub(r'[/\\:*?"<>|]', '_', text)
+        text = _INVALID_PATH_CHARS_RE.sub('_', text)
 
         # Remove leading/trailing dots and spaces
         text = text.strip('. ')
 
         # Remove control characters
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+        text = _CONTROL_CHARS_RE.sub('', text)
 
         if not text:
-            return "Unknown"
+            text = "Unknown"
+
+        if len(self._sanitize_cache) >= SANITIZE_CACHE_SIZE:
+            self._sanitize_cache.clear()
+        self._sanitize_cache[raw] = text
 
         return text
 
@@ -224,11 +506,18 @@ class LibraryOrganizer:
         """
         Create directory structure
 
+        Directories already created during this organize() run are skipped,
+        so songs sharing an album folder cost one makedirs() between them.
+
         Args:
             directory: Directory path to create
         """
+        if directory in self._dirs_created:
+            return
+
         try:
             os.makedirs(directory, exist_ok=True)
+            self._dirs_created.add(directory)
             logger.debug(f"Created directory: {directory}")
         except Exception as e:
             logger.error(f"Failed to create directory {directory}: {e}")
@@ -246,12 +535,25 @@ class LibraryOrganizer:
             True if successful
         """
         try:
-            # Create target directory if needed
+            # Create target directory if needed (no-op if organize() already did)
             target_dir = os.path.dirname(target)
             if target_dir:
-                os.makedirs(target_dir, exist_ok=True)
-
-            shutil.move(source, target)
+                self._create_directories(target_dir)
+
+            # Same filesystem: a metadata-only rename (shutil.move would also
+            # try os.rename first, after extra stat() calls)
+            dirs = (os.path.dirname(source), target_dir)
+            if dirs in self._cross_device_dirs:
+                shutil.move(source, target)
+            else:
+                try:
+                    os.rename(source, target)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    # Cross-device: copy + delete, and skip the rename next time
+                    self._cross_device_dirs.add(dirs)
+                    shutil.move(source, target)
             logger.debug(f"Moved: {source} -> {target}")
             return True
         except Exception as e:
@@ -270,7 +572,11 @@ class LibraryOrganizer:
             True if successful
         """
         try:
-            shutil.copy2(source, target)
+            if COPY_FILE_RANGE_AVAILABLE and _copy_file_range(source, target):
+                # Contents copied in-kernel; carry over times/mode like copy2
+                shutil.copystat(source, target)
+            else:
+                shutil.copy2(source, target)
             logger.debug(f"Copied: {source} -> {target}")
             return True
         except Exception as e:
@@ -292,27 +598,65 @@ class LibraryOrganizer:
             logger.error(f"Failed to update database for song {song_id}: {e}")
             raise
 
-    def _handle_name_conflict(self, file_path: str) -> str:
+    def _update_database_paths(self, updates: List[Tuple[int, str]]) -> Dict[int, str]:
+        """
+        Update many song file paths in the database
+
+        Tries a single bulk transaction first; if that fails, falls back to
+        per-song updates so one bad row does not lose the others.
+
+        Args:
+            updates: List of (song_id, new_path) pairs
+
+        Returns:
+            Error message by song ID for updates that failed (empty if none)
+        """
+        if not updates:
+            return {}
+
+        if self.db.update_song_paths_bulk(updates) is not None:
+            logger.debug(f"Updated database: {len(updates)} song paths (batch)")
+            return {}
+
+        logger.warning("Bulk path update failed, retrying song by song")
+        errors = {}
+        for song_id, new_path in updates:
+            try:
+                self._update_database_path(song_id, new_path)
+            except Exception as e:
+                errors[song_id] = str(e)
+        return errors
+
+    def _handle_name_conflict(self, file_path: str, reserved: Optional[set] = None,
+                              existing: Optional[set] = None) -> str:
         """
         Generate unique filename if conflict exists
 
+        Candidates are checked against one listing of the directory rather
+        than a stat() per candidate name.
+
         Args:
             file_path: Desired file path
+            reserved: _name_key'd paths already claimed but not yet written (optional)
+            existing: _name_key'd names already in the directory (listed if omitted)
 
         Returns:
             Unique file path
         """
-        path = Path(file_path)
-        stem = path.stem
-        suffix = path.suffix
-        directory = path.parent
+        directory, name = os.path.split(file_path)
+        stem, suffix = os.path.splitext(name)
+
+        if existing is None:
+            existing = _directory_names(directory or os.curdir)
 
         counter = 1
         while True:
-            new_path = directory / f"{stem}_{counter}{suffix}"
-            if not new_path.exists():
+            name = f"{stem}_{counter}{suffix}"
+            new_path = os.path.join(directory, name)
+            if (_name_key(name) not in existing
+                    and (reserved is None or _name_key(new_path) not in reserved)):
                 logger.debug(f"Resolved conflict: {file_path} -> {new_path}")
-                return str(new_path)
+                return new_path
             counter += 1
 
             if counter > 1000:
@@ -12,6 +12,9 @@ Security (Pre-Phase 5 Hardening):
 - Input sanitization to prevent injection attacks
 """
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from difflib import SequenceMatcher
 from api.musicbrainz_client import MusicBrainzClient
@@ -20,6 +23,22 @@ from utils.input_sanitizer import sanitize_query
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Try to import rapidfuzz (C++ fuzzy matching, falls back to difflib)
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    logger.warning("rapidfuzz not available - using slower difflib matching")
+
+
+# Concurrent MusicBrainz lookups in autocomplete_batch (requests still
+# start at most once per second - MusicBrainzClient enforces the rate limit)
+AUTOCOMPLETE_WORKERS = 4
+
+# Max cached MusicBrainz searches, keyed by sanitized (title, artist)
+SEARCH_CACHE_SIZE = 4096
+
 
 class MetadataAutocompleter:
     """
@@ -42,6 +61,11 @@ class MetadataAutocompleter:
         Initialize metadata autocompleter
         """
         self.mb_client = MusicBrainzClient()
+
+        # (title, artist) -> tuple of MusicBrainz results, LRU-bounded.
+        # Kept across autocomplete_batch calls; locked for the batch workers
+        self._search_cache = OrderedDict()
+        self._search_cache_lock = threading.Lock()
         logger.info("MetadataAutocompleter initialized")
 
     def autocomplete_single(self, song_data: Dict) -> List[Dict]:
@@ -74,8 +98,8 @@ class MetadataAutocompleter:
             logger.warning("No title provided for autocomplete")
             return []
 
-        # Search MusicBrainz
-        mb_results = self.mb_client.search_recording(title, artist=artist)
+        # Search MusicBrainz (cached per sanitized title/artist)
+        mb_results = self._cached_search(title, artist)
 
         if not mb_results:
             logger.info(f"No MusicBrainz matches for: {title}")
@@ -124,14 +148,19 @@ class MetadataAutocompleter:
 
         results = {}
 
+        valid_songs = []
         for song in songs:
-            song_id = song.get('id')
-            if not song_id:
+            if not song.get('id'):
                 logger.warning("Song without ID, skipping")
                 continue
+            valid_songs.append(song)
 
-            # Get matches
-            matches = self.autocomplete_single(song)
+        # Overlap the MusicBrainz round-trips (map keeps input order)
+        with ThreadPoolExecutor(max_workers=AUTOCOMPLETE_WORKERS) as executor:
+            all_matches = list(executor.map(self.autocomplete_single, valid_songs))
+
+        for song, matches in zip(valid_songs, all_matches):
+            song_id = song['id']
 
             if not matches:
                 # No matches found
@@ -162,6 +191,39 @@ class MetadataAutocompleter:
         logger.info(f"Batch complete: {len(results)} songs processed")
         return results
 
+    def _cached_search(self, title: str, artist: Optional[str]) -> List[Dict]:
+        """
+        Search MusicBrainz, reusing results for repeated (title, artist) pairs
+
+        Empty results are not cached: the client also returns [] on network
+        errors, and those lookups should be retried.
+
+        Args:
+            title (str): Sanitized song title
+            artist (str): Sanitized artist name (optional)
+
+        Returns:
+            list: MusicBrainz results (see MusicBrainzClient.search_recording)
+        """
+        key = (title, artist)
+
+        with self._search_cache_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None:
+                self._search_cache.move_to_end(key)
+                return list(cached)
+
+        mb_results = self.mb_client.search_recording(title, artist=artist)
+
+        if mb_results:
+            with self._search_cache_lock:
+                self._search_cache[key] = tuple(mb_results)
+                self._search_cache.move_to_end(key)
+                if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+
+        return mb_results
+
     def _calculate_confidence(self, song_data: Dict, mb_result: Dict) -> int:
         """
         Calculate confidence score (0-100) for match
@@ -220,11 +282,20 @@ class MetadataAutocompleter:
 
         Returns:
             float: Similarity ratio (0.0 = no match, 1.0 = exact match)
+
+        Note:
+            rapidfuzz's fuzz.ratio is the same normalized Indel similarity as
+            difflib.SequenceMatcher.ratio(), computed in C++.
         """
         if not str1 or not str2:
             return 0.0
 
-        # Use SequenceMatcher for fuzzy matching
-        ratio = SequenceMatcher(None, str1, str2).ratio()
+        # Exact match (common for well-tagged songs) needs no fuzzy matching
+        if str1 == str2:
+            return 1.0
+
+        if RAPIDFUZZ_AVAILABLE:
+            return fuzz.ratio(str1, str2) / 100.0
 
-        return ratio
+        # Fallback: SequenceMatcher (pure Python)
+        return SequenceMatcher(None, str1, str2).ratio()
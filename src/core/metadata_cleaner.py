@@ -12,10 +12,74 @@ Created: November 18, 2025
 """
 import re
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import (hot per-song paths: cleaning, analysis, comparison)
+_TIMESTAMP_RE = re.compile(r'_\d{8}_\d{6}')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_TRAILING_DASH_RE = re.compile(r'\s*-\s*$')
+
+# Anything clean_artist/clean_album would change: a timestamp, or whitespace
+# that normalization rewrites (runs, tabs/newlines, leading/trailing spaces)
+_FIELD_ISSUE_RE = re.compile(r'_\d{8}_\d{6}|\s\s|[^\S ]|^ | $')
+
+# Lowercased placeholder values that count as missing metadata
+_UNKNOWN_ARTISTS = frozenset({'unknown', 'unknown artist'})
+_UNKNOWN_ALBUMS = frozenset({'unknown', 'unknown album'})
+
+# Corruption levels reported in analyze_library's problematic_songs
+_PROBLEMATIC_LEVELS = frozenset({'moderate', 'severe'})
+
+
+class CorruptionRow:
+    """
+    Problematic song entry in an analyze_library report
+
+    Slotted record (no per-row __dict__). Supports dict-style access
+    (row['title'], row.get('id')) so callers can keep treating rows as dicts.
+    """
+    # Declared by hand: @dataclass(slots=True) needs Python 3.10
+    __slots__ = ('id', 'title', 'artist', 'corruption_level')
+
+    def __init__(self, id: Any, title: Optional[str], artist: Optional[str],
+                 corruption_level: str):
+        self.id = id
+        self.title = title
+        self.artist = artist
+        self.corruption_level = corruption_level
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"CorruptionRow({values})"
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    __hash__ = None  # Mutable, like a non-frozen dataclass
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _CORRUPTION_ROW_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _CORRUPTION_ROW_FIELDS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+# Dict-style keys that map to CorruptionRow attributes
+_CORRUPTION_ROW_FIELDS = frozenset(CorruptionRow.__slots__)
+
 
 class MetadataCleaner:
     """
@@ -32,7 +96,7 @@ class MetadataCleaner:
         """Initialize metadata cleaner with common patterns"""
 
         # Patterns to detect and remove
-        self.timestamp_pattern = re.compile(r'_\d{8}_\d{6}')
+        self.timestamp_pattern = _TIMESTAMP_RE
         self.repeated_track_pattern = re.compile(r'^(\d+\s*-\s*)+')
         self.youtube_artifacts_pattern = re.compile(
             r'\[(Official\s+)?(Video|Audio|Music Video|Lyric Video)\]|'
@@ -50,6 +114,22 @@ class MetadataCleaner:
             '00 - ',
         ]
 
+        # All title issue patterns fused into one alternation: a title with no
+        # match (the common case) is checked with a single scan
+        self._title_issue_pattern = re.compile('|'.join([
+            self.timestamp_pattern.pattern,
+            r'^\d+\s*-\s*',
+            f'(?i:{self.youtube_artifacts_pattern.pattern})',
+            '^(?:' + '|'.join(re.escape(garbage) for garbage in self.garbage_phrases) + ')',
+        ]))
+
+        # (field, cleaner) pairs applied by clean_metadata, in order
+        self._field_cleaners = (
+            ('title', self.clean_title),
+            ('artist', self.clean_artist),
+            ('album', self.clean_album),
+        )
+
         logger.info("MetadataCleaner initialized")
 
     def clean_title(self, title: str) -> Tuple[str, List[str]]:
@@ -68,6 +148,14 @@ class MetadataCleaner:
         original = title
         issues = []
 
+        # Fast path: nothing to remove, only spacing to normalize
+        if not self._title_issue_pattern.search(title):
+            title = _WHITESPACE_RE.sub(' ', title).strip()
+            title = _TRAILING_DASH_RE.sub('', title)  # Remove trailing dash
+            if not title:
+                return "Unknown", ["empty_after_cleaning"]
+            return title, issues
+
         # Remove timestamps
         if self.timestamp_pattern.search(title):
             title = self.timestamp_pattern.sub('', title)
@@ -90,8 +178,8 @@ class MetadataCleaner:
             issues.append("youtube_artifacts")
 
         # Clean up spacing
-        title = re.sub(r'\s+', ' ', title).strip()
-        title = re.sub(r'\s*-\s*$', '', title)  # Remove trailing dash
+        title = _WHITESPACE_RE.sub(' ', title).strip()
+        title = _TRAILING_DASH_RE.sub('', title)  # Remove trailing dash
 
         # Fallback if empty after cleaning
         if not title:
@@ -113,24 +201,9 @@ class MetadataCleaner:
         Returns:
             Tuple of (cleaned_artist, list_of_issues_found)
         """
-        if not artist or artist.lower() in ['unknown', 'unknown artist']:
-            return "Unknown Artist", ["missing_artist"]
-
-        original = artist
-        issues = []
-
-        # Remove timestamps
-        if self.timestamp_pattern.search(artist):
-            artist = self.timestamp_pattern.sub('', artist)
-            issues.append("timestamp_suffix")
-
-        # Clean up spacing
-        artist = re.sub(r'\s+', ' ', artist).strip()
-
-        if artist != original:
-            logger.debug(f"Cleaned artist: '{original}' → '{artist}'")
-
-        return artist, issues
+        return self._clean_named_field(
+            artist, 'artist', _UNKNOWN_ARTISTS, "Unknown Artist", "missing_artist"
+        )
 
     def clean_album(self, album: str) -> Tuple[str, List[str]]:
         """
@@ -142,24 +215,47 @@ class MetadataCleaner:
         Returns:
             Tuple of (cleaned_album, list_of_issues_found)
         """
-        if not album or album.lower() in ['unknown', 'unknown album']:
-            return "Unknown Album", ["missing_album"]
+        return self._clean_named_field(
+            album, 'album', _UNKNOWN_ALBUMS, "Unknown Album", "missing_album"
+        )
+
+    def _clean_named_field(self, value: str, field: str, unknown_values: frozenset,
+                           fallback: str, missing_issue: str) -> Tuple[str, List[str]]:
+        """
+        Shared artist/album cleaning: placeholder check, timestamp, spacing
+
+        Args:
+            value: Original field value
+            field: Field name (for logging)
+            unknown_values: Lowercased values that mean the field is missing
+            fallback: Value returned when the field is missing
+            missing_issue: Issue reported when the field is missing
+
+        Returns:
+            Tuple of (cleaned_value, list_of_issues_found)
+        """
+        if not value or value.lower() in unknown_values:
+            return fallback, [missing_issue]
 
-        original = album
+        # Fast path: no timestamp and nothing for spacing cleanup to change
+        if not _FIELD_ISSUE_RE.search(value):
+            return value, []
+
+        original = value
         issues = []
 
         # Remove timestamps
-        if self.timestamp_pattern.search(album):
-            album = self.timestamp_pattern.sub('', album)
+        if self.timestamp_pattern.search(value):
+            value = self.timestamp_pattern.sub('', value)
             issues.append("timestamp_suffix")
 
         # Clean up spacing
-        album = re.sub(r'\s+', ' ', album).strip()
+        value = _WHITESPACE_RE.sub(' ', value).strip()
 
-        if album != original:
-            logger.debug(f"Cleaned album: '{original}' → '{album}'")
+        if value != original:
+            logger.debug(f"Cleaned {field}: '{original}' → '{value}'")
 
-        return album, issues
+        return value, issues
 
     def clean_metadata(self, metadata: Dict) -> Tuple[Dict, Dict]:
         """
@@ -169,30 +265,27 @@ class MetadataCleaner:
             metadata: Song metadata dictionary (title, artist, album, etc.)
 
         Returns:
-            Tuple of (cleaned_metadata, issues_dict)
+            Tuple of (cleaned_metadata, issues_dict). cleaned_metadata is
+            the input dict itself when no field changed (treat as read-only)
         """
-        cleaned = metadata.copy()
         all_issues = {}
+        changes = {}
 
-        # Clean title
-        if 'title' in cleaned:
-            cleaned['title'], issues = self.clean_title(cleaned['title'])
+        for field, clean in self._field_cleaners:
+            if field not in metadata:
+                continue
+            original = metadata[field]
+            value, issues = clean(original)
             if issues:
-                all_issues['title'] = issues
+                all_issues[field] = issues
+            if value != original:
+                changes[field] = value
 
-        # Clean artist
-        if 'artist' in cleaned:
-            cleaned['artist'], issues = self.clean_artist(cleaned['artist'])
-            if issues:
-                all_issues['artist'] = issues
-
-        # Clean album
-        if 'album' in cleaned:
-            cleaned['album'], issues = self.clean_album(cleaned['album'])
-            if issues:
-                all_issues['album'] = issues
+        # Already clean: no copy, the input is returned as-is
+        if not changes:
+            return metadata, all_issues
 
-        return cleaned, all_issues
+        return {**metadata, **changes}, all_issues
 
     def detect_corruption_level(self, metadata: Dict) -> str:
         """
@@ -210,34 +303,22 @@ class MetadataCleaner:
         artist = metadata.get('artist', '')
         album = metadata.get('album', '')
 
+        # Title checks: one fused scan, per-pattern checks only on a hit
+        if self._title_issue_pattern.search(title):
+            issues_count += self._title_issue_score(title)
+
         # Check for timestamps
-        if self.timestamp_pattern.search(title):
-            issues_count += 2
         if self.timestamp_pattern.search(artist):
             issues_count += 2
         if self.timestamp_pattern.search(album):
             issues_count += 1
 
-        # Check for repeated track numbers
-        if self.repeated_track_pattern.search(title):
-            issues_count += 1
-
         # Check for unknown values
-        if not artist or artist.lower() in ['unknown', 'unknown artist']:
+        if not artist or artist.lower() in _UNKNOWN_ARTISTS:
             issues_count += 2
-        if not album or album.lower() in ['unknown', 'unknown album']:
-            issues_count += 1
-
-        # Check for YouTube artifacts
-        if self.youtube_artifacts_pattern.search(title):
+        if not album or album.lower() in _UNKNOWN_ALBUMS:
             issues_count += 1
 
-        # Check for garbage prefixes
-        for garbage in self.garbage_phrases:
-            if title.startswith(garbage):
-                issues_count += 2
-                break
-
         # Determine severity
         if issues_count == 0:
             return "clean"
@@ -248,6 +329,36 @@ class MetadataCleaner:
         else:
             return "severe"
 
+    def _title_issue_score(self, title: str) -> int:
+        """
+        Corruption points for a title (see detect_corruption_level)
+
+        Args:
+            title: Song title
+
+        Returns:
+            Sum of the weights of the title issues found
+        """
+        score = 0
+
+        # Check for timestamps
+        if self.timestamp_pattern.search(title):
+            score += 2
+
+        # Check for repeated track numbers
+        if self.repeated_track_pattern.search(title):
+            score += 1
+
+        # Check for YouTube artifacts
+        if self.youtube_artifacts_pattern.search(title):
+            score += 1
+
+        # Check for garbage prefixes
+        if title.startswith(tuple(self.garbage_phrases)):
+            score += 2
+
+        return score
+
     def analyze_library(self, songs: List[Dict]) -> Dict:
         """
         Analyze entire library for metadata corruption
@@ -268,17 +379,17 @@ class MetadataCleaner:
             'problematic_songs': []
         }
 
+        detect = self.detect_corruption_level
+        problematic = report['problematic_songs']
+
         for song in songs:
-            level = self.detect_corruption_level(song)
+            level = detect(song)
             report[level] += 1
 
-            if level in ['moderate', 'severe']:
-                report['problematic_songs'].append({
-                    'id': song.get('id'),
-                    'title': song.get('title'),
-                    'artist': song.get('artist'),
-                    'corruption_level': level
-                })
+            if level in _PROBLEMATIC_LEVELS:
+                problematic.append(CorruptionRow(
+                    song.get('id'), song.get('title'), song.get('artist'), level
+                ))
 
         logger.info(
             f"Library analysis: {report['clean']} clean, "
@@ -312,12 +423,12 @@ def normalize_for_comparison(text: str) -> str:
     text = text.lower()
 
     # Remove timestamps
-    text = re.sub(r'_\d{8}_\d{6}', '', text)
+    text = _TIMESTAMP_RE.sub('', text)
 
     # Remove special characters
-    text = re.sub(r'[^\w\s]', '', text)
+    text = _NON_WORD_RE.sub('', text)
 
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
 
     return text
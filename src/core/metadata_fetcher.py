@@ -9,12 +9,101 @@ Purpose: Search correct metadata from multiple sources
 
 Created: November 18, 2025
 """
+import json
 import logging
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 from difflib import SequenceMatcher
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Try to import rapidfuzz (C++ fuzzy matching, falls back to difflib)
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    logger.warning("rapidfuzz not available - using slower difflib matching")
+
+# Max memoized (query, candidate) similarity ratios - the same artist/title
+# pairs repeat across sources and across tracks of a batch
+SIMILARITY_CACHE_SIZE = 4096
+
+# Max cached search_by_title_artist result lists per fetcher (LRU)
+LOOKUP_CACHE_SIZE = 1024
+
+# Threads running MusicBrainz/Spotify searches concurrently (shared by all
+# fetchers; IO-bound)
+SEARCH_WORKERS = 4
+
+# Seconds a (title, artist) with no results from any source is not
+# searched again, and the max number of such keys remembered
+NEGATIVE_CACHE_TTL = 60 * 60
+NEGATIVE_CACHE_SIZE = 4096
+
+# fetch_metadata stops querying further sources once a match scores this
+PERFECT_MATCH_SCORE = 95.0
+
+# Background threads refreshing stale persistent-cache entries
+REVALIDATE_WORKERS = 2
+
+# Candidate count from which rapidfuzz.process.cdist beats per-pair calls
+# (each source returns 5 results by default; cdist setup costs ~3 ratio calls)
+CDIST_MIN_CANDIDATES = 16
+
+
+@lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
+def _similarity_ratio(str1: str, str2: str) -> float:
+    """
+    Similarity ratio (0.0 to 1.0) of two normalized strings, memoized
+
+    rapidfuzz's fuzz.ratio is the normalized Indel similarity that
+    difflib.SequenceMatcher.ratio() approximates, computed in C++.
+    Keyed on the ordered pair: the difflib fallback is not guaranteed to
+    be symmetric, so (a, b) and (b, a) are cached separately.
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.ratio(str1, str2) / 100.0
+
+    # Fallback: SequenceMatcher (pure Python)
+    return SequenceMatcher(None, str1, str2).ratio()
+
+
+def _normalize(text: Optional[str]) -> Optional[str]:
+    """Lowercase/strip for comparison; None for empty input (scores 0)"""
+    if not text:
+        return None
+    return text.lower().strip()
+
+
+def _normalized_similarity(str1: Optional[str], str2: Optional[str]) -> float:
+    """Similarity ratio of two _normalize'd strings (0.0 if either is empty)"""
+    if str1 is None or str2 is None:
+        return 0.0
+    if str1 == str2:
+        return 1.0  # Identical: skip the ratio (and its cache lookup)
+    return _similarity_ratio(str1, str2)
+
+
+def _first_dict(items) -> Optional[Dict]:
+    """First element of a list from an API response, if it is a dict"""
+    if isinstance(items, list) and items and isinstance(items[0], dict):
+        return items[0]
+    return None
+
+
+def _parse_year(date_str) -> Optional[int]:
+    """Year from an API date string ('1975', '1975-10-31'), None if absent/invalid"""
+    if isinstance(date_str, str) and len(date_str) >= 4 and date_str[:4].isdecimal():
+        return int(date_str[:4])
+    return None
+
 
 class MetadataFetcher:
     """
@@ -27,21 +116,41 @@ class MetadataFetcher:
     4. Return best match with confidence level
     """
 
-    def __init__(self, musicbrainz_client=None, spotify_client=None):
+    # Shared by all fetchers (see _get_search_executor)
+    _search_executor = None
+    _search_executor_lock = threading.Lock()
+
+    def __init__(self, musicbrainz_client=None, spotify_client=None, response_cache=None):
         """
         Initialize metadata fetcher
 
         Args:
             musicbrainz_client: MusicBrainzClient instance (optional)
             spotify_client: SpotifyClient instance (optional)
+            response_cache: ResponseCache for per-source results across
+                            sessions (optional, stale-while-revalidate)
         """
         self.musicbrainz_client = musicbrainz_client
         self.spotify_client = spotify_client
+        self.response_cache = response_cache
+
+        # Stale entries being refreshed in the background (keys in flight)
+        self._revalidate_executor = None
+        self._revalidating = set()
+        self._revalidate_lock = threading.Lock()
+
+        # (title, artist, duration) -> scored results, LRU-bounded; repeated
+        # tracks in a batch (duplicates, re-runs) skip the API round-trips
+        self._lookup_cache = OrderedDict()
+
+        # (title, artist) -> monotonic time of a search that found nothing
+        self._negative_cache = {}
 
         logger.info("MetadataFetcher initialized")
 
     def search_by_title_artist(self, title: str, artist: str,
-                                duration: Optional[int] = None) -> List[Dict]:
+                                duration: Optional[int] = None,
+                                min_confidence: Optional[float] = None) -> List[Dict]:
         """
         Search metadata by title + artist
 
@@ -49,6 +158,9 @@ class MetadataFetcher:
             title: Song title (cleaned)
             artist: Artist name (cleaned)
             duration: Duration in seconds (optional, for better matching)
+            min_confidence: If set, candidates that cannot reach it stop
+                            scoring early (their score is then partial,
+                            but still below min_confidence)
 
         Returns:
             List of match results with scores:
@@ -65,31 +177,270 @@ class MetadataFetcher:
                 ...
             ]
         """
+        key = self._lookup_key(title, artist, duration, min_confidence)
+        cached = self._lookup_cache.get(key)
+        if cached is not None:
+            self._lookup_cache.move_to_end(key)
+            return list(cached)
+
+        if self._is_known_miss(key):
+            return []
+
         results = []
+        all_succeeded = True
 
-        # Try MusicBrainz first
-        if self.musicbrainz_client:
-            try:
-                mb_results = self._search_musicbrainz(title, artist, duration)
-                results.extend(mb_results)
-            except Exception as e:
-                logger.warning(f"MusicBrainz search failed: {e}")
+        # MusicBrainz first, Spotify as fallback - both queried concurrently
+        # (independent HTTP round-trips); results are merged in source order
+        sources = self._sources()
 
-        # Try Spotify as fallback
-        if self.spotify_client:
-            try:
-                spotify_results = self._search_spotify(title, artist, duration)
-                results.extend(spotify_results)
-            except Exception as e:
-                logger.warning(f"Spotify search failed: {e}")
+        def run(source):
+            return self._run_source(source, title, artist, duration, min_confidence)
+
+        if len(sources) > 1:
+            outcomes = self._get_search_executor().map(run, sources)
+        else:
+            outcomes = map(run, sources)
+
+        for source_results in outcomes:
+            if source_results is None:
+                all_succeeded = False
+            else:
+                results.extend(source_results)
+
+        # A failed source proves nothing - only a complete empty answer is
+        # remembered as a miss
+        if not results and sources and all_succeeded:
+            self._remember_miss(key)
+
+        return self._store_lookup(key, results, complete=all_succeeded)
+
+    def search_iter(self, title: str, artist: str,
+                    duration: Optional[int] = None,
+                    min_confidence: Optional[float] = None) -> Iterator[Dict]:
+        """
+        Search metadata by title + artist, one source at a time
+
+        Yields MusicBrainz results before querying Spotify, so a caller
+        that stops iterating (e.g. on a near-perfect match) skips the
+        remaining sources entirely. Each source's results are yielded best
+        first; results are not sorted across sources.
+
+        Args:
+            title: Song title (cleaned)
+            artist: Artist name (cleaned)
+            duration: Duration in seconds (optional)
+            min_confidence: Early-exit scoring threshold (optional)
+
+        Yields:
+            Match results with scores (same format as search_by_title_artist)
+        """
+        key = self._lookup_key(title, artist, duration, min_confidence)
+        cached = self._lookup_cache.get(key)
+        if cached is not None:
+            self._lookup_cache.move_to_end(key)
+            yield from list(cached)
+            return
+
+        if self._is_known_miss(key):
+            return
+
+        sources = self._sources()
+        results = []
+        all_succeeded = True
+        for source in sources:
+            source_results = self._run_source(source, title, artist, duration, min_confidence)
+            if source_results is None:
+                all_succeeded = False
+                continue
+            results.extend(source_results)
+            # Best first within a source, so a consumer stopping at the
+            # first good-enough result has that source's top match
+            yield from sorted(source_results, key=lambda x: x['score'], reverse=True)
+
+        # Only reached when every source was searched (complete result list);
+        # a failed source proves nothing, so outages are not remembered
+        if not results and sources and all_succeeded:
+            self._remember_miss(key)
+        self._store_lookup(key, results, complete=all_succeeded)
+
+    def _lookup_key(self, title: str, artist: str, duration: Optional[int],
+                    min_confidence: Optional[float]) -> Tuple:
+        """
+        Key for the per-fetcher lookup cache
+
+        Normalized like _string_similarity; exact duration and
+        min_confidence, since they change the scores.
+        """
+        return ((title or '').lower().strip(), (artist or '').lower().strip(),
+                duration, min_confidence)
+
+    def _store_lookup(self, key: Tuple, results: List[Dict],
+                      complete: bool = True) -> List[Dict]:
+        """
+        Sort results by score and remember them in the lookup cache
 
+        Args:
+            key: Lookup cache key
+            results: Results from all sources (sorted in place)
+            complete: False if a source failed; partial results are then
+                      returned but not cached, so the next lookup retries
+
+        Returns:
+            Sorted results (a copy if cached)
+        """
         # Sort by score (highest first)
         results.sort(key=lambda x: x['score'], reverse=True)
 
+        # Empty results are not cached (misses go to the negative cache)
+        if results and complete:
+            self._lookup_cache[key] = results
+            if len(self._lookup_cache) > LOOKUP_CACHE_SIZE:
+                self._lookup_cache.popitem(last=False)
+            return list(results)
+
+        return results
+
+    def _is_known_miss(self, key: Tuple) -> bool:
+        """
+        Check whether this title/artist found nothing within NEGATIVE_CACHE_TTL
+
+        Args:
+            key: Lookup cache key (only title and artist are used)
+
+        Returns:
+            True if the network search should be skipped
+        """
+        missed_at = self._negative_cache.get(key[:2])
+        if missed_at is None:
+            return False
+        if time.monotonic() - missed_at < NEGATIVE_CACHE_TTL:
+            return True
+        self._negative_cache.pop(key[:2], None)
+        return False
+
+    def _remember_miss(self, key: Tuple):
+        """
+        Record that no source had results for this title/artist
+
+        Args:
+            key: Lookup cache key (only title and artist are used)
+        """
+        if len(self._negative_cache) >= NEGATIVE_CACHE_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            self._negative_cache.pop(next(iter(self._negative_cache)), None)
+        self._negative_cache.pop(key[:2], None)
+        self._negative_cache[key[:2]] = time.monotonic()
+
+    def _sources(self) -> List[Tuple]:
+        """Configured (name, search method, label) sources, in priority order"""
+        sources = []
+        if self.musicbrainz_client:
+            sources.append(('musicbrainz', self._search_musicbrainz, "MusicBrainz"))
+        if self.spotify_client:
+            sources.append(('spotify', self._search_spotify, "Spotify"))
+        return sources
+
+    def _run_source(self, source: Tuple, title: str, artist: str,
+                    duration: Optional[int],
+                    min_confidence: Optional[float]) -> Optional[List[Dict]]:
+        """
+        Search one source (through the response cache)
+
+        Returns:
+            List of results with scores, or None if the search failed (so
+            an outage is not mistaken for "no results")
+        """
+        name, search, label = source
+        try:
+            return self._cached_search(name, search, title, artist, duration, min_confidence)
+        except Exception as e:
+            logger.error(f"{label} search error: {e}")
+            return None
+
+    @classmethod
+    def _get_search_executor(cls) -> ThreadPoolExecutor:
+        """Shared pool for per-source searches (created on first use)"""
+        with cls._search_executor_lock:
+            if cls._search_executor is None:
+                cls._search_executor = ThreadPoolExecutor(
+                    max_workers=SEARCH_WORKERS, thread_name_prefix="metadata-search"
+                )
+            return cls._search_executor
+
+    def _cached_search(self, source: str, search, title: str, artist: str,
+                       duration: Optional[int],
+                       min_confidence: Optional[float] = None) -> List[Dict]:
+        """
+        Run a per-source search through the persistent response cache
+
+        Fresh entries skip the network. Stale entries are returned at once
+        and refreshed on a background thread. Empty results are never
+        stored; failed searches raise.
+
+        Args:
+            source: Source name (part of the cache key)
+            search: Search method, called as
+                    search(title, artist, duration, min_confidence)
+            title: Song title
+            artist: Artist name
+            duration: Duration in seconds (optional)
+            min_confidence: Early-exit threshold (optional, part of the key)
+
+        Returns:
+            List of results with scores
+        """
+        if self.response_cache is None:
+            return search(title, artist, duration, min_confidence)
+
+        key = json.dumps([source, title, artist, duration, min_confidence])
+        results, fresh = self.response_cache.get(key)
+
+        if results is None:
+            results = search(title, artist, duration, min_confidence)
+            if results:
+                self.response_cache.set(key, results)
+            return results
+
+        if not fresh:
+            self._revalidate(key, search, title, artist, duration, min_confidence)
+
         return results
 
+    def _revalidate(self, key: str, search, title: str, artist: str, duration: Optional[int],
+                    min_confidence: Optional[float] = None):
+        """
+        Refresh a stale cache entry in the background (once per key at a time)
+
+        Args:
+            key: Cache key
+            search: Search method
+            title, artist, duration, min_confidence: Search parameters
+        """
+        with self._revalidate_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+            if self._revalidate_executor is None:
+                self._revalidate_executor = ThreadPoolExecutor(
+                    max_workers=REVALIDATE_WORKERS, thread_name_prefix="metadata-revalidate"
+                )
+
+        def refresh():
+            try:
+                results = search(title, artist, duration, min_confidence)
+                if results:
+                    self.response_cache.set(key, results)
+            except Exception as e:
+                logger.warning(f"Background revalidation failed: {e}")
+            finally:
+                with self._revalidate_lock:
+                    self._revalidating.discard(key)
+
+        self._revalidate_executor.submit(refresh)
+
     def _search_musicbrainz(self, title: str, artist: str,
-                           duration: Optional[int] = None) -> List[Dict]:
+                           duration: Optional[int] = None,
+                           min_confidence: Optional[float] = None) -> List[Dict]:
         """
         Search MusicBrainz API
 
@@ -97,71 +448,65 @@ class MetadataFetcher:
             title: Song title
             artist: Artist name
             duration: Duration in seconds (optional)
+            min_confidence: Early-exit scoring threshold (optional)
 
         Returns:
             List of results with scores
+
+        Raises:
+            Exception: If the MusicBrainz request fails (handled by _run_source)
         """
         if not self.musicbrainz_client:
             return []
 
         results = []
 
-        try:
-            # Build MusicBrainz query
-            query = f'recording:"{title}" AND artist:"{artist}"'
-
-            # Search (using adapter or direct client)
-            mb_results = self.musicbrainz_client.search_recordings(query, limit=5)
-
-            if not mb_results:
-                logger.debug(f"No MusicBrainz results for: {title} - {artist}")
-                return []
-
-            # Process results
-            for mb_recording in mb_results:
-                # Extract metadata (handle both adapter and raw formats)
-                mb_title = mb_recording.get('title', '')
-                mb_artist = self._extract_artist_name(mb_recording)
-                mb_album = self._extract_album_name(mb_recording)
-                mb_year = self._extract_year(mb_recording)
-
-                # Handle duration (may be missing or in different formats)
-                mb_duration = 0
-                if 'length' in mb_recording:
-                    # Raw format: milliseconds
-                    mb_duration = mb_recording.get('length', 0) // 1000
-                elif 'duration' in mb_recording:
-                    # Adapter format: seconds
-                    mb_duration = mb_recording.get('duration', 0)
-
-                # Calculate match score
-                score = self._calculate_match_score(
-                    query_title=title,
-                    query_artist=artist,
-                    query_duration=duration,
-                    result_title=mb_title,
-                    result_artist=mb_artist,
-                    result_duration=mb_duration
-                )
+        # Build MusicBrainz query
+        query = f'recording:"{title}" AND artist:"{artist}"'
 
-                results.append({
-                    'title': mb_title,
-                    'artist': mb_artist,
-                    'album': mb_album,
-                    'year': mb_year,
-                    'duration': mb_duration,
-                    'score': score,
-                    'source': 'musicbrainz',
-                    'raw': mb_recording
-                })
+        # Search (using adapter or direct client)
+        mb_results = self.musicbrainz_client.search_recordings(query, limit=5)
 
-        except Exception as e:
-            logger.error(f"MusicBrainz search error: {e}")
+        if not mb_results:
+            logger.debug(f"No MusicBrainz results for: {title} - {artist}")
+            return []
+
+        # Process results
+        for mb_recording in mb_results:
+            # Extract metadata (handle both adapter and raw formats)
+            mb_title = mb_recording.get('title', '')
+            mb_artist = self._extract_artist_name(mb_recording)
+            mb_album = self._extract_album_name(mb_recording)
+            mb_year = self._extract_year(mb_recording)
+
+            # Handle duration (may be missing or in different formats)
+            mb_duration = 0
+            if 'length' in mb_recording:
+                # Raw format: milliseconds
+                mb_duration = mb_recording.get('length', 0) // 1000
+            elif 'duration' in mb_recording:
+                # Adapter format: seconds
+                mb_duration = mb_recording.get('duration', 0)
+
+            results.append({
+                'title': mb_title,
+                'artist': mb_artist,
+                'album': mb_album,
+                'year': mb_year,
+                'duration': mb_duration,
+                'score': 0.0,
+                'source': 'musicbrainz',
+                'raw': mb_recording
+            })
+
+        # Calculate match scores (all candidates in one pass)
+        self._score_results(title, artist, duration, results, min_confidence)
 
         return results
 
     def _search_spotify(self, title: str, artist: str,
-                       duration: Optional[int] = None) -> List[Dict]:
+                       duration: Optional[int] = None,
+                       min_confidence: Optional[float] = None) -> List[Dict]:
         """
         Search Spotify API
 
@@ -169,81 +514,74 @@ class MetadataFetcher:
             title: Song title
             artist: Artist name
             duration: Duration in seconds (optional)
+            min_confidence: Early-exit scoring threshold (optional)
 
         Returns:
             List of results with scores
+
+        Raises:
+            Exception: If the Spotify request fails (handled by _run_source)
         """
         if not self.spotify_client:
             return []
 
         results = []
 
-        try:
-            # Build Spotify query
-            query = f"track:{title} artist:{artist}"
-
-            # Search (using adapter or direct client)
-            spotify_results = self.spotify_client.search_tracks(query, limit=5)
-
-            if not spotify_results:
-                logger.debug(f"No Spotify results for: {title} - {artist}")
-                return []
-
-            # Process results
-            for track in spotify_results:
-                # Extract metadata (handle both adapter and raw formats)
-                sp_title = track.get('name', '') or track.get('title', '')
-
-                # Handle artists (different formats)
-                sp_artist = ''
-                if 'artists' in track and track['artists']:
-                    sp_artist = track['artists'][0].get('name', '')
-                elif 'artist' in track:
-                    sp_artist = track.get('artist', '')
-
-                # Handle album (different formats)
-                sp_album = ''
-                if 'album' in track:
-                    if isinstance(track['album'], dict):
-                        sp_album = track['album'].get('name', '')
-                    else:
-                        sp_album = track['album']
-
-                # Handle year
-                sp_year = self._extract_spotify_year(track)
-
-                # Handle duration (may be in different formats)
-                sp_duration = 0
-                if 'duration_ms' in track:
-                    # Raw format: milliseconds
-                    sp_duration = track.get('duration_ms', 0) // 1000
-                elif 'duration' in track:
-                    # Adapter format: seconds
-                    sp_duration = track.get('duration', 0)
-
-                # Calculate match score
-                score = self._calculate_match_score(
-                    query_title=title,
-                    query_artist=artist,
-                    query_duration=duration,
-                    result_title=sp_title,
-                    result_artist=sp_artist,
-                    result_duration=sp_duration
-                )
+        # Build Spotify query
+        query = f"track:{title} artist:{artist}"
 
-                results.append({
-                    'title': sp_title,
-                    'artist': sp_artist,
-                    'album': sp_album,
-                    'year': sp_year,
-                    'duration': sp_duration,
-                    'score': score,
-                    'source': 'spotify',
-                    'raw': track
-                })
+        # Search (using adapter or direct client)
+        spotify_results = self.spotify_client.search_tracks(query, limit=5)
 
-        except Exception as e:
-            logger.error(f"Spotify search error: {e}")
+        if not spotify_results:
+            logger.debug(f"No Spotify results for: {title} - {artist}")
+            return []
+
+        # Process results
+        for track in spotify_results:
+            # Extract metadata (handle both adapter and raw formats)
+            sp_title = track.get('name', '') or track.get('title', '')
+
+            # Handle artists (different formats)
+            sp_artist = ''
+            if 'artists' in track and track['artists']:
+                sp_artist = track['artists'][0].get('name', '')
+            elif 'artist' in track:
+                sp_artist = track.get('artist', '')
+
+            # Handle album (different formats)
+            sp_album = ''
+            if 'album' in track:
+                if isinstance(track['album'], dict):
+                    sp_album = track['album'].get('name', '')
+                else:
+                    sp_album = track['album']
+
+            # Handle year
+            sp_year = self._extract_spotify_year(track)
+
+            # Handle duration (may be in different formats)
+            sp_duration = 0
+            if 'duration_ms' in track:
+                # Raw format: milliseconds
+                sp_duration = track.get('duration_ms', 0) // 1000
+            elif 'duration' in track:
+                # Adapter format: seconds
+                sp_duration = track.get('duration', 0)
+
+            results.append({
+                'title': sp_title,
+                'artist': sp_artist,
+                'album': sp_album,
+                'year': sp_year,
+                'duration': sp_duration,
+                'score': 0.0,
+                'source': 'spotify',
+                'raw': track
+            })
+
+        # Calculate match scores (all candidates in one pass)
+        self._score_results(title, artist, duration, results, min_confidence)
 
         return results
 
@@ -266,33 +604,141 @@ class MetadataFetcher:
         Returns:
             Score from 0 to 100
         """
+        return self._calc_score_normalized(
+            _normalize(query_title), _normalize(query_artist), query_duration,
+            _normalize(result_title), _normalize(result_artist), result_duration
+        )
+
+    def _calc_score_normalized(self, query_title: Optional[str], query_artist: Optional[str],
+                               query_duration: Optional[int],
+                               result_title: Optional[str], result_artist: Optional[str],
+                               result_duration: int,
+                               min_confidence: Optional[float] = None) -> float:
+        """
+        _calculate_match_score on strings already passed through _normalize
+
+        Lets callers normalize the query once per search instead of once
+        per candidate.
+
+        Args:
+            query_*: Normalized query parameters (None if empty)
+            result_*: Normalized result from API (None if empty)
+            min_confidence: If the title score plus the most the artist and
+                            duration could add stays below this, the
+                            artist comparison is skipped (optional)
+
+        Returns:
+            Score from 0 to 100 (partial, below min_confidence, on early exit)
+        """
+        # Duration similarity (20% weight)
+        duration_score = self._duration_score(query_duration, result_duration)
+
+        # Fast path: exact title and artist match (similarity 1.0 on both)
+        if (query_title is not None and query_artist is not None
+                and query_title == result_title and query_artist == result_artist):
+            return round(80.0 + duration_score, 2)
+
         # Title similarity (50% weight)
-        title_sim = self._string_similarity(query_title, result_title)
+        title_sim = _normalized_similarity(query_title, result_title)
         title_score = title_sim * 50
 
+        # Early exit: even a perfect artist match cannot reach min_confidence
+        # (compared after rounding, like the final score)
+        if min_confidence is not None:
+            max_remaining = 30 + (20 if query_duration else 0)
+            if round(title_score + max_remaining, 2) < min_confidence:
+                return round(title_score + duration_score, 2)
+
         # Artist similarity (30% weight)
-        artist_sim = self._string_similarity(query_artist, result_artist)
+        artist_sim = _normalized_similarity(query_artist, result_artist)
         artist_score = artist_sim * 30
 
-        # Duration similarity (20% weight)
-        duration_score = 0
+        total_score = title_score + artist_score + duration_score
+
+        return round(total_score, 2)
+
+    def _score_results(self, query_title: str, query_artist: str,
+                       query_duration: Optional[int], results: List[Dict],
+                       min_confidence: Optional[float] = None):
+        """
+        Set 'score' on every result, same scoring as _calculate_match_score
+
+        Large candidate lists are scored with one rapidfuzz.process.cdist
+        call per field instead of a Python-level call per pair.
+
+        Args:
+            query_*: Original query parameters
+            results: Results with 'title', 'artist', 'duration' (updated in place)
+            min_confidence: Early-exit threshold for per-pair scoring (optional)
+        """
+        if not RAPIDFUZZ_AVAILABLE or len(results) < CDIST_MIN_CANDIDATES:
+            # Normalize the query once, not per candidate
+            title_norm = _normalize(query_title)
+            artist_norm = _normalize(query_artist)
+            for result in results:
+                result['score'] = self._calc_score_normalized(
+                    title_norm, artist_norm, query_duration,
+                    _normalize(result['title']), _normalize(result['artist']),
+                    result['duration'], min_confidence
+                )
+            return
+
+        # Normalize the query and each candidate exactly once; empty strings
+        # (None after _normalize) score 0, as in _string_similarity
+        field_sims = []
+        for query, key in ((query_title, 'title'), (query_artist, 'artist')):
+            query_norm = _normalize(query)
+            if query_norm is None:
+                field_sims.append([0.0] * len(results))
+                continue
+            candidates = [_normalize(result[key]) for result in results]
+            ratios = process.cdist([query_norm], [c or '' for c in candidates],
+                                   scorer=fuzz.ratio, dtype=np.float64)[0]
+            field_sims.append([
+                float(ratio) / 100.0 if candidate is not None else 0.0
+                for ratio, candidate in zip(ratios, candidates)
+            ])
+
+        # Duration buckets for all candidates at once (as in _duration_score)
+        durations = np.array([result['duration'] or 0 for result in results], dtype=np.float64)
+        if query_duration:
+            diffs = np.abs(durations - query_duration)
+            duration_scores = np.select(
+                [diffs <= 3, diffs <= 10, diffs <= 30], [20, 15, 10], default=0
+            )
+            duration_scores[durations == 0] = 0  # Unknown result duration
+        else:
+            duration_scores = np.zeros(len(results))
+
+        total_scores = (np.array(field_sims[0]) * 50 + np.array(field_sims[1]) * 30
+                        + duration_scores)
+        for result, total_score in zip(results, total_scores.tolist()):
+            result['score'] = round(total_score, 2)
+
+    def _duration_score(self, query_duration: Optional[int], result_duration: int) -> int:
+        """
+        Duration part of the match score (0-20)
+
+        Args:
+            query_duration: Query duration in seconds (optional)
+            result_duration: Result duration in seconds
+
+        Returns:
+            20 (within 3s), 15 (10s), 10 (30s) or 0
+        """
         if query_duration and result_duration:
             duration_diff = abs(query_duration - result_duration)
             if duration_diff <= 3:
-                duration_score = 20  # Perfect match
+                return 20  # Perfect match
             elif duration_diff <= 10:
-                duration_score = 15  # Close match
+                return 15  # Close match
             elif duration_diff <= 30:
-                duration_score = 10  # Acceptable match
-            # else: 0 (poor match)
-
-        total_score = title_score + artist_score + duration_score
-
-        return round(total_score, 2)
+                return 10  # Acceptable match
+        return 0  # Poor or unknown match
 
     def _string_similarity(self, str1: str, str2: str) -> float:
         """
-        Calculate string similarity using SequenceMatcher
+        Calculate string similarity (rapidfuzz ratio, difflib fallback)
 
         Args:
             str1: First string
@@ -301,56 +747,34 @@ class MetadataFetcher:
         Returns:
             Similarity ratio (0.0 to 1.0)
         """
-        if not str1 or not str2:
-            return 0.0
-
-        # Normalize for comparison
-        str1 = str1.lower().strip()
-        str2 = str2.lower().strip()
-
-        return SequenceMatcher(None, str1, str2).ratio()
+        return _normalized_similarity(_normalize(str1), _normalize(str2))
 
     def _extract_artist_name(self, mb_recording: Dict) -> str:
         """Extract artist name from MusicBrainz recording"""
-        try:
-            artist_credit = mb_recording.get('artist-credit', [])
-            if artist_credit:
-                return artist_credit[0].get('name', 'Unknown Artist')
-        except:
-            pass
+        first = _first_dict(mb_recording.get('artist-credit'))
+        if first is not None:
+            return first.get('name', 'Unknown Artist')
         return 'Unknown Artist'
 
     def _extract_album_name(self, mb_recording: Dict) -> str:
         """Extract album name from MusicBrainz recording"""
-        try:
-            releases = mb_recording.get('releases', [])
-            if releases:
-                return releases[0].get('title', 'Unknown Album')
-        except:
-            pass
+        first = _first_dict(mb_recording.get('releases'))
+        if first is not None:
+            return first.get('title', 'Unknown Album')
         return 'Unknown Album'
 
     def _extract_year(self, mb_recording: Dict) -> Optional[int]:
         """Extract release year from MusicBrainz recording"""
-        try:
-            releases = mb_recording.get('releases', [])
-            if releases:
-                date_str = releases[0].get('date', '')
-                if date_str:
-                    return int(date_str[:4])
-        except:
-            pass
+        first = _first_dict(mb_recording.get('releases'))
+        if first is not None:
+            return _parse_year(first.get('date'))
         return None
 
     def _extract_spotify_year(self, track: Dict) -> Optional[int]:
         """Extract release year from Spotify track"""
-        try:
-            album = track.get('album', {})
-            release_date = album.get('release_date', '')
-            if release_date:
-                return int(release_date[:4])
-        except:
-            pass
+        album = track.get('album')
+        if isinstance(album, dict):
+            return _parse_year(album.get('release_date'))
         return None
 
     def get_best_match(self, results: List[Dict], min_confidence: float = 70.0) -> Optional[Dict]:
@@ -396,5 +820,14 @@ class MetadataFetcher:
         Returns:
             Best match metadata or None
         """
-        results = self.search_by_title_artist(title, artist, duration)
-        return self.get_best_match(results, min_confidence)
+        # Keep the first highest-scoring result (same pick as the sorted
+        # search_by_title_artist list); stop once a match is good enough
+        # that later sources cannot improve it meaningfully
+        best = None
+        for result in self.search_iter(title, artist, duration, min_confidence):
+            if best is None or result['score'] > best['score']:
+                best = result
+            if best['score'] >= PERFECT_MATCH_SCORE:
+                break
+
+        return self.get_best_match([best] if best else [], min_confidence)
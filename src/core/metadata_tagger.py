@@ -9,8 +9,10 @@ Features:
 - Handle missing/corrupt files gracefully
 """
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from mutagen.mp3 import MP3
 from mutagen.id3 import ID3, TIT2, TPE1, TALB, TDRC, TCON, APIC
 from core.metadata_autocompleter import MetadataAutocompleter
@@ -18,6 +20,47 @@ from core.metadata_autocompleter import MetadataAutocompleter
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# ID3 text encoding for written frames (3 = UTF-8)
+_ENCODING = 3
+
+# (metadata key, ID3 frame id, frame class, value conversion) written by tag_file
+_TAG_FRAMES = (
+    ('title', 'TIT2', TIT2, None),
+    ('artist', 'TPE1', TPE1, None),
+    ('album', 'TALB', TALB, None),
+    ('year', 'TDRC', TDRC, str),
+    ('genre', 'TCON', TCON, None),
+)
+
+# Cover art MIME type by image file extension
+_MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.webp': 'image/webp',
+}
+
+# Files tagged concurrently by tag_files (IO-bound: header parse + save)
+TAG_WORKERS = 8
+
+# Shared by all taggers (see _get_autocompleter)
+_AUTOCOMPLETER: Optional[MetadataAutocompleter] = None
+_AUTOCOMPLETER_LOCK = threading.Lock()
+
+
+def _get_autocompleter() -> MetadataAutocompleter:
+    """
+    Return the shared MetadataAutocompleter, creating it on first use
+
+    One instance means one MusicBrainz client (and rate limiter) and one
+    search cache for every tagger in the process.
+    """
+    global _AUTOCOMPLETER
+    with _AUTOCOMPLETER_LOCK:
+        if _AUTOCOMPLETER is None:
+            _AUTOCOMPLETER = MetadataAutocompleter()
+        return _AUTOCOMPLETER
+
 
 class MetadataTagger:
     """
@@ -39,7 +82,7 @@ class MetadataTagger:
         """
         Initialize metadata tagger
         """
-        self.autocompleter = MetadataAutocompleter()
+        self.autocompleter = _get_autocompleter()
         logger.info("MetadataTagger initialized")
 
     def tag_file(self, file_path: str, metadata: Dict) -> bool:
@@ -59,39 +102,15 @@ class MetadataTagger:
             True
         """
         try:
-            # Load MP3 file
-            audio = MP3(file_path, ID3=ID3)
-
-            # Add ID3 tag if not present
-            try:
-                audio.add_tags()
-            except Exception:
-                pass  # Tags already exist
-
-            # Write title (TIT2)
-            if 'title' in metadata and metadata['title']:
-                audio.tags['TIT2'] = TIT2(encoding=3, text=metadata['title'])
-                logger.debug(f"Tagged title: {metadata['title']}")
-
-            # Write artist (TPE1)
-            if 'artist' in metadata and metadata['artist']:
-                audio.tags['TPE1'] = TPE1(encoding=3, text=metadata['artist'])
-                logger.debug(f"Tagged artist: {metadata['artist']}")
-
-            # Write album (TALB)
-            if 'album' in metadata and metadata['album']:
-                audio.tags['TALB'] = TALB(encoding=3, text=metadata['album'])
-                logger.debug(f"Tagged album: {metadata['album']}")
-
-            # Write year (TDRC)
-            if 'year' in metadata and metadata['year']:
-                audio.tags['TDRC'] = TDRC(encoding=3, text=str(metadata['year']))
-                logger.debug(f"Tagged year: {metadata['year']}")
-
-            # Write genre (TCON)
-            if 'genre' in metadata and metadata['genre']:
-                audio.tags['TCON'] = TCON(encoding=3, text=metadata['genre'])
-                logger.debug(f"Tagged genre: {metadata['genre']}")
+            audio = self._open(file_path)
+
+            # Write only frames whose text differs from the current tags;
+            # if nothing changed, skip save() (it rewrites the ID3 header)
+            dirty = self._apply_tags(audio, metadata)
+
+            if not dirty:
+                logger.debug(f"Tags already up to date: {file_path}")
+                return True
 
             # Save tags
             audio.save()
@@ -107,6 +126,42 @@ class MetadataTagger:
             logger.error(f"Error tagging file {file_path}: {e}")
             return False
 
+    def tag_files(self, items: List[Tuple[str, Dict]], workers: int = TAG_WORKERS) -> List[bool]:
+        """
+        Tag many MP3 files concurrently
+
+        Items for the same file are applied in order by a single worker,
+        so a file is never written by two threads at once.
+
+        Args:
+            items (list): (file_path, metadata) pairs
+            workers (int): Max concurrent files
+
+        Returns:
+            list: tag_file result per item (same order as items)
+        """
+        # Group item indexes by file
+        by_path = {}
+        for index, (file_path, _) in enumerate(items):
+            by_path.setdefault(file_path, []).append(index)
+
+        results = [False] * len(items)
+
+        def tag_path(indexes):
+            for index in indexes:
+                file_path, metadata = items[index]
+                results[index] = self.tag_file(file_path, metadata)
+
+        if not by_path:
+            return results
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(by_path)))) as executor:
+            # list() re-raises any unexpected worker exception
+            list(executor.map(tag_path, by_path.values()))
+
+        logger.info(f"Tagged {sum(results)}/{len(items)} files")
+        return results
+
     def lookup_and_tag(self, file_path: str, metadata: Dict, min_confidence: int = 80) -> bool:
         """
         Lookup metadata on MusicBrainz and tag file
@@ -168,39 +223,14 @@ class MetadataTagger:
 
         Args:
             file_path (str): Path to MP3 file
-            image_path (str): Path to image file (JPG/PNG)
+            image_path (str): Path to image file (JPG/PNG/WebP)
 
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Load MP3 file
-            audio = MP3(file_path, ID3=ID3)
-
-            # Add ID3 tag if not present
-            try:
-                audio.add_tags()
-            except Exception:
-                pass
-
-            # Read image data
-            with open(image_path, 'rb') as img_file:
-                img_data = img_file.read()
-
-            # Determine MIME type
-            if image_path.lower().endswith('.png'):
-                mime = 'image/png'
-            else:
-                mime = 'image/jpeg'
-
-            # Embed cover art (APIC frame)
-            audio.tags['APIC'] = APIC(
-                encoding=3,
-                mime=mime,
-                type=3,  # Cover (front)
-                desc='Cover',
-                data=img_data
-            )
+            audio = self._open(file_path)
+            self._apply_album_art(audio, image_path)
 
             # Save
             audio.save()
@@ -215,3 +245,102 @@ class MetadataTagger:
         except Exception as e:
             logger.error(f"Error embedding album art: {e}")
             return False
+
+    def tag_and_art(self, file_path: str, metadata: Dict, image_path: str) -> bool:
+        """
+        Tag MP3 file and embed album art with a single load and save
+
+        Same result as tag_file followed by embed_album_art, but the file
+        is parsed once and the ID3 header is rewritten once.
+
+        Args:
+            file_path (str): Path to MP3 file
+            metadata (dict): Metadata dict (see tag_file)
+            image_path (str): Path to image file (JPG/PNG/WebP)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            audio = self._open(file_path)
+            self._apply_tags(audio, metadata)
+            self._apply_album_art(audio, image_path)
+
+            # Save tags and art together
+            audio.save()
+
+            logger.info(f"Successfully tagged with album art: {file_path}")
+            return True
+
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path} or {image_path}")
+            return False
+
+        except Exception as e:
+            logger.error(f"Error tagging file {file_path}: {e}")
+            return False
+
+    def _open(self, file_path: str):
+        """Load MP3 file, adding an ID3 tag if not present"""
+        audio = MP3(file_path, ID3=ID3)
+
+        try:
+            audio.add_tags()
+        except Exception:
+            pass  # Tags already exist
+
+        return audio
+
+    def _apply_tags(self, audio, metadata: Dict) -> bool:
+        """
+        Set ID3 text frames from metadata (frames already equal are left alone)
+
+        Args:
+            audio: Loaded MP3 (with tags)
+            metadata (dict): Metadata dict (see tag_file)
+
+        Returns:
+            bool: True if any frame was changed
+        """
+        tags = audio.tags
+        get = metadata.get
+        dirty = False
+        for key, frame_id, frame_class, convert in _TAG_FRAMES:
+            value = get(key)
+            if not value:
+                continue
+
+            text = convert(value) if convert else value
+            existing = tags.get(frame_id)
+            if existing is not None and [str(t) for t in existing.text] == [str(text)]:
+                continue
+
+            tags[frame_id] = frame_class(encoding=_ENCODING, text=text)
+            dirty = True
+            logger.debug(f"Tagged {key}: {value}")
+
+        return dirty
+
+    def _apply_album_art(self, audio, image_path: str):
+        """
+        Set the front cover APIC frame from an image file
+
+        Args:
+            audio: Loaded MP3 (with tags)
+            image_path (str): Path to image file (JPG/PNG/WebP)
+        """
+        # Read image data
+        with open(image_path, 'rb') as img_file:
+            img_data = img_file.read()
+
+        # Determine MIME type (JPEG for unknown extensions)
+        mime = _MIME_TYPES.get(Path(image_path).suffix.lower(), 'image/jpeg')
+
+        # Embed cover art (APIC frame)
+        audio.tags['APIC'] = APIC(
+            encoding=_ENCODING,
+            mime=mime,
+            type=3,  # Cover (front)
+            desc='Cover',
+            data=img_data
+        )
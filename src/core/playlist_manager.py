@@ -15,12 +15,24 @@ Created: November 13, 2025
 """
 import logging
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Max rows renumbered by one UPDATE ... CASE statement (3 bound parameters
+# per row, under SQLite's 999-parameter limit); larger playlists use
+# executemany in a single transaction
+POSITION_CASE_MAX_ROWS = 300
+
+# Write buffer for .m3u8 export (whole playlist in one or few writes)
+M3U_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Max file paths looked up per SELECT ... IN (...) when importing playlists
+# (one bound parameter each, under SQLite's 999-parameter limit)
+PATH_LOOKUP_CHUNK_SIZE = 900
+
 
 class PlaylistManager:
     """
@@ -135,11 +147,16 @@ class PlaylistManager:
             True if successful, False otherwise
         """
         try:
-            # Get current max position if not specified
             if position is None:
-                query = "SELECT MAX(position) as max_pos FROM playlist_songs WHERE playlist_id = ?"
-                result = self.db_manager.fetch_one(query, (playlist_id,))
-                position = (result['max_pos'] + 1) if result and result['max_pos'] is not None else 0
+                # Append: compute the next position inside the INSERT itself
+                query = """
+                INSERT INTO playlist_songs (playlist_id, song_id, position)
+                SELECT ?, ?, COALESCE(MAX(position) + 1, 0)
+                FROM playlist_songs WHERE playlist_id = ?
+                """
+                self.db_manager.execute_query(query, (playlist_id, song_id, playlist_id))
+                logger.debug(f"Added song {song_id} to end of playlist {playlist_id}")
+                return True
 
             # Insert song
             query = """
@@ -154,24 +171,61 @@ class PlaylistManager:
             logger.error(f"Failed to add song to playlist: {e}")
             return False
 
-    def remove_song(self, playlist_id: int, song_id: int) -> bool:
+    def add_songs_bulk(self, playlist_id: int, song_ids: List[int], start_position: int = 0) -> bool:
+        """
+        Add many songs to playlist in one transaction
+
+        Args:
+            playlist_id: Playlist ID
+            song_ids: Song IDs in playlist order
+            start_position: Position of the first song
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            rows = [
+                (playlist_id, song_id, start_position + i)
+                for i, song_id in enumerate(song_ids)
+            ]
+
+            query = """
+            INSERT INTO playlist_songs (playlist_id, song_id, position)
+            VALUES (?, ?, ?)
+            """
+            self.db_manager.execute_many(query, rows)
+            logger.debug(f"Added {len(rows)} songs to playlist {playlist_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to add songs to playlist: {e}")
+            return False
+
+    def remove_song(self, playlist_id: int, song_id: int, compact: bool = False) -> bool:
         """
         Remove song from playlist
 
+        Positions may have gaps afterwards; ordering (ORDER BY position),
+        appending and reorder_songs don't depend on them being contiguous.
+
         Args:
             playlist_id: Playlist ID
             song_id: Song ID to remove
+            compact: Renumber remaining songs to 0..n-1 (default: False)
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            query = "DELETE FROM playlist_songs WHERE playlist_id = ? AND song_id = ?"
-            self.db_manager.execute_query(query, (playlist_id, song_id))
-            logger.debug(f"Removed song {song_id} from playlist {playlist_id}")
+            with self.db_manager.transaction():
+                query = "DELETE FROM playlist_songs WHERE playlist_id = ? AND song_id = ?"
+                self.db_manager.execute_query(query, (playlist_id, song_id))
 
-            # Reorder remaining songs
-            self._reorder_playlist_songs(playlist_id)
+                # Reorder remaining songs (opt-in)
+                if compact:
+                    self._reorder_playlist_songs(playlist_id)
+
+            logger.debug(f"Removed song {song_id} from playlist {playlist_id}")
             return True
 
         except Exception as e:
@@ -191,28 +245,30 @@ class PlaylistManager:
             True if successful, False otherwise
         """
         try:
-            # Get all songs in order
-            query = """
-            SELECT id, song_id, position
-            FROM playlist_songs
-            WHERE playlist_id = ?
-            ORDER BY position
-            """
-            songs = self.db_manager.fetch_all(query, (playlist_id,))
-
-            if old_index < 0 or old_index >= len(songs):
-                return False
-            if new_index < 0 or new_index >= len(songs):
-                return False
-
-            # Move song
-            song_to_move = songs.pop(old_index)
-            songs.insert(new_index, song_to_move)
-
-            # Update positions
-            for i, song in enumerate(songs):
-                update_query = "UPDATE playlist_songs SET position = ? WHERE id = ?"
-                self.db_manager.execute_query(update_query, (i, song['id']))
+            # Read and renumber in one transaction (no writer in between)
+            with self.db_manager.transaction():
+                # Get all songs in order
+                query = """
+                SELECT id, song_id, position
+                FROM playlist_songs
+                WHERE playlist_id = ?
+                ORDER BY position
+                """
+                songs = self.db_manager.fetch_all(query, (playlist_id,))
+
+                if old_index < 0 or old_index >= len(songs):
+                    return False
+                if new_index < 0 or new_index >= len(songs):
+                    return False
+
+                # Move song
+                song_to_move = songs.pop(old_index)
+                songs.insert(new_index, song_to_move)
+
+                # Update positions (only rows that moved)
+                self._update_positions([
+                    (song['id'], i) for i, song in enumerate(songs) if song['position'] != i
+                ])
 
             logger.debug(f"Reordered playlist {playlist_id}: moved position {old_index} → {new_index}")
             return True
@@ -223,10 +279,13 @@ class PlaylistManager:
 
     def get_playlists(self) -> List[Dict]:
         """
-        Get all playlists with song counts
+        Get all playlists with song counts and total durations
+
+        Stats for every playlist come from one GROUP BY query; use this
+        instead of calling get_playlist_stats() per playlist.
 
         Returns:
-            List of playlist dictionaries
+            List of playlist dictionaries (incl. song_count, total_duration)
         """
         try:
             query = """
@@ -236,9 +295,11 @@ class PlaylistManager:
                 p.description,
                 p.created_date,
                 p.modified_date,
-                COUNT(ps.song_id) as song_count
+                COUNT(ps.song_id) as song_count,
+                COALESCE(SUM(s.duration), 0) as total_duration
             FROM playlists p
             LEFT JOIN playlist_songs ps ON p.id = ps.playlist_id
+            LEFT JOIN songs s ON ps.song_id = s.id
             GROUP BY p.id
             ORDER BY p.name
             """
@@ -296,19 +357,19 @@ class PlaylistManager:
             # Get playlist songs
             songs = self.get_playlist_songs(playlist_id)
 
-            # Write .m3u8 file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write('#EXTM3U\n')
+            # Build all lines, then write .m3u8 file in one buffered call
+            lines = ['#EXTM3U\n']
+            for song in songs:
+                duration = int(song.get('duration', 0))
+                artist = song.get('artist', 'Unknown Artist')
+                title = song.get('title', 'Unknown')
+                file_path_song = song.get('file_path', '')
 
-                for song in songs:
-                    duration = int(song.get('duration', 0))
-                    artist = song.get('artist', 'Unknown Artist')
-                    title = song.get('title', 'Unknown')
-                    file_path_song = song.get('file_path', '')
+                # Extended info + file path
+                lines.append(f'#EXTINF:{duration},{artist} - {title}\n{file_path_song}\n')
 
-                    # Write extended info
-                    f.write(f'#EXTINF:{duration},{artist} - {title}\n')
-                    f.write(f'{file_path_song}\n')
+            with open(file_path, 'w', encoding='utf-8', buffering=M3U_WRITE_BUFFER_SIZE) as f:
+                f.writelines(lines)
 
             logger.info(f"Saved playlist {playlist_id} to {file_path}")
             return True
@@ -337,46 +398,66 @@ class PlaylistManager:
             if name is None:
                 name = Path(file_path).stem
 
-            # Create new playlist
-            playlist_id = self.create_playlist(name, f"Imported from {Path(file_path).name}")
-
-            # Parse .m3u8 file
+            # Parse .m3u8 file line by line: file path lines only
+            # (skip empty lines and comments, incl. #EXTINF)
+            paths = []
             with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            position = 0
-            for i, line in enumerate(lines):
-                line = line.strip()
-
-                # Skip comments except #EXTINF
-                if line.startswith('#') and not line.startswith('#EXTINF'):
-                    continue
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        paths.append(line)
+
+            # Playlist and its songs are written together (one commit)
+            with self.db_manager.transaction():
+                # Create new playlist
+                playlist_id = self.create_playlist(name, f"Imported from {Path(file_path).name}")
+
+                # Find songs in database by file path, in a few IN (...) queries
+                path_to_id = self._find_song_ids_by_path(paths)
+                found = [path_to_id[path] for path in paths if path in path_to_id]
+
+                missing = len(paths) - len(found)
+                if missing:
+                    logger.warning(f"{missing} of {len(paths)} songs not found in database")
+
+                # A playlist holds each song once (UNIQUE (playlist_id, song_id)):
+                # keep the first occurrence of repeated entries
+                song_ids = list(dict.fromkeys(found))
+                if len(song_ids) < len(found):
+                    logger.warning(f"Skipped {len(found) - len(song_ids)} repeated songs")
+
+                # Insert all found songs at once
+                if not self.add_songs_bulk(playlist_id, song_ids):
+                    raise RuntimeError(f"Failed to add songs to playlist {playlist_id}")
+
+            logger.info(f"Loaded playlist from {file_path} (ID: {playlist_id}, {len(song_ids)} songs)")
+            return playlist_id
 
-                # Skip empty lines
-                if not line:
-                    continue
+        except Exception as e:
+            logger.error(f"Failed to load playlist: {e}")
+            return None
 
-                # Process file path lines
-                if not line.startswith('#'):
-                    song_path = line
+    def _find_song_ids_by_path(self, paths: List[str]) -> Dict[str, int]:
+        """
+        Internal: Map file paths to song IDs (paths not in the library are absent)
 
-                    # Try to find song in database by file path
-                    query = "SELECT id FROM songs WHERE file_path = ?"
-                    result = self.db_manager.fetch_one(query, (song_path,))
+        Args:
+            paths: File paths (duplicates allowed)
 
-                    if result:
-                        song_id = result['id']
-                        self.add_song(playlist_id, song_id, position)
-                        position += 1
-                    else:
-                        logger.warning(f"Song not found in database: {song_path}")
+        Returns:
+            Dictionary of file_path -> song ID
+        """
+        unique_paths = list(dict.fromkeys(paths))
+        path_to_id = {}
 
-            logger.info(f"Loaded playlist from {file_path} (ID: {playlist_id}, {position} songs)")
-            return playlist_id
+        for start in range(0, len(unique_paths), PATH_LOOKUP_CHUNK_SIZE):
+            chunk = unique_paths[start:start + PATH_LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" for _ in chunk)
+            query = f"SELECT id, file_path FROM songs WHERE file_path IN ({placeholders})"
+            for row in self.db_manager.fetch_all(query, tuple(chunk)):
+                path_to_id[row['file_path']] = row['id']
 
-        except Exception as e:
-            logger.error(f"Failed to load playlist: {e}")
-            return None
+        return path_to_id
 
     def duplicate_playlist(self, playlist_id: int, new_name: Optional[str] = None) -> Optional[int]:
         """
@@ -390,25 +471,30 @@ class PlaylistManager:
             New playlist ID if successful, None otherwise
         """
         try:
-            # Get original playlist
-            query = "SELECT * FROM playlists WHERE id = ?"
-            original = self.db_manager.fetch_one(query, (playlist_id,))
-
-            if not original:
-                logger.error(f"Playlist not found: {playlist_id}")
-                return None
-
-            # Generate new name
-            if new_name is None:
-                new_name = f"Copy of {original['name']}"
-
-            # Create new playlist
-            new_id = self.create_playlist(new_name, original.get('description', ''))
-
-            # Copy all songs
-            songs = self.get_playlist_songs(playlist_id)
-            for song in songs:
-                self.add_song(new_id, song['id'], song['position'])
+            with self.db_manager.transaction():
+                # Get original playlist
+                query = "SELECT * FROM playlists WHERE id = ?"
+                original = self.db_manager.fetch_one(query, (playlist_id,))
+
+                if not original:
+                    logger.error(f"Playlist not found: {playlist_id}")
+                    return None
+
+                # Generate new name
+                if new_name is None:
+                    new_name = f"Copy of {original['name']}"
+
+                # Create new playlist
+                new_id = self.create_playlist(new_name, original.get('description', ''))
+
+                # Copy all songs inside the database (no rows through Python)
+                query = """
+                INSERT INTO playlist_songs (playlist_id, song_id, position)
+                SELECT ?, song_id, position
+                FROM playlist_songs WHERE playlist_id = ?
+                ORDER BY position
+                """
+                self.db_manager.execute_query(query, (new_id, playlist_id))
 
             logger.info(f"Duplicated playlist {playlist_id} → {new_id}")
             return new_id
@@ -419,7 +505,8 @@ class PlaylistManager:
 
     def get_playlist_stats(self, playlist_id: int) -> Dict:
         """
-        Get playlist statistics
+        Get playlist statistics (single playlist, e.g. a detail view;
+        get_playlists() already includes them for every playlist)
 
         Args:
             playlist_id: Playlist ID
@@ -455,18 +542,44 @@ class PlaylistManager:
             playlist_id: Playlist ID
         """
         try:
-            # Get all songs ordered by position
-            query = """
-            SELECT id FROM playlist_songs
-            WHERE playlist_id = ?
-            ORDER BY position
-            """
-            songs = self.db_manager.fetch_all(query, (playlist_id,))
-
-            # Update positions sequentially
-            for i, song in enumerate(songs):
-                update_query = "UPDATE playlist_songs SET position = ? WHERE id = ?"
-                self.db_manager.execute_query(update_query, (i, song['id']))
+            with self.db_manager.transaction():
+                # Get all songs ordered by position
+                query = """
+                SELECT id, position FROM playlist_songs
+                WHERE playlist_id = ?
+                ORDER BY position
+                """
+                songs = self.db_manager.fetch_all(query, (playlist_id,))
+
+                # Update positions sequentially (only rows after a gap change)
+                self._update_positions([
+                    (song['id'], i) for i, song in enumerate(songs) if song['position'] != i
+                ])
 
         except Exception as e:
             logger.error(f"Failed to reorder playlist songs: {e}")
+
+    def _update_positions(self, updates: List[Tuple[int, int]]):
+        """
+        Internal: Set positions of many playlist_songs rows in one statement
+
+        Args:
+            updates: List of (playlist_songs.id, new position) pairs
+        """
+        if not updates:
+            return
+
+        if len(updates) <= POSITION_CASE_MAX_ROWS:
+            # One UPDATE ... SET position = CASE id WHEN ? THEN ? ... END
+            cases = " ".join("WHEN ? THEN ?" for _ in updates)
+            placeholders = ",".join("?" for _ in updates)
+            query = (
+                f"UPDATE playlist_songs SET position = CASE id {cases} END "
+                f"WHERE id IN ({placeholders})"
+            )
+            params = [value for row_id, position in updates for value in (row_id, position)]
+            params.extend(row_id for row_id, _ in updates)
+            self.db_manager.execute_query(query, tuple(params))
+        else:
+            query = "UPDATE playlist_songs SET position = ? WHERE id = ?"
+            self.db_manager.execute_many(query, [(position, row_id) for row_id, position in updates])
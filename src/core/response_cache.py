@@ -0,0 +1,137 @@
+"""
+Response Cache - Persistent cache for metadata API responses
+
+Purpose: Skip MusicBrainz/Spotify round-trips on repeat library scans
+- SQLite-backed (one small file, no extra dependencies)
+- Stale-while-revalidate: fresh entries are returned as-is, stale entries
+  are returned immediately and flagged so the caller can refresh them
+- Safe to share between threads
+
+Created: November 19, 2025
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Entries younger than this are fresh (served without revalidation)
+FRESH_TTL = 24 * 60 * 60
+
+# Entries older than this are dropped; between FRESH_TTL and STALE_TTL they
+# are served stale and revalidated in the background
+STALE_TTL = 30 * 24 * 60 * 60
+
+
+class ResponseCache:
+    """
+    Stale-while-revalidate cache of JSON-serializable API responses
+
+    Usage:
+        cache = ResponseCache("~/.nexus_music/api_cache.db")
+        value, fresh = cache.get(key)
+        if value is None:
+            value = fetch()
+            cache.set(key, value)
+        elif not fresh:
+            refresh_in_background(key)
+    """
+
+    def __init__(self, db_path: str, fresh_ttl: float = FRESH_TTL, stale_ttl: float = STALE_TTL):
+        """
+        Open (or create) the cache database
+
+        Args:
+            db_path: SQLite file path (parent directories are created)
+            fresh_ttl: Seconds an entry stays fresh
+            stale_ttl: Seconds an entry may be served at all
+        """
+        self.db_path = Path(db_path).expanduser()
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection guarded by a lock (lookups are tiny)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+        logger.info(f"ResponseCache opened: {self.db_path}")
+
+    def get(self, key: str) -> Tuple[Optional[Any], bool]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, is_fresh); value is None on a miss or an expired entry
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, stored_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None, False
+
+        if row is None:
+            return None, False
+
+        value, stored_at = row
+        age = time.time() - stored_at
+        if age > self.stale_ttl:
+            return None, False
+
+        return json.loads(value), age <= self.fresh_ttl
+
+    def set(self, key: str, value: Any):
+        """
+        Store a response (replaces any previous entry for the key)
+
+        Args:
+            key: Cache key
+            value: JSON-serializable response
+        """
+        try:
+            payload = json.dumps(value)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, stored_at) VALUES (?, ?, ?)",
+                    (key, payload, time.time())
+                )
+        except (TypeError, ValueError, sqlite3.Error) as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    def prune(self) -> int:
+        """
+        Delete entries past the stale window
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            with self._lock, self._conn:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE stored_at < ?", (time.time() - self.stale_ttl,)
+                )
+            return max(cursor.rowcount, 0)
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache prune failed: {e}")
+            return 0
+
+    def close(self):
+        """Close the cache database"""
+        with self._lock:
+            self._conn.close()
@@ -1,20 +1,43 @@
 """
 Spectrum Extraction Worker - Asynchronous FFT Processing
 
-Background thread for extracting spectrum data without blocking UI.
+Background task for extracting spectrum data without blocking UI.
+Workers run on a dedicated QThreadPool so OS threads are reused across files.
 
 Created: November 20, 2025
 """
 import logging
+import os
 from pathlib import Path
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 logger = logging.getLogger(__name__)
 
+# FFT extraction is CPU-bound: one pool thread per core
+SPECTRUM_MAX_THREADS = os.cpu_count() or 1
 
-class SpectrumWorker(QThread):
+# Pool for SpectrumWorker only (created on first use); sizing it leaves
+# QThreadPool.globalInstance() to the rest of the application
+_spectrum_pool = None
+
+
+def spectrum_thread_pool() -> QThreadPool:
     """
-    Background worker for spectrum extraction
+    Get the thread pool SpectrumWorker tasks are submitted to
+
+    Returns:
+        QThreadPool: Dedicated pool, sized to SPECTRUM_MAX_THREADS
+    """
+    global _spectrum_pool
+    if _spectrum_pool is None:
+        _spectrum_pool = QThreadPool()
+        _spectrum_pool.setMaxThreadCount(SPECTRUM_MAX_THREADS)
+    return _spectrum_pool
+
+
+class WorkerSignals(QObject):
+    """
+    Signals for SpectrumWorker (QRunnable is not a QObject)
 
     Signals:
         progress: Emits progress updates (int: 0-100)
@@ -22,11 +45,22 @@ class SpectrumWorker(QThread):
         error: Emits error message if extraction fails (str)
     """
 
-    # Signals
     progress = pyqtSignal(int)  # Progress percentage (0-100)
     finished = pyqtSignal(object, float)  # (spectrum_data, duration)
     error = pyqtSignal(str)  # Error message
 
+
+class SpectrumWorker(QRunnable):
+    """
+    Background worker for spectrum extraction
+
+    Connect to worker.signals, then submit with
+    spectrum_thread_pool().start(worker). A running extraction cannot be
+    interrupted; cancel() makes the worker drop its result instead (a
+    queued worker exits without extracting). Several workers may share
+    one WaveformExtractor concurrently.
+    """
+
     def __init__(self, waveform_extractor, file_path: str, num_bars: int = 60):
         """
         Initialize spectrum worker
@@ -37,19 +71,43 @@ class SpectrumWorker(QThread):
             num_bars: Number of frequency bars (default: 60)
         """
         super().__init__()
+        self.signals = WorkerSignals()
         self.waveform_extractor = waveform_extractor
         self.file_path = file_path
         self.num_bars = num_bars
+        self._cancelled = False
+        self._last_progress = -1
+
+    def cancel(self):
+        """Discard this worker's result (e.g. another song was loaded)"""
+        self._cancelled = True
+
+    def _emit_progress(self, pct: int):
+        """
+        Emit progress only when it advanced by at least 1%
+
+        Each emit is a queued cross-thread call; finer-grained updates
+        would flood the UI event loop without visible change.
+
+        Args:
+            pct: Progress percentage (0-100)
+        """
+        if pct - self._last_progress >= 1:
+            self._last_progress = pct
+            self.signals.progress.emit(pct)
 
     def run(self):
         """
-        Run spectrum extraction in background thread
+        Run spectrum extraction on a pool thread
 
-        DO NOT call directly - use start() instead
+        DO NOT call directly - submit to spectrum_thread_pool() instead
         """
+        if self._cancelled:
+            return
+
         try:
             logger.info(f"Starting spectrum extraction: {Path(self.file_path).name}")
-            self.progress.emit(10)
+            self._emit_progress(10)
 
             # Extract spectrum data (FFT analysis)
             spectrum_result = self.waveform_extractor.extract_spectrum(
@@ -58,7 +116,11 @@ class SpectrumWorker(QThread):
                 window_size_ms=50
             )
 
-            self.progress.emit(90)
+            if self._cancelled:
+                logger.debug(f"Spectrum extraction cancelled: {Path(self.file_path).name}")
+                return
+
+            self._emit_progress(90)
 
             if spectrum_result:
                 spectrum_data, duration = spectrum_result
@@ -66,14 +128,15 @@ class SpectrumWorker(QThread):
                     f"Spectrum extracted: {len(spectrum_data)} windows, "
                     f"{duration:.1f}s, {self.num_bars} bars"
                 )
-                self.progress.emit(100)
-                self.finished.emit(spectrum_data, duration)
+                self._emit_progress(100)
+                self.signals.finished.emit(spectrum_data, duration)
             else:
                 error_msg = "Failed to extract spectrum data"
                 logger.warning(error_msg)
-                self.error.emit(error_msg)
+                self.signals.error.emit(error_msg)
 
         except Exception as e:
             error_msg = f"Spectrum extraction error: {str(e)}"
             logger.error(error_msg)
-            self.error.emit(error_msg)
+            if not self._cancelled:
+                self.signals.error.emit(error_msg)
@@ -53,6 +53,17 @@ class ThemeManager:
             return
 
         self.current_theme = "dark"  # Default theme
+
+        # QSS content per theme (files don't change at runtime; see reload_themes)
+        self._qss_cache = {}
+        self._qss_preloaded = False
+
+        # Theme currently set on QApplication (None until first apply_theme)
+        self._applied_theme: Optional[str] = None
+
+        # Theme last written to config (None if nothing persisted yet)
+        self._last_saved_theme: Optional[str] = None
+
         self._load_preference()
 
         self._initialized = True
@@ -68,12 +79,13 @@ class ThemeManager:
         """
         return self.current_theme
 
-    def apply_theme(self, theme_name: str) -> None:
+    def apply_theme(self, theme_name: str, persist: bool = True) -> None:
         """
         Apply theme to application
 
         Args:
             theme_name: Name of theme to apply ('dark' or 'light')
+            persist: Save the theme as user preference (False for transient previews)
 
         Raises:
             ValueError: If theme_name is not valid
@@ -81,7 +93,19 @@ class ThemeManager:
         if theme_name not in self.THEMES:
             raise ValueError(f"Invalid theme: {theme_name}. Valid themes: {self.THEMES}")
 
-        # Load QSS stylesheet
+        # Already applied: nothing to restyle, only persist if requested
+        if theme_name == self._applied_theme:
+            if persist:
+                self._save_preference()
+            return
+
+        # Read every theme's stylesheet once, so later toggles skip disk I/O
+        if not self._qss_preloaded:
+            self._qss_preloaded = True
+            for name in self.THEMES:
+                self._load_qss(name)
+
+        # Load QSS stylesheet (cached)
         qss_content = self._load_qss(theme_name)
 
         # Apply to QApplication
@@ -91,9 +115,11 @@ class ThemeManager:
 
         # Update current theme
         self.current_theme = theme_name
+        self._applied_theme = theme_name
 
-        # Save preference
-        self._save_preference()
+        # Save preference (skipped if unchanged)
+        if persist:
+            self._save_preference()
 
         logger.info(f"Applied theme: {theme_name}")
 
@@ -112,9 +138,15 @@ class ThemeManager:
 
         return new_theme
 
+    def reload_themes(self) -> None:
+        """Forget cached stylesheets so the next apply_theme re-reads QSS files"""
+        self._qss_cache.clear()
+        self._qss_preloaded = False
+        logger.debug("Theme stylesheet cache cleared")
+
     def _load_qss(self, theme_name: str) -> str:
         """
-        Load QSS stylesheet from file
+        Load QSS stylesheet from file (cached after the first successful read)
 
         Args:
             theme_name: Name of theme to load
@@ -122,6 +154,10 @@ class ThemeManager:
         Returns:
             str: QSS content (or empty string if file not found)
         """
+        cached = self._qss_cache.get(theme_name)
+        if cached is not None:
+            return cached
+
         # Path to QSS file
         themes_dir = Path(__file__).parent.parent / "gui" / "themes"
         qss_file = themes_dir / f"{theme_name}.qss"
@@ -133,6 +169,7 @@ class ThemeManager:
                     qss_content = f.read()
 
                 logger.debug(f"Loaded QSS: {qss_file} ({len(qss_content)} chars)")
+                self._qss_cache[theme_name] = qss_content
                 return qss_content
 
             except Exception as e:
@@ -143,7 +180,10 @@ class ThemeManager:
             return ""
 
     def _save_preference(self) -> None:
-        """Save current theme preference to config file"""
+        """Save current theme preference to config file (no-op if unchanged)"""
+        if self.current_theme == self._last_saved_theme:
+            return
+
         # Ensure config directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -163,6 +203,7 @@ class ThemeManager:
 
             # Rename temp file to actual config (atomic on most filesystems)
             temp_path.replace(self.config_path)
+            self._last_saved_theme = self.current_theme
 
             logger.debug(f"Saved theme preference: {self.current_theme}")
 
@@ -189,6 +230,7 @@ class ThemeManager:
             # Validate theme
             if theme in self.THEMES:
                 self.current_theme = theme
+                self._last_saved_theme = theme
                 logger.info(f"Loaded theme preference: {theme}")
             else:
                 logger.warning(f"Invalid theme in config: {theme}, using default")
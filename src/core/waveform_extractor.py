@@ -14,13 +14,43 @@ Features:
 Created: November 15, 2025
 Updated: November 20, 2025 - Added spectrum analysis
 """
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Max waveforms/spectra kept in memory (least recently used evicted first)
+WAVEFORM_CACHE_SIZE = 256
+
+# numpy dtype of pydub raw_data by sample width in bytes (signed little-endian
+# PCM, as in AudioSegment.get_array_of_samples)
+_SAMPLE_DTYPES = {1: np.dtype('i1'), 2: np.dtype('<i2'), 4: np.dtype('<i4')}
+
+# Extracted waveforms persisted across runs (one .npz per file + num_points)
+WAVEFORM_CACHE_DIR = Path.home() / ".nexus_music" / "waveform_cache"
+
+# Formats decoded in-process by libsndfile (soundfile) instead of pydub/ffmpeg
+SOUNDFILE_FORMATS = {'.wav', '.flac', '.ogg'}
+
+# Cached spectra are quantized to uint8 (0..SPECTRUM_LEVELS); bar heights
+# need far less than the 1/255 resolution this keeps
+SPECTRUM_LEVELS = 255
+
+# Spectrum windows transformed per batched FFT call (bounds the temporary
+# window/FFT arrays to a few MB regardless of track length)
+SPECTRUM_BATCH_WINDOWS = 512
+
+# Frames decoded per read when streaming a waveform with soundfile
+# (~4 MB of float32 stereo; the whole file is never held in memory)
+SOUNDFILE_BLOCK_FRAMES = 1 << 19
+
 # Try to import pydub (main method)
 try:
     from pydub import AudioSegment
@@ -29,6 +59,99 @@ except ImportError:
     PYDUB_AVAILABLE = False
     logger.warning("pydub not available - waveform extraction limited")
 
+# Try to import soundfile (fast WAV/FLAC/OGG decoding, falls back to pydub);
+# raises OSError when the libsndfile library itself is missing
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDFILE_AVAILABLE = False
+
+# Try to import scipy.fft (multi-threaded FFT, falls back to numpy.fft)
+try:
+    from scipy import fft as scipy_fft
+    SCIPY_FFT_AVAILABLE = True
+except ImportError:
+    SCIPY_FFT_AVAILABLE = False
+
+# Try to import numba (fused parallel RMS kernel, falls back to numpy)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rms_downsample(samples, points, samples_per_point):
+        """
+        RMS of consecutive samples_per_point-sample rows, one pass
+
+        Squares are summed as exact int64 (no float copy of the samples);
+        rows are spread across threads.
+
+        Args:
+            samples: 8/16-bit integer PCM samples
+            points: Number of rows (output points)
+            samples_per_point: Samples per row
+
+        Returns:
+            float32 array of RMS values
+        """
+        rms = np.empty(points, dtype=np.float32)
+        for i in prange(points):
+            start = i * samples_per_point
+            total = 0
+            for j in range(start, start + samples_per_point):
+                value = np.int64(samples[j])
+                total += value * value
+            rms[i] = np.sqrt(total / samples_per_point)
+        return rms
+
+
+@lru_cache(maxsize=8)
+def _hanning_window(size: int) -> np.ndarray:
+    """Hanning window of the given size, shared across extractions (read-only)"""
+    window = np.hanning(size)
+    window.setflags(write=False)
+    return window
+
+
+@lru_cache(maxsize=8)
+def _bar_plan(total_bins: int, num_bars: int) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Bin ranges of logarithmically spaced spectrum bars
+
+    Uses logarithmic distribution for frequency bins: this matches human
+    perception (we hear bass/treble differently).
+
+    Args:
+        total_bins: Number of FFT magnitude bins
+        num_bars: Number of bars
+
+    Returns:
+        Tuple of (interleaved start/end bin indices for np.add.reduceat,
+        bins per bar, whether the last end index is past the last bin)
+    """
+    # Create logarithmic frequency boundaries
+    # Start from 20 Hz (below human hearing) to Nyquist frequency
+    log_min = np.log10(20)
+    log_max = np.log10(total_bins)
+    log_boundaries = np.logspace(log_min, log_max, num_bars + 1, base=10)
+
+    # Convert to bin indices
+    bin_boundaries = np.clip(log_boundaries.astype(int), 0, total_bins - 1)
+
+    # Every bar covers at least one bin
+    starts = bin_boundaries[:-1]
+    ends = np.maximum(bin_boundaries[1:], starts + 1)
+
+    indices = np.empty(2 * num_bars, dtype=np.intp)
+    indices[0::2] = starts
+    indices[1::2] = ends
+    return indices, (ends - starts).astype(np.float64), bool(ends.max() >= total_bins)
+
 
 class WaveformExtractor:
     """
@@ -37,15 +160,28 @@ class WaveformExtractor:
     Usage:
         extractor = WaveformExtractor()
         waveform = extractor.extract(file_path, num_points=1000)
-        # waveform is list of floats [-1.0, 1.0]
+        # waveform is a read-only float32 ndarray in [-1.0, 1.0]
     """
 
-    def __init__(self):
-        """Initialize Waveform Extractor"""
-        self.cache = {}  # Cache extracted waveforms
+    def __init__(self, cache_dir: Optional[str] = str(WAVEFORM_CACHE_DIR),
+                 cache_size: int = WAVEFORM_CACHE_SIZE):
+        """
+        Initialize Waveform Extractor
+
+        Args:
+            cache_dir: Directory for persisted waveforms (None disables)
+            cache_size: Max waveforms/spectra kept in memory
+        """
+        # Cache extracted waveforms (float32) and spectra (uint8), LRU-bounded
+        self.cache = OrderedDict()
+        # Guards self.cache: extract() runs on the GUI thread while
+        # extract_spectrum() runs on SpectrumWorker pool threads
+        self._cache_lock = threading.Lock()
+        self.cache_size = cache_size
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
         logger.info("WaveformExtractor initialized")
 
-    def extract(self, file_path: str, num_points: int = 1000) -> Optional[List[float]]:
+    def extract(self, file_path: str, num_points: int = 1000) -> Optional[np.ndarray]:
         """
         Extract waveform from audio file
 
@@ -54,30 +190,64 @@ class WaveformExtractor:
             num_points: Number of waveform points to extract (default: 1000)
 
         Returns:
-            List of amplitude values [-1.0, 1.0] or None if extraction failed
+            float32 array of amplitude values [-1.0, 1.0] (read-only, shared
+            with the cache; call .copy() or .tolist() to modify) or None if
+            extraction failed
         """
         # Check cache first
         cache_key = f"{file_path}_{num_points}"
-        if cache_key in self.cache:
+        cached = self._cache_get(cache_key)
+        if cached is not None:
             logger.debug(f"Waveform loaded from cache: {Path(file_path).name}")
-            return self.cache[cache_key]
+            return cached
 
         # Check if file exists
         if not Path(file_path).exists():
             logger.error(f"File not found: {file_path}")
             return None
 
-        # Extract waveform
+        # A finer waveform of this file already in memory: downsample it
+        # instead of decoding the file again
+        resampled = self._resample_cached(file_path, num_points)
+        if resampled is not None:
+            resampled.setflags(write=False)
+            self._cache_put(cache_key, resampled)
+            logger.debug(f"Waveform resampled from cache: {Path(file_path).name}")
+            return resampled
+
+        # Then the on-disk cache (skips decoding entirely)
+        stored = self._load_from_disk(file_path, num_points)
+        if stored is not None:
+            stored.setflags(write=False)
+            self._cache_put(cache_key, stored)
+            logger.debug(f"Waveform loaded from disk cache: {Path(file_path).name}")
+            return stored
+
+        # Extract waveform (soundfile for formats it reads, else pydub)
         try:
-            if PYDUB_AVAILABLE:
-                waveform = self._extract_with_pydub(file_path, num_points)
-            else:
-                logger.warning("pydub not available - using fallback method")
-                waveform = self._extract_fallback(file_path, num_points)
-
-            # Cache result
-            if waveform:
-                self.cache[cache_key] = waveform
+            waveform = None
+            decoded = True
+            if self._soundfile_supports(file_path):
+                waveform = self._extract_with_soundfile(file_path, num_points)
+
+            if waveform is None:
+                if PYDUB_AVAILABLE:
+                    waveform = self._extract_with_pydub(file_path, num_points)
+                else:
+                    logger.warning("pydub not available - using fallback method")
+                    waveform = self._extract_fallback(file_path, num_points)
+                    decoded = False
+
+            if waveform is None:
+                return None
+            waveform = np.asarray(waveform, dtype=np.float32)
+
+            # Cache result (simulated fallback waveforms are not persisted)
+            if len(waveform):
+                waveform.setflags(write=False)
+                self._cache_put(cache_key, waveform)
+                if decoded:
+                    self._save_to_disk(file_path, num_points, waveform)
                 logger.info(f"Waveform extracted: {Path(file_path).name} ({len(waveform)} points)")
 
             return waveform
@@ -86,7 +256,7 @@ class WaveformExtractor:
             logger.error(f"Failed to extract waveform from {file_path}: {e}")
             return None
 
-    def _extract_with_pydub(self, file_path: str, num_points: int) -> Optional[List[float]]:
+    def _extract_with_pydub(self, file_path: str, num_points: int) -> Optional[np.ndarray]:
         """
         Extract waveform using pydub (supports MP3, WAV, FLAC, etc.)
 
@@ -95,7 +265,7 @@ class WaveformExtractor:
             num_points: Number of points to extract
 
         Returns:
-            List of amplitude values [-1.0, 1.0]
+            float32 array of amplitude values [-1.0, 1.0]
         """
         try:
             # Load audio file
@@ -106,45 +276,158 @@ class WaveformExtractor:
                 audio = audio.set_channels(1)
 
             # Get raw audio data as numpy array
-            samples = np.array(audio.get_array_of_samples())
+            samples = self._get_samples(audio)
 
-            # Normalize to [-1.0, 1.0]
-            # pydub uses 16-bit signed integers (-32768 to 32767)
-            max_amplitude = 2 ** (audio.sample_width * 8 - 1)
-            normalized_samples = samples.astype(float) / max_amplitude
+            return self._rms_waveform(samples, num_points)
+
+        except Exception as e:
+            logger.error(f"pydub extraction failed: {e}")
+            return None
 
-            # Downsample to num_points
-            total_samples = len(normalized_samples)
-            samples_per_point = max(1, total_samples // num_points)
+    def _extract_with_soundfile(self, file_path: str, num_points: int) -> Optional[np.ndarray]:
+        """
+        Extract waveform using soundfile (WAV, FLAC, OGG; no ffmpeg process)
 
-            waveform = []
-            for i in range(num_points):
-                start_idx = i * samples_per_point
-                end_idx = min(start_idx + samples_per_point, total_samples)
+        Streams the file in blocks of whole points (SOUNDFILE_BLOCK_FRAMES),
+        so memory stays bounded for long files; same values as
+        _rms_waveform() over the fully decoded samples (up to float32
+        rounding).
 
-                if start_idx >= total_samples:
-                    break
+        Args:
+            file_path: Path to audio file
+            num_points: Number of points to extract
 
-                # Get RMS (root mean square) for this segment
-                segment = normalized_samples[start_idx:end_idx]
-                rms = np.sqrt(np.mean(segment ** 2))
+        Returns:
+            float32 array of amplitude values [-1.0, 1.0], or None to fall
+            back to pydub
+        """
+        try:
+            with sf.SoundFile(file_path) as f:
+                samples_per_point = max(1, f.frames // num_points)
+                points = min(num_points, f.frames // samples_per_point)
+                points_per_block = max(1, SOUNDFILE_BLOCK_FRAMES // samples_per_point)
+
+                sums = np.zeros(points, dtype=np.float32)
+                for start in range(0, points, points_per_block):
+                    rows = min(points_per_block, points - start)
+                    block = f.read(rows * samples_per_point, dtype='float32', always_2d=True)
+
+                    # Mix down to mono; stop early if the header overstated frames
+                    mono = block.mean(axis=1, dtype=np.float32)
+                    rows = len(mono) // samples_per_point
+                    segments = mono[:rows * samples_per_point].reshape(rows, samples_per_point)
+                    sums[start:start + rows] = np.einsum('ij,ij->i', segments, segments)
+                    if rows < min(points_per_block, points - start):
+                        points = start + rows
+                        break
 
-                # Use RMS as amplitude (gives better visual representation)
-                waveform.append(float(rms))
+        except Exception as e:
+            logger.debug(f"soundfile could not read {Path(file_path).name}, using pydub: {e}")
+            return None
 
-            # Normalize to [-1.0, 1.0] range with some headroom
-            if waveform:
-                max_val = max(abs(min(waveform)), abs(max(waveform)))
-                if max_val > 0:
-                    waveform = [v / max_val * 0.9 for v in waveform]  # 0.9 for headroom
+        if points == 0:
+            return np.empty(0, dtype=np.float32)
+        return self._normalize_waveform(np.sqrt(sums[:points] / samples_per_point))
 
-            return waveform
+    def _rms_waveform(self, samples: np.ndarray, num_points: int) -> np.ndarray:
+        """
+        Downsample mono samples to num_points RMS values, normalized
+
+        Args:
+            samples: Mono samples (integer PCM or float)
+            num_points: Number of points to extract
+
+        Returns:
+            float32 array of amplitude values [0, 0.9]
+        """
+        # Downsample to num_points: one row of samples per point
+        # (trailing samples that don't fill a row are dropped)
+        total_samples = len(samples)
+        samples_per_point = max(1, total_samples // num_points)
+        points = min(num_points, total_samples // samples_per_point)
+        if points == 0:
+            return np.empty(0, dtype=np.float32)
+
+        # RMS (root mean square) per segment. RMS gives a better visual
+        # representation than peaks
+        if NUMBA_AVAILABLE and samples.dtype.kind == 'i' and samples.dtype.itemsize <= 2:
+            # Fused integer kernel (int64 sums can't overflow for 8/16-bit)
+            rms = _rms_downsample(samples, points, samples_per_point)
+        else:
+            segments = samples[:points * samples_per_point].reshape(
+                points, samples_per_point
+            ).astype(np.float32, copy=False)
+
+            # All segments at once; einsum sums the squares without a
+            # temporary squared array
+            rms = np.sqrt(np.einsum('ij,ij->i', segments, segments) / samples_per_point)
+
+        return self._normalize_waveform(rms)
+
+    def _normalize_waveform(self, rms: np.ndarray) -> np.ndarray:
+        """
+        Scale RMS values in place to [0, 0.9] (0.9 for headroom)
 
+        Scaling samples to [-1.0, 1.0] by the sample width first would
+        cancel out here.
+
+        Args:
+            rms: float32 RMS values
+
+        Returns:
+            The same array, normalized
+        """
+        max_val = rms.max()
+        if max_val > 0:
+            rms *= 0.9 / max_val
+        return rms
+
+    def _soundfile_supports(self, file_path: str) -> bool:
+        """Whether file_path can be decoded with soundfile"""
+        return SOUNDFILE_AVAILABLE and Path(file_path).suffix.lower() in SOUNDFILE_FORMATS
+
+    def _read_soundfile(self, file_path: str) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Decode an audio file to mono float32 samples with soundfile
+
+        Args:
+            file_path: Path to WAV/FLAC/OGG file
+
+        Returns:
+            Tuple of (samples in [-1.0, 1.0], sample_rate), or None if
+            soundfile can't read the file
+        """
+        try:
+            samples, sample_rate = sf.read(file_path, dtype='float32', always_2d=False)
         except Exception as e:
-            logger.error(f"pydub extraction failed: {e}")
+            logger.debug(f"soundfile could not read {Path(file_path).name}, using pydub: {e}")
             return None
 
-    def _extract_fallback(self, file_path: str, num_points: int) -> Optional[List[float]]:
+        # Mix down to mono (pydub's set_channels(1) also averages channels)
+        if samples.ndim > 1:
+            samples = samples.mean(axis=1, dtype=np.float32)
+
+        return samples, sample_rate
+
+    def _get_samples(self, audio) -> np.ndarray:
+        """
+        Mono PCM samples of a pydub AudioSegment as a numpy array
+
+        Views audio.raw_data directly (no intermediate array.array copy);
+        unusual sample widths fall back to get_array_of_samples().
+
+        Args:
+            audio: Mono pydub AudioSegment
+
+        Returns:
+            Integer sample array (read-only view where possible)
+        """
+        dtype = _SAMPLE_DTYPES.get(audio.sample_width)
+        if dtype is None:
+            return np.array(audio.get_array_of_samples())
+        return np.frombuffer(audio.raw_data, dtype=dtype)
+
+    def _extract_fallback(self, file_path: str, num_points: int) -> Optional[np.ndarray]:
         """
         Fallback method: Generate simulated waveform based on file duration
 
@@ -153,7 +436,7 @@ class WaveformExtractor:
             num_points: Number of points to extract
 
         Returns:
-            List of simulated amplitude values
+            float32 array of simulated amplitude values
         """
         try:
             # Use mutagen to get duration
@@ -167,22 +450,19 @@ class WaveformExtractor:
             duration = audio_file.info.length
 
             # Generate simulated waveform with some randomness
-            # (better than nothing for visualization)
-            np.random.seed(hash(file_path) % (2**32))  # Deterministic random
-
-            waveform = []
-            for i in range(num_points):
-                # Mix of low-frequency and high-frequency components
-                t = i / num_points
-                base = 0.5 * np.sin(2 * np.pi * t * 3)  # Low frequency
-                detail = 0.3 * np.random.randn()  # Random variation
-                value = base + detail
+            # (better than nothing for visualization), all points at once.
+            # Private generator: same values as the former global seed + randn
+            # loop, without resetting numpy's global random state
+            rng = np.random.RandomState(hash(file_path) % (2**32))  # Deterministic random
 
-                # Envelope (quieter at start/end)
-                envelope = np.sin(np.pi * t)
-                value *= envelope
+            # Mix of low-frequency and high-frequency components
+            t = np.arange(num_points) / num_points
+            base = 0.5 * np.sin(2 * np.pi * t * 3)  # Low frequency
+            detail = 0.3 * rng.randn(num_points)  # Random variation
 
-                waveform.append(float(value))
+            # Envelope (quieter at start/end)
+            envelope = np.sin(np.pi * t)
+            waveform = ((base + detail) * envelope).astype(np.float32)
 
             logger.info(f"Generated fallback waveform: {num_points} points")
             return waveform
@@ -222,9 +502,11 @@ class WaveformExtractor:
         """
         # Check cache
         cache_key = f"spectrum_{file_path}_{num_bars}_{window_size_ms}"
-        if cache_key in self.cache:
+        cached = self._cache_get(cache_key)
+        if cached is not None:
             logger.debug(f"Spectrum loaded from cache: {Path(file_path).name}")
-            return self.cache[cache_key]
+            quantized, duration = cached
+            return (self._dequantize_spectrum(quantized), duration)
 
         # Check if file exists
         if not Path(file_path).exists():
@@ -232,35 +514,62 @@ class WaveformExtractor:
             return None
 
         try:
-            if PYDUB_AVAILABLE:
-                result = self._extract_spectrum_with_pydub(
-                    file_path, num_bars, window_size_ms
-                )
-            else:
-                logger.warning("pydub not available - spectrum extraction unavailable")
+            result = None
+            if self._soundfile_supports(file_path):
+                loaded = self._read_soundfile(file_path)
+                if loaded is not None:
+                    samples, sample_rate = loaded
+                    result = (
+                        self._compute_spectrum(samples, sample_rate, num_bars, window_size_ms),
+                        len(samples) / sample_rate
+                    )
+
+            if result is None:
+                if PYDUB_AVAILABLE:
+                    result = self._extract_spectrum_with_pydub(
+                        file_path, num_bars, window_size_ms
+                    )
+                else:
+                    logger.warning("pydub not available - spectrum extraction unavailable")
+                    return None
+
+            if result is None:
                 return None
 
-            # Cache result
-            if result:
-                self.cache[cache_key] = result
-                spectrum_data, duration = result
-                logger.info(
-                    f"Spectrum extracted: {Path(file_path).name} "
-                    f"({len(spectrum_data)} windows, {num_bars} bars, {duration:.1f}s)"
-                )
+            # Cache result quantized (1 byte per bar); callers get nested lists
+            spectrum_array, duration = result
+            quantized = np.rint(spectrum_array * SPECTRUM_LEVELS).astype(np.uint8)
+            self._cache_put(cache_key, (quantized, duration))
+            logger.info(
+                f"Spectrum extracted: {Path(file_path).name} "
+                f"({len(spectrum_array)} windows, {num_bars} bars, {duration:.1f}s)"
+            )
 
-            return result
+            # Same values as later cache hits
+            return (self._dequantize_spectrum(quantized), duration)
 
         except Exception as e:
             logger.error(f"Failed to extract spectrum from {file_path}: {e}")
             return None
 
+    def _dequantize_spectrum(self, quantized: np.ndarray) -> List[List[float]]:
+        """
+        Cached uint8 spectrum back to nested lists of magnitudes [0.0, 1.0]
+
+        Args:
+            quantized: uint8 array [windows, bars]
+
+        Returns:
+            List of time windows, each a list of bar magnitudes
+        """
+        return (quantized.astype(np.float32) / SPECTRUM_LEVELS).tolist()
+
     def _extract_spectrum_with_pydub(
         self,
         file_path: str,
         num_bars: int,
         window_size_ms: int
-    ) -> Optional[Tuple[List[List[float]], float]]:
+    ) -> Optional[Tuple[np.ndarray, float]]:
         """
         Extract frequency spectrum using pydub + FFT
 
@@ -270,7 +579,7 @@ class WaveformExtractor:
             window_size_ms: Window size in milliseconds
 
         Returns:
-            Tuple of (spectrum_data, duration)
+            Tuple of (float32 spectrum array [windows, bars], duration)
         """
         try:
             # Load audio file
@@ -285,114 +594,266 @@ class WaveformExtractor:
             duration = len(audio) / 1000.0  # Convert ms to seconds
 
             # Get raw audio data as numpy array
-            samples = np.array(audio.get_array_of_samples(), dtype=np.float32)
+            samples = self._get_samples(audio)
 
             # Normalize
             max_amplitude = 2 ** (audio.sample_width * 8 - 1)
-            samples = samples / max_amplitude
+            samples = samples.astype(np.float32) / max_amplitude
 
-            # Calculate window parameters
-            window_size_samples = int(sample_rate * window_size_ms / 1000)
-            hop_size = window_size_samples // 2  # 50% overlap for smoother transitions
+            spectrum_data = self._compute_spectrum(
+                samples, sample_rate, num_bars, window_size_ms
+            )
 
-            # Calculate number of windows
-            num_windows = (len(samples) - window_size_samples) // hop_size + 1
+            return (spectrum_data, duration)
 
-            # Prepare spectrum data storage
-            spectrum_data = []
+        except Exception as e:
+            logger.error(f"Spectrum extraction with pydub failed: {e}")
+            return None
 
-            # Process each window
-            for i in range(num_windows):
-                start_idx = i * hop_size
-                end_idx = start_idx + window_size_samples
+    def _compute_spectrum(
+        self,
+        samples: np.ndarray,
+        sample_rate: int,
+        num_bars: int,
+        window_size_ms: int
+    ) -> np.ndarray:
+        """
+        FFT spectrum of mono float samples, one row of bars per window
 
-                if end_idx > len(samples):
-                    break
+        Args:
+            samples: Mono samples in [-1.0, 1.0]
+            sample_rate: Sample rate in Hz
+            num_bars: Number of frequency bars
+            window_size_ms: Window size in milliseconds
 
-                # Extract window
-                window = samples[start_idx:end_idx]
+        Returns:
+            float32 array [windows, num_bars] of magnitudes [0.0, 1.0]
+        """
+        # Calculate window parameters
+        window_size_samples = int(sample_rate * window_size_ms / 1000)
+        hop_size = window_size_samples // 2  # 50% overlap for smoother transitions
 
-                # Apply Hanning window to reduce spectral leakage
-                window = window * np.hanning(len(window))
+        # Calculate number of windows
+        num_windows = (len(samples) - window_size_samples) // hop_size + 1
 
-                # Apply FFT
-                fft_result = np.fft.rfft(window)
-                magnitudes = np.abs(fft_result)
+        if num_windows <= 0:
+            return np.empty((0, num_bars), dtype=np.float32)
 
-                # Convert to log scale (decibels) for better visualization
-                # Add small epsilon to avoid log(0)
-                magnitudes = 20 * np.log10(magnitudes + 1e-10)
+        # All windows as rows of one strided view (no copy), with 50% overlap
+        frames = np.lib.stride_tricks.sliding_window_view(
+            samples, window_size_samples
+        )[::hop_size][:num_windows]
 
-                # Normalize to [0, 1] range
-                # Typical range: -120dB (silence) to 0dB (max)
-                magnitudes = np.clip((magnitudes + 120) / 120, 0, 1)
+        # Hanning window to reduce spectral leakage (cached per window size)
+        hann = _hanning_window(window_size_samples)
 
-                # Group frequencies into bars (logarithmic distribution)
-                # This gives more resolution to lower frequencies (bass)
-                # which is more perceptually important
-                bar_magnitudes = self._distribute_into_bars(magnitudes, num_bars)
+        # Prepare spectrum data storage (4 bytes per bar, not a Python float)
+        spectrum_data = np.empty((num_windows, num_bars), dtype=np.float32)
 
-                spectrum_data.append(bar_magnitudes)
+        # FFT a batch of windows per call (bounded temporaries for long files)
+        for start in range(0, num_windows, SPECTRUM_BATCH_WINDOWS):
+            batch = frames[start:start + SPECTRUM_BATCH_WINDOWS] * hann
 
-            logger.debug(
-                f"Extracted {len(spectrum_data)} spectrum windows "
-                f"({num_bars} bars each)"
-            )
+            # Apply FFT to every window in the batch at once (scipy splits
+            # the rows across all cores)
+            if SCIPY_FFT_AVAILABLE:
+                spectrum = scipy_fft.rfft(batch, axis=1, workers=-1)
+            else:
+                spectrum = np.fft.rfft(batch, axis=1)
+            magnitudes = np.abs(spectrum)
 
-            return (spectrum_data, duration)
+            # Convert to log scale (decibels) for better visualization
+            # Add small epsilon to avoid log(0)
+            magnitudes = 20 * np.log10(magnitudes + 1e-10)
 
-        except Exception as e:
-            logger.error(f"Spectrum extraction with pydub failed: {e}")
-            return None
+            # Normalize to [0, 1] range
+            # Typical range: -120dB (silence) to 0dB (max)
+            magnitudes = np.clip((magnitudes + 120) / 120, 0, 1)
+
+            # Group frequencies into bars (logarithmic distribution)
+            # This gives more resolution to lower frequencies (bass)
+            # which is more perceptually important
+            spectrum_data[start:start + len(batch)] = self._bar_magnitudes(magnitudes, num_bars)
+
+        logger.debug(
+            f"Extracted {len(spectrum_data)} spectrum windows "
+            f"({num_bars} bars each)"
+        )
+
+        return spectrum_data
 
     def _distribute_into_bars(
         self,
         magnitudes: np.ndarray,
         num_bars: int
-    ) -> List[float]:
+    ) -> Union[List[float], List[List[float]]]:
         """
         Distribute FFT magnitudes into visual bars using logarithmic scale
 
         Args:
-            magnitudes: FFT magnitude array
+            magnitudes: FFT magnitude array, one window (1D) or one window
+                per row (2D)
             num_bars: Number of bars to create
 
         Returns:
-            List of bar magnitudes [0.0, 1.0]
+            List of bar magnitudes [0.0, 1.0] (a list per row for 2D input)
         """
-        # Use logarithmic distribution for frequency bins
-        # This matches human perception (we hear bass/treble differently)
-        total_bins = len(magnitudes)
+        return self._bar_magnitudes(np.asarray(magnitudes), num_bars).tolist()
 
-        # Create logarithmic frequency boundaries
-        # Start from 20 Hz (below human hearing) to Nyquist frequency
-        log_min = np.log10(20)
-        log_max = np.log10(total_bins)
-        log_boundaries = np.logspace(log_min, log_max, num_bars + 1, base=10)
+    def _bar_magnitudes(self, magnitudes: np.ndarray, num_bars: int) -> np.ndarray:
+        """
+        Array form of _distribute_into_bars (bars along the last axis)
 
-        # Convert to bin indices
-        bin_boundaries = np.clip(log_boundaries.astype(int), 0, total_bins - 1)
+        Args:
+            magnitudes: FFT magnitude array, 1D or one window per row
+            num_bars: Number of bars to create
+
+        Returns:
+            Array of bar magnitudes [0.0, 1.0]
+        """
+        indices, widths, needs_pad = _bar_plan(magnitudes.shape[-1], num_bars)
+
+        # A bar may end one past the last bin: pad a zero bin to index it
+        if needs_pad:
+            pad = np.zeros(magnitudes.shape[:-1] + (1,), dtype=magnitudes.dtype)
+            magnitudes = np.concatenate([magnitudes, pad], axis=-1)
+
+        # Sum every bar's bins in one C call (even entries are the bars),
+        # then average
+        sums = np.add.reduceat(magnitudes, indices, axis=-1)[..., 0::2]
+        return sums / widths
+
+    def _cache_get(self, key: str):
+        """Get a cached entry (marks it most recently used), None on miss"""
+        with self._cache_lock:
+            value = self.cache.get(key)
+            if value is not None:
+                self.cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key: str, value):
+        """Cache an entry, evicting the least recently used beyond cache_size"""
+        with self._cache_lock:
+            self.cache[key] = value
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def _resample_cached(self, file_path: str, num_points: int) -> Optional[np.ndarray]:
+        """
+        Resample the smallest cached waveform of a file with >= num_points
+
+        Args:
+            file_path: Path to audio file
+            num_points: Number of waveform points wanted
+
+        Returns:
+            float32 waveform array, or None if no suitable waveform is cached
+        """
+        # Snapshot: pool threads may add/evict entries meanwhile
+        with self._cache_lock:
+            items = list(self.cache.items())
+
+        source = None
+        for key, value in items:
+            path, _, points = key.rpartition('_')
+            if path != file_path or not points.isdigit():
+                continue
+            if len(value) >= num_points and (source is None or len(value) < len(source)):
+                source = value
+
+        if source is None or num_points <= 0:
+            return None
+
+        cached_points = len(source)
+        return np.interp(
+            np.linspace(0, cached_points - 1, num_points),
+            np.arange(cached_points),
+            source
+        ).astype(np.float32)
+
+    def _disk_cache_path(self, file_path: str, num_points: int) -> Path:
+        """Persisted waveform path for an audio file and resolution"""
+        digest = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}_{num_points}.npz"
+
+    def _load_from_disk(self, file_path: str, num_points: int) -> Optional[np.ndarray]:
+        """
+        Load a persisted waveform if the audio file is unchanged
+
+        Args:
+            file_path: Path to audio file
+            num_points: Number of waveform points
+
+        Returns:
+            float32 waveform array, or None (missing, stale or unreadable)
+        """
+        if self.cache_dir is None:
+            return None
+
+        cache_path = self._disk_cache_path(file_path, num_points)
+        try:
+            stat = os.stat(file_path)
+            with np.load(cache_path) as stored:
+                if (int(stored['mtime_ns']) != stat.st_mtime_ns
+                        or int(stored['size']) != stat.st_size):
+                    return None
+                return stored['waveform']
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable waveform cache {cache_path.name}: {e}")
+            return None
+
+    def _save_to_disk(self, file_path: str, num_points: int, waveform: np.ndarray):
+        """
+        Persist a waveform with the audio file's mtime and size
 
-        # Calculate average magnitude for each bar
-        bar_magnitudes = []
-        for i in range(num_bars):
-            start_bin = bin_boundaries[i]
-            end_bin = bin_boundaries[i + 1]
+        Args:
+            file_path: Path to audio file
+            num_points: Number of waveform points
+            waveform: float32 waveform array
+        """
+        if self.cache_dir is None:
+            return
+
+        cache_path = self._disk_cache_path(file_path, num_points)
+
+        # Write to temp file first (atomic write)
+        temp_path = cache_path.with_suffix('.tmp')
 
-            if start_bin >= end_bin:
-                end_bin = start_bin + 1
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            stat = os.stat(file_path)
+            with open(temp_path, 'wb') as f:
+                np.savez(f, waveform=waveform,
+                         mtime_ns=np.int64(stat.st_mtime_ns), size=np.int64(stat.st_size))
+
+            # Rename temp file to actual cache file (atomic on most filesystems)
+            temp_path.replace(cache_path)
 
-            # Average magnitude in this frequency range
-            bar_magnitude = float(np.mean(magnitudes[start_bin:end_bin]))
-            bar_magnitudes.append(bar_magnitude)
+        except Exception as e:
+            logger.warning(f"Failed to persist waveform for {Path(file_path).name}: {e}")
 
-        return bar_magnitudes
+            # Clean up temp file
+            if temp_path.exists():
+                temp_path.unlink()
 
     def clear_cache(self):
-        """Clear waveform cache"""
-        self.cache.clear()
+        """Clear waveform cache (memory and persisted waveforms)"""
+        with self._cache_lock:
+            self.cache.clear()
+
+        if self.cache_dir is not None and self.cache_dir.is_dir():
+            for cache_file in self.cache_dir.glob("*.npz"):
+                try:
+                    cache_file.unlink()
+                except OSError as e:
+                    logger.warning(f"Failed to remove {cache_file.name}: {e}")
+
         logger.debug("Waveform cache cleared")
 
     def get_cache_size(self) -> int:
         """Get number of cached waveforms"""
-        return len(self.cache)
+        with self._cache_lock:
+            return len(self.cache)
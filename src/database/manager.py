@@ -8,8 +8,9 @@ Thread-safety: Uses threading.local() for per-thread connections
 import sqlite3
 import logging
 import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Iterator, Optional, List, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -147,19 +148,85 @@ class DatabaseManager:
                 logger.error(f"Failed to apply migration {migration_file.name}: {e}")
                 raise
 
+    # Transactions
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group several execute_query/execute_many calls into one transaction
+
+        Takes the write lock up front (BEGIN IMMEDIATE) and commits once on
+        exit, or rolls everything back if the block raises. Nested calls
+        join the outer transaction.
+
+        Usage:
+            with db.transaction():
+                db.execute_query(...)
+                db.execute_many(...)
+        """
+        if self._in_transaction():
+            yield
+            return
+
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.in_transaction = True
+        try:
+            yield
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._local.in_transaction = False
+
+    def _in_transaction(self) -> bool:
+        """Whether this thread is inside transaction()"""
+        return getattr(self._local, 'in_transaction', False)
+
     # Query methods
     def execute_query(self, query: str, params: tuple = ()) -> Optional[int]:
         """
         Execute INSERT/UPDATE/DELETE query
 
+        Commits immediately unless called inside transaction().
+
         Returns:
             Last inserted row ID for INSERT, None for UPDATE/DELETE
         """
         cursor = self.conn.cursor()
         cursor.execute(query, params)
-        self.conn.commit()
+        if not self._in_transaction():
+            self.conn.commit()
         return cursor.lastrowid if query.strip().upper().startswith("INSERT") else None
 
+    def execute_many(self, query: str, params_seq: List[tuple]) -> int:
+        """
+        Execute one INSERT/UPDATE/DELETE for many parameter tuples
+
+        Single executemany() in a single transaction (one COMMIT, or the
+        enclosing transaction()); either every row is written or none is.
+
+        Returns:
+            Number of rows affected
+        """
+        if not params_seq:
+            return 0
+
+        cursor = self._executemany(query, params_seq)
+        return max(cursor.rowcount, 0)
+
+    def _executemany(self, query: str, params_seq: List[tuple]) -> sqlite3.Cursor:
+        """
+        executemany() committed on its own, or left to the enclosing transaction()
+
+        Returns:
+            Cursor of the executemany() call
+        """
+        if self._in_transaction():
+            return self.conn.executemany(query, params_seq)
+        with self.conn:
+            return self.conn.executemany(query, params_seq)
+
     def fetch_one(self, query: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
         """
         Fetch single row
@@ -286,6 +353,63 @@ class DatabaseManager:
             logger.error(f"Failed to add song: {e}")
             return None
 
+    def add_songs_batch(self, songs: List[Dict[str, Any]]) -> int:
+        """
+        Add many songs in a single transaction
+
+        Uses one executemany() + one COMMIT for the whole batch instead of
+        a COMMIT per song. Rows with a file_path already in the library are
+        skipped (INSERT OR IGNORE on the UNIQUE file_path column). Inside
+        transaction() the enclosing transaction commits instead, and errors
+        are re-raised so it rolls back.
+
+        Args:
+            songs: List of song dictionaries (same fields as add_song)
+
+        Returns:
+            Number of songs actually inserted
+        """
+        rows = []
+        for song_data in songs:
+            file_path = song_data.get('file_path')
+            if not file_path:
+                logger.error("Cannot add song without file_path")
+                continue
+            rows.append((
+                song_data.get('title', 'Unknown'),
+                song_data.get('artist'),
+                song_data.get('album'),
+                song_data.get('year'),
+                song_data.get('genre'),
+                song_data.get('duration'),
+                song_data.get('bitrate'),
+                song_data.get('sample_rate'),
+                file_path,
+                song_data.get('file_size')
+            ))
+
+        if not rows:
+            return 0
+
+        sql = """
+            INSERT OR IGNORE INTO songs (
+                title, artist, album, year, genre,
+                duration, bitrate, sample_rate,
+                file_path, file_size
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+
+        try:
+            cursor = self._executemany(sql, rows)
+            inserted = max(cursor.rowcount, 0)
+            logger.info(f"Added {inserted}/{len(rows)} songs (batch)")
+            return inserted
+        except Exception as e:
+            logger.error(f"Failed to add song batch: {e}")
+            if self._in_transaction():
+                raise
+            return 0
+
     def get_all_songs(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get all songs from library
@@ -452,6 +576,69 @@ class DatabaseManager:
             logger.error(f"Failed to update path for song {song_id}: {e}")
             return False
 
+    def update_song_paths_bulk(self, updates: List[Tuple[int, str]]) -> Optional[int]:
+        """
+        Update file paths for many songs in a single transaction
+
+        Uses one executemany() + one COMMIT instead of a COMMIT per song
+        (see update_song_path). Either every row is written or none is.
+        Inside transaction() the enclosing transaction commits instead, and
+        errors are re-raised so it rolls back.
+
+        Args:
+            updates: List of (song_id, new_path) pairs
+
+        Returns:
+            Number of songs updated, or None if the transaction failed
+        """
+        if not updates:
+            return 0
+
+        try:
+            # Normalize paths before storing
+            rows = [(str(Path(new_path).resolve()), song_id) for song_id, new_path in updates]
+
+            query = "UPDATE songs SET file_path = ?, modified_date = CURRENT_TIMESTAMP WHERE id = ?"
+            cursor = self._executemany(query, rows)
+            updated = max(cursor.rowcount, 0)
+            logger.info(f"Updated paths for {updated}/{len(rows)} songs (batch)")
+            return updated
+
+        except Exception as e:
+            logger.error(f"Failed to update song path batch: {e}")
+            if self._in_transaction():
+                raise
+            return None
+
+    def update_fingerprint(self, song_id: int, fingerprint: str, mtime: float, size: int) -> bool:
+        """
+        Cache audio fingerprint for a song (used by duplicate detection)
+
+        Args:
+            song_id: Song ID to update
+            fingerprint: Chromaprint fingerprint string
+            mtime: File modification time the fingerprint was computed for
+            size: File size in bytes the fingerprint was computed for
+
+        Returns:
+            bool: True if updated successfully, False otherwise
+        """
+        try:
+            query = """
+                UPDATE songs
+                SET fingerprint = ?, fingerprint_mtime = ?, fingerprint_size = ?
+                WHERE id = ?
+            """
+            cursor = self.conn.cursor()
+            cursor.execute(query, (fingerprint, mtime, size, song_id))
+            self.conn.commit()
+
+            return cursor.rowcount > 0
+
+        except Exception as e:
+            logger.error(f"Failed to cache fingerprint for song {song_id}: {e}")
+            return False
+
     def delete_song(self, song_id: int) -> bool:
         """
         Delete song from database
@@ -0,0 +1,7 @@
+-- Migration 008: Cache audio fingerprints on songs
+-- Purpose: Duplicate detection reuses fingerprints instead of re-running fpcalc
+
+-- Fingerprint is valid while the file's mtime and size are unchanged
+ALTER TABLE songs ADD COLUMN fingerprint TEXT;
+ALTER TABLE songs ADD COLUMN fingerprint_mtime REAL;
+ALTER TABLE songs ADD COLUMN fingerprint_size INTEGER;
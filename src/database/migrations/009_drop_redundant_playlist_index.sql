@@ -0,0 +1,8 @@
+-- Migration 009: Drop redundant playlist_songs(playlist_id) index
+-- Purpose: Fewer index writes per playlist insert/reorder
+
+-- idx_playlist_songs_position (playlist_id, position) already serves every
+-- "WHERE playlist_id = ?" lookup, its ORDER BY position and MAX(position)
+-- (covering); songs(file_path) is indexed by its UNIQUE constraint and
+-- playlist_songs(song_id) by idx_playlist_songs_song_id
+DROP INDEX IF EXISTS idx_playlist_songs_playlist_id;
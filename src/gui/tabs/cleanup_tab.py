@@ -17,6 +17,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QBrush
 import logging
+from pathlib import Path
 
 from database.manager import DatabaseManager
 from core.metadata_cleaner import MetadataCleaner
@@ -231,8 +232,16 @@ class CleanupTab(QWidget):
                     logger.warning(f"Failed to initialize Spotify: {e}")
                     spotify_adapter = None
 
+                # Persistent API response cache (repeat scans skip the network)
+                try:
+                    from core.response_cache import ResponseCache
+                    response_cache = ResponseCache(str(Path.home() / ".nexus_music" / "api_cache.db"))
+                except Exception as e:
+                    logger.warning(f"API response cache unavailable: {e}")
+                    response_cache = None
+
                 # Create MetadataFetcher with adapters
-                self.fetcher = MetadataFetcher(mb_adapter, spotify_adapter)
+                self.fetcher = MetadataFetcher(mb_adapter, spotify_adapter, response_cache)
                 logger.info("Metadata fetcher initialized with API adapters")
 
             except Exception as e:
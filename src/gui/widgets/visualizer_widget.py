@@ -17,7 +17,7 @@ Updated: November 20, 2025 - Modern gradient bars
 Updated: November 21, 2025 - Multiple styles + selector
 """
 import logging
-from typing import List, Optional
+from typing import List, Optional, Sequence
 import math
 from PyQt6.QtWidgets import QWidget, QComboBox
 from PyQt6.QtCore import Qt, QRect, QPoint, QSettings
@@ -38,7 +38,7 @@ class VisualizerWidget(QWidget):
 
     Usage:
         visualizer = VisualizerWidget()
-        visualizer.set_waveform(waveform_data)  # List of amplitude values [-1.0, 1.0]
+        visualizer.set_waveform(waveform_data)  # Amplitude values [-1.0, 1.0] (list or ndarray)
         visualizer.set_position(0.5)  # 50% through song
         visualizer.set_color(QColor(0, 255, 0))  # Green waveform
         visualizer.set_style('bars')  # Bar style
@@ -54,7 +54,7 @@ class VisualizerWidget(QWidget):
         super().__init__(parent)
 
         # Waveform data (static)
-        self.waveform_data: Optional[List[float]] = None
+        self.waveform_data: Optional[Sequence[float]] = None
 
         # Spectrum data (dynamic - for animated bars)
         self.spectrum_data: Optional[List[List[float]]] = None  # [time_window][frequency_bar]
@@ -165,12 +165,13 @@ class VisualizerWidget(QWidget):
             self.update()
             logger.info(f"Visualizer style changed to: {new_style}")
 
-    def set_waveform(self, waveform_data: List[float]):
+    def set_waveform(self, waveform_data: Sequence[float]):
         """
         Set waveform data for visualization
 
         Args:
-            waveform_data: List of amplitude values (typically -1.0 to 1.0)
+            waveform_data: Amplitude values (typically -1.0 to 1.0), list or
+                numpy array (as returned by WaveformExtractor.extract)
         """
         self.waveform_data = waveform_data
         self.update()  # Trigger repaint
@@ -272,7 +273,7 @@ class VisualizerWidget(QWidget):
         painter.fillRect(self.rect(), self.background_color)
 
         # If no data at all, display placeholder
-        if not self.waveform_data and not self.spectrum_data:
+        if not self._has_waveform() and not self.spectrum_data:
             logger.debug("No data - showing placeholder")
             self._draw_placeholder(painter)
             return
@@ -316,7 +317,7 @@ class VisualizerWidget(QWidget):
         # Get waveform data (prefer static waveform, fallback to spectrum-derived)
         waveform_to_draw = None
 
-        if self.waveform_data:
+        if self._has_waveform():
             waveform_to_draw = self.waveform_data
         elif self.spectrum_data:
             # Generate waveform-like data from spectrum (sum all frequency bands per time window)
@@ -349,7 +350,7 @@ class VisualizerWidget(QWidget):
 
             # Average samples in this range
             samples = waveform_to_draw[start_idx:end_idx]
-            avg_amplitude = sum(samples) / len(samples) if samples else 0.0
+            avg_amplitude = sum(samples) / len(samples) if len(samples) else 0.0
 
             # Convert amplitude to y coordinate
             # Amplitude range: [0, 1.0] for spectrum, [-1.0, 1.0] for waveform -> y range
@@ -886,7 +887,7 @@ class VisualizerWidget(QWidget):
                 return resampled.tolist()
 
         # Fallback: Use static waveform data
-        elif self.waveform_data:
+        elif self._has_waveform():
             num_samples = len(self.waveform_data)
             samples_per_bar = max(1, num_samples // num_bars)
 
@@ -901,7 +902,7 @@ class VisualizerWidget(QWidget):
 
                 # Max absolute amplitude in this range
                 samples = self.waveform_data[start_idx:end_idx]
-                max_amplitude = max(abs(s) for s in samples) if samples else 0.0
+                max_amplitude = float(max(abs(s) for s in samples)) if len(samples) else 0.0
                 bar_magnitudes.append(max_amplitude)
 
             return bar_magnitudes
@@ -910,6 +911,10 @@ class VisualizerWidget(QWidget):
         else:
             return [0.0] * num_bars
 
+    def _has_waveform(self) -> bool:
+        """Whether non-empty waveform data is set (list or ndarray)"""
+        return self.waveform_data is not None and len(self.waveform_data) > 0
+
     def _draw_position_indicator(self, painter: QPainter):
         """
         Draw position indicator line
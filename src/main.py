@@ -602,13 +602,14 @@ and are never shared or transmitted outside of official API requests to YouTube
             # Show loading indicator
             self.statusBar.showMessage("Analyzing audio for visualizer...", 0)
 
-            # Stop any existing worker
-            if hasattr(self, 'spectrum_worker') and self.spectrum_worker.isRunning():
-                self.spectrum_worker.terminate()
-                self.spectrum_worker.wait()
-
-            # Create worker thread for spectrum extraction (non-blocking)
-            from core.spectrum_worker import SpectrumWorker
+            # Drop the result of any previous song's worker. A cancelled worker
+            # that already started keeps running until its extraction ends, so
+            # extractions can overlap (WaveformExtractor's cache is locked)
+            if hasattr(self, 'spectrum_worker'):
+                self.spectrum_worker.cancel()
+
+            # Create pooled worker for spectrum extraction (non-blocking)
+            from core.spectrum_worker import SpectrumWorker, spectrum_thread_pool
             self.spectrum_worker = SpectrumWorker(
                 self.waveform_extractor,
                 file_path,
@@ -616,18 +617,18 @@ and are never shared or transmitted outside of official API requests to YouTube
             )
 
             # Connect signals
-            self.spectrum_worker.finished.connect(
+            self.spectrum_worker.signals.finished.connect(
                 lambda data, dur: self._on_spectrum_extracted(data, dur, duration, file_path)
             )
-            self.spectrum_worker.error.connect(
+            self.spectrum_worker.signals.error.connect(
                 lambda err: self._on_spectrum_error(err, file_path, duration)
             )
-            self.spectrum_worker.progress.connect(
+            self.spectrum_worker.signals.progress.connect(
                 lambda pct: self.statusBar.showMessage(f"Analyzing audio... {pct}%", 0)
             )
 
             # Start extraction in background
-            self.spectrum_worker.start()
+            spectrum_thread_pool().start(self.spectrum_worker)
 
         except Exception as e:
             logger.error(f"Error starting audio analysis: {e}")
@@ -672,7 +673,7 @@ and are never shared or transmitted outside of official API requests to YouTube
             # Fallback: Extract static waveform
             waveform = self.waveform_extractor.extract(file_path, num_points=1000)
 
-            if waveform:
+            if waveform is not None and len(waveform):
                 self.visualizer.set_waveform(waveform)
                 self.visualizer.set_duration(duration)
                 logger.info(f"Waveform fallback loaded: {len(waveform)} points")
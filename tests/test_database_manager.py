@@ -150,6 +150,132 @@ def test_add_song_stores_all_fields(temp_db, sample_song_data):
     assert song['file_size'] == sample_song_data['file_size']
 
 
+def test_add_songs_batch_inserts_and_skips_duplicates(temp_db, sample_song_data):
+    """Test batch insert adds new songs and ignores existing file paths"""
+    temp_db.add_song(sample_song_data)
+
+    batch = [
+        sample_song_data,  # Duplicate - should be skipped
+        {**sample_song_data, 'title': 'Song B', 'file_path': '/music/b.mp3'},
+        {**sample_song_data, 'title': 'Song C', 'file_path': '/music/c.mp3'},
+        {'title': 'No Path'},  # Invalid - should be skipped
+    ]
+
+    inserted = temp_db.add_songs_batch(batch)
+
+    assert inserted == 2
+    assert temp_db.get_song_count() == 3
+    assert temp_db.song_exists('/music/b.mp3')
+
+
+def test_add_songs_batch_joins_transaction(temp_db, sample_song_data):
+    """Test add_songs_batch doesn't commit an enclosing transaction early"""
+    with pytest.raises(RuntimeError):
+        with temp_db.transaction():
+            assert temp_db.add_songs_batch([sample_song_data]) == 1
+            assert temp_db.conn.in_transaction
+            raise RuntimeError("abort")
+
+    assert temp_db.get_song_count() == 0
+
+
+def test_update_song_paths_bulk(temp_db, sample_song_data, tmp_path):
+    """Test bulk path update writes every row in one call"""
+    first_id = temp_db.add_song(sample_song_data)
+    second_id = temp_db.add_song({**sample_song_data, 'file_path': '/music/other.mp3'})
+
+    first_path = tmp_path / 'a.mp3'
+    second_path = tmp_path / 'b.mp3'
+    updated = temp_db.update_song_paths_bulk([
+        (first_id, str(first_path)),
+        (second_id, str(second_path)),
+        (99999, str(tmp_path / 'missing.mp3'))
+    ])
+
+    assert updated == 2
+    assert temp_db.get_song_by_id(first_id)['file_path'] == str(first_path.resolve())
+    assert temp_db.get_song_by_id(second_id)['file_path'] == str(second_path.resolve())
+    assert temp_db.update_song_paths_bulk([]) == 0
+
+
+def test_execute_many(temp_db, sample_song_data):
+    """Test execute_many runs one statement for every parameter tuple"""
+    first_id = temp_db.add_song(sample_song_data)
+    second_id = temp_db.add_song({**sample_song_data, 'file_path': '/music/other.mp3'})
+
+    updated = temp_db.execute_many(
+        "UPDATE songs SET genre = ? WHERE id = ?",
+        [('Jazz', first_id), ('Blues', second_id), ('Pop', 99999)]
+    )
+
+    assert updated == 2
+    assert temp_db.get_song_by_id(first_id)['genre'] == 'Jazz'
+    assert temp_db.get_song_by_id(second_id)['genre'] == 'Blues'
+    assert temp_db.execute_many("UPDATE songs SET genre = ? WHERE id = ?", []) == 0
+
+
+def test_transaction_commits_once_or_rolls_back(temp_db, sample_song_data):
+    """Test transaction() groups writes and rolls all of them back on error"""
+    song_id = temp_db.add_song(sample_song_data)
+
+    with temp_db.transaction():
+        temp_db.execute_query("UPDATE songs SET genre = ? WHERE id = ?", ('Jazz', song_id))
+        temp_db.execute_many("UPDATE songs SET year = ? WHERE id = ?", [(1999, song_id)])
+        assert temp_db.conn.in_transaction
+    assert not temp_db.conn.in_transaction
+
+    with pytest.raises(RuntimeError):
+        with temp_db.transaction():
+            temp_db.execute_query("UPDATE songs SET genre = ? WHERE id = ?", ('Blues', song_id))
+            raise RuntimeError("abort")
+
+    song = temp_db.get_song_by_id(song_id)
+    assert song['genre'] == 'Jazz'
+    assert song['year'] == 1999
+
+
+def test_update_song_paths_bulk_joins_transaction(temp_db, sample_song_data, tmp_path):
+    """Test update_song_paths_bulk doesn't commit an enclosing transaction early"""
+    song_id = temp_db.add_song(sample_song_data)
+
+    with pytest.raises(RuntimeError):
+        with temp_db.transaction():
+            assert temp_db.update_song_paths_bulk([(song_id, str(tmp_path / "moved.mp3"))]) == 1
+            assert temp_db.conn.in_transaction
+            raise RuntimeError("abort")
+
+    assert temp_db.get_song_by_id(song_id)['file_path'] == sample_song_data['file_path']
+
+
+def test_playlist_queries_use_position_index(temp_db):
+    """Test playlist reads are served by the (playlist_id, position) index"""
+    queries = [
+        "SELECT id, position FROM playlist_songs WHERE playlist_id = 1 ORDER BY position",
+        "SELECT MAX(position) FROM playlist_songs WHERE playlist_id = 1",
+    ]
+    for query in queries:
+        plan = " ".join(row[3] for row in temp_db.conn.execute("EXPLAIN QUERY PLAN " + query))
+        assert "idx_playlist_songs_position" in plan
+        assert "TEMP B-TREE" not in plan
+
+    indexes = {row['name'] for row in temp_db.fetch_all(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'playlist_songs'")}
+    assert "idx_playlist_songs_playlist_id" not in indexes
+
+
+def test_update_fingerprint_caches_values(temp_db, sample_song_data):
+    """Test fingerprint cache columns are stored on the song"""
+    song_id = temp_db.add_song(sample_song_data)
+
+    assert temp_db.update_fingerprint(song_id, 'AQAB1234', 1700000000.5, 4096)
+    assert not temp_db.update_fingerprint(99999, 'AQAB1234', 1700000000.5, 4096)
+
+    song = temp_db.get_song_by_id(song_id)
+    assert song['fingerprint'] == 'AQAB1234'
+    assert song['fingerprint_mtime'] == 1700000000.5
+    assert song['fingerprint_size'] == 4096
+
+
 # ==========================================
 # GET ALL SONGS TESTS
 # ==========================================
@@ -94,6 +94,39 @@ class TestDownloadQueue(unittest.TestCase):
         # Verify all added
         self.assertEqual(len(queue.get_all()), 5)
 
+    def test_queue_item_ids_unique(self):
+        """Test item IDs are unique within a queue and across instances"""
+        if self.queue_class is None:
+            self.fail("DownloadQueue class not found")
+
+        queue1 = self.queue_class(max_concurrent=3)
+        queue2 = self.queue_class(max_concurrent=3)
+
+        ids = [queue1.add(f"https://www.youtube.com/watch?v=a{i}", {'title': f'A {i}'}) for i in range(5)]
+        ids += [queue2.add(f"https://www.youtube.com/watch?v=b{i}", {'title': f'B {i}'}) for i in range(5)]
+
+        self.assertEqual(len(set(ids)), 10)
+
+    def test_queue_item_dict_access(self):
+        """Test queue items support dict-style access (including extra keys)"""
+        if self.queue_class is None:
+            self.fail("DownloadQueue class not found")
+
+        queue = self.queue_class(max_concurrent=3)
+        item_id = queue.add(
+            video_url="https://www.youtube.com/watch?v=test1",
+            metadata={'title': 'Song 1'}
+        )
+
+        item = queue.get_item(item_id)
+        item['progress'] = 25
+        item['file_path'] = '/tmp/song.mp3'
+
+        self.assertEqual(item.progress, 25)
+        self.assertEqual(item.get('file_path'), '/tmp/song.mp3')
+        self.assertIsNone(item.get('missing'))
+        self.assertEqual(item.to_dict()['file_path'], '/tmp/song.mp3')
+
     def test_queue_start_processing(self):
         """Test starting queue processing"""
         if self.queue_class is None:
@@ -240,6 +273,27 @@ class TestDownloadQueue(unittest.TestCase):
         item = queue.get_item(item_id)
         self.assertEqual(item['progress'], 50)
 
+    def test_queue_progress_signal_throttled(self):
+        """Test item_progress is throttled but always reports 100%"""
+        if self.queue_class is None:
+            self.fail("DownloadQueue class not found")
+
+        queue = self.queue_class(max_concurrent=3)
+        item_id = queue.add(
+            video_url="https://www.youtube.com/watch?v=test1",
+            metadata={'title': 'Song 1'}
+        )
+
+        emitted = []
+        queue.item_progress.connect(lambda i, p: emitted.append(p))
+
+        # Burst of small ticks within the throttle interval
+        for percentage in [10, 11, 12, 13, 20, 21, 100]:
+            queue.update_progress(item_id, percentage)
+
+        self.assertEqual(emitted, [10, 20, 100])
+        self.assertEqual(queue.get_item(item_id)['progress'], 100)
+
     def test_queue_completion_callback(self):
         """Test callback fires when download completes"""
         if self.queue_class is None:
@@ -267,6 +321,66 @@ class TestDownloadQueue(unittest.TestCase):
         # Verify callback fired
         self.assertIn(item_id, completed)
 
+    def test_queue_auto_import_batched(self):
+        """Test completed downloads are imported to database in a batch"""
+        if self.queue_class is None:
+            self.fail("DownloadQueue class not found")
+
+        db_manager = Mock()
+        db_manager.add_songs_batch.return_value = 2
+        queue = self.queue_class(max_concurrent=3, db_manager=db_manager)
+
+        for i in range(2):
+            song_path = Path(self.test_dir) / f"Song {i}.mp3"
+            song_path.write_bytes(b"not really an mp3")
+            item_id = queue.add(
+                video_url=f"https://www.youtube.com/watch?v=test{i}",
+                metadata={'title': f'Song {i}'}
+            )
+            queue.mark_completed(item_id, metadata={'title': f'Song {i}', 'output_path': str(song_path)})
+
+        # Wait for background writer
+        queue.flush()
+
+        imported = [song for call in db_manager.add_songs_batch.call_args_list for song in call.args[0]]
+        self.assertEqual([song['title'] for song in imported], ['Song 0', 'Song 1'])
+        db_manager.add_song.assert_not_called()
+
+    def test_queue_completed_waits_for_imports_without_blocking(self):
+        """Test queue_completed fires after pending imports, without blocking the caller"""
+        if self.queue_class is None:
+            self.fail("DownloadQueue class not found")
+
+        import threading
+        from PyQt6.QtCore import QCoreApplication
+        app = QCoreApplication.instance() or QCoreApplication([])
+
+        release = threading.Event()
+        db_manager = Mock()
+        db_manager.add_songs_batch.side_effect = lambda batch: release.wait(5) and len(batch)
+        queue = self.queue_class(max_concurrent=3, db_manager=db_manager)
+        completed = []
+        queue.queue_completed.connect(lambda: completed.append(True))
+
+        song_path = Path(self.test_dir) / "Song 0.mp3"
+        song_path.write_bytes(b"not really an mp3")
+        item_id = queue.add(
+            video_url="https://www.youtube.com/watch?v=test0",
+            metadata={'title': 'Song 0'}
+        )
+        queue._running = True
+
+        # Returns while the import is still being written
+        queue.mark_completed(item_id, metadata={'title': 'Song 0', 'output_path': str(song_path)})
+        app.processEvents()
+        self.assertEqual(completed, [])
+
+        release.set()
+        queue.flush()
+        app.processEvents()
+        self.assertEqual(completed, [True])
+        db_manager.add_songs_batch.assert_called_once()
+
     def test_queue_persistence_save(self):
         """Test saving queue to disk"""
         if self.queue_class is None:
@@ -321,5 +435,62 @@ class TestDownloadQueue(unittest.TestCase):
         self.assertEqual(items[2]['metadata']['title'], 'Song 2')
 
 
+    def test_queue_persistence_journal_replay(self):
+        """Test mutations after save() are journaled and replayed on load"""
+        if self.queue_class is None:
+            self.fail("DownloadQueue class not found")
+
+        queue1 = self.queue_class(max_concurrent=3)
+        first_id = queue1.add(
+            video_url="https://www.youtube.com/watch?v=test0",
+            metadata={'title': 'Song 0'}
+        )
+        queue1.save(str(self.queue_file))
+
+        # Mutations after the snapshot go to the journal only
+        second_id = queue1.add(
+            video_url="https://www.youtube.com/watch?v=test1",
+            metadata={'title': 'Song 1'}
+        )
+        queue1.cancel(first_id)
+
+        with open(self.queue_file) as f:
+            self.assertEqual(len(json.load(f)['items']), 1)
+
+        queue2 = self.queue_class(max_concurrent=3)
+        queue2.load(str(self.queue_file))
+
+        self.assertEqual(len(queue2.get_all()), 2)
+        self.assertEqual(queue2.get_item(first_id)['status'], 'canceled')
+        self.assertEqual(queue2.get_item(second_id)['metadata']['title'], 'Song 1')
+
+    def test_queue_compaction_keeps_active_downloads(self):
+        """Test journal compaction snapshots active downloads as pending"""
+        if self.queue_class is None:
+            self.fail("DownloadQueue class not found")
+
+        queue1 = self.queue_class(max_concurrent=3)
+        queue1.JOURNAL_COMPACT_EVERY = 1
+        active_id = queue1.add(
+            video_url="https://www.youtube.com/watch?v=test0",
+            metadata={'title': 'Song 0'}
+        )
+        queue1.save(str(self.queue_file))
+        queue1.get_item(active_id)['status'] = 'downloading'
+
+        # Next mutation compacts: snapshot rewritten, journal truncated
+        queue1.add(
+            video_url="https://www.youtube.com/watch?v=test1",
+            metadata={'title': 'Song 1'}
+        )
+        self.assertEqual(Path(f"{self.queue_file}.journal").stat().st_size, 0)
+        self.assertEqual(queue1.get_item(active_id)['status'], 'downloading')
+
+        queue2 = self.queue_class(max_concurrent=3)
+        queue2.load(str(self.queue_file))
+
+        self.assertEqual(len(queue2.get_all()), 2)
+        self.assertEqual(queue2.get_item(active_id)['status'], 'pending')
+
 if __name__ == "__main__":
     unittest.main()
@@ -155,10 +155,14 @@ class TestDuplicateDetector(unittest.TestCase):
 
         mock_db = Mock()
         detector = self.detector_class(mock_db)
+        detector.fpcalc_checker.fpcalc_path = 'fpcalc'
 
-        # Mock acoustid fingerprint generation
-        with patch('acoustid.fingerprint_file') as mock_fp:
-            mock_fp.return_value = (354, 'AQAB1234fingerprint')
+        # Mock fpcalc fingerprint generation
+        with patch('src.core.duplicate_detector.subprocess.run') as mock_fp:
+            mock_fp.return_value = Mock(
+                returncode=0,
+                stdout=b'{"duration": 354.0, "fingerprint": "AQAB1234fingerprint"}'
+            )
 
             # Create temp file
             with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp:
@@ -171,9 +175,50 @@ class TestDuplicateDetector(unittest.TestCase):
                 # Should return fingerprint string
                 self.assertIsNotNone(fingerprint, "Fingerprint generation returned None")
                 self.assertIsInstance(fingerprint, str, "Fingerprint should be string")
+
+                # fpcalc path is passed per call, not via the FPCALC env var
+                self.assertEqual(mock_fp.call_args[0][0][0], 'fpcalc')
+                self.assertNotIn('env', mock_fp.call_args[1])
             finally:
                 os.unlink(tmp_path)
 
+    def test_07b_fingerprint_cache_reused_until_file_changes(self):
+        """Test cached fingerprints skip fpcalc while mtime/size match"""
+        if self.detector_class is None:
+            self.skipTest("Detector not implemented")
+
+        mock_db = Mock()
+        detector = self.detector_class(mock_db)
+
+        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp:
+            tmp.write(b'audio')
+            tmp_path = tmp.name
+
+        try:
+            stat = os.stat(tmp_path)
+            songs = [
+                {'id': 1, 'file_path': tmp_path, 'fingerprint': 'AQABsame',
+                 'fingerprint_mtime': stat.st_mtime, 'fingerprint_size': stat.st_size},
+                {'id': 2, 'file_path': tmp_path, 'fingerprint': 'AQABstale',
+                 'fingerprint_mtime': stat.st_mtime, 'fingerprint_size': stat.st_size + 1},
+            ]
+            mock_db.get_all_songs.return_value = songs
+
+            with patch.object(detector, '_generate_fingerprint') as mock_fp:
+                mock_fp.return_value = 'AQABsame'
+
+                duplicates = detector.detect_by_fingerprint()
+
+            # Only the stale entry is re-fingerprinted and written back
+            mock_fp.assert_called_once_with(tmp_path)
+            mock_db.update_fingerprint.assert_called_once_with(
+                2, 'AQABsame', stat.st_mtime, stat.st_size
+            )
+            self.assertEqual(len(duplicates), 1)
+            self.assertEqual(len(duplicates[0]['songs']), 2)
+        finally:
+            os.unlink(tmp_path)
+
     def test_08_detect_by_fingerprint_compares_signatures(self):
         """Test fingerprint comparison accuracy"""
         if self.detector_class is None:
@@ -199,6 +244,59 @@ class TestDuplicateDetector(unittest.TestCase):
             # Should detect as duplicates
             self.assertGreater(len(duplicates), 0, "Fingerprint comparison failed")
 
+    def test_08b_decode_fingerprint_matches_chromaprint(self):
+        """Test compressed fingerprint decoding against chromaprint's test vectors"""
+        import base64
+        from src.core.duplicate_detector import _decode_fingerprint
+
+        vectors = [
+            (bytes([0, 0, 0, 1, 1]), [1]),
+            (bytes([0, 0, 0, 1, 73, 0]), [7]),
+            (bytes([0, 0, 0, 1, 7, 0]), [1 << 6]),
+            (bytes([0, 0, 0, 1, 7, 2]), [1 << 8]),
+            (bytes([0, 0, 0, 2, 65, 0]), [1, 0]),
+            (bytes([0, 0, 0, 2, 1, 0]), [1, 1]),
+        ]
+        for data, expected in vectors:
+            encoded = base64.urlsafe_b64encode(data).decode().rstrip('=')
+            self.assertEqual(list(_decode_fingerprint(encoded)), expected)
+
+        self.assertIsNone(_decode_fingerprint('AQAB1234fingerprint'))
+
+    def test_08c_detect_by_fingerprint_matches_near_identical_audio(self):
+        """Test fingerprints differing in a few bits are grouped, unrelated ones are not"""
+        if self.detector_class is None:
+            self.skipTest("Detector not implemented")
+
+        import numpy as np
+        from src.core import duplicate_detector
+
+        mock_db = Mock()
+        detector = self.detector_class(mock_db)
+
+        rng = np.random.default_rng(42)
+        original = rng.integers(0, 2 ** 32, size=500, dtype=np.uint64).astype(np.uint32)
+        reencoded = original ^ np.uint32(1 << 3)  # one flipped bit per sub-fingerprint
+        unrelated = rng.integers(0, 2 ** 32, size=500, dtype=np.uint64).astype(np.uint32)
+        raw = {'fp_a': original, 'fp_b': reencoded, 'fp_c': unrelated}
+
+        songs = [
+            {'id': 1, 'duration': 200, 'file_path': '/path/1.mp3'},
+            {'id': 2, 'duration': 201, 'file_path': '/path/2.mp3'},
+            {'id': 3, 'duration': 200, 'file_path': '/path/3.mp3'},
+        ]
+        mock_db.get_all_songs.return_value = songs
+
+        with patch.object(detector, '_generate_fingerprint',
+                          side_effect=lambda path: {'/path/1.mp3': 'fp_a',
+                                                    '/path/2.mp3': 'fp_b',
+                                                    '/path/3.mp3': 'fp_c'}[path]), \
+                patch.object(duplicate_detector, '_decode_fingerprint', side_effect=raw.get):
+            duplicates = detector.detect_by_fingerprint()
+
+        self.assertEqual(len(duplicates), 1)
+        self.assertEqual(sorted(s['id'] for s in duplicates[0]['songs']), [1, 2])
+
     def test_09_detect_by_fingerprint_handles_missing_file(self):
         """Test graceful handling of missing files"""
         if self.detector_class is None:
@@ -257,6 +355,62 @@ class TestDuplicateDetector(unittest.TestCase):
             os.unlink(tmp1_path)
             os.unlink(tmp2_path)
 
+    def test_10b_detect_by_filesize_skips_missing_files(self):
+        """Test missing files are ignored and groups keep library order"""
+        if self.detector_class is None:
+            self.skipTest("Detector not implemented")
+
+        mock_db = Mock()
+        detector = self.detector_class(mock_db)
+
+        paths = []
+        for content in (b'x' * 1000, b'y' * 2000, b'z' * 1000):
+            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp:
+                tmp.write(content)
+                paths.append(tmp.name)
+
+        try:
+            songs = [{'id': i, 'file_path': path} for i, path in enumerate(paths)]
+            songs.append({'id': 3, 'file_path': '/nonexistent/missing.mp3'})
+            mock_db.get_all_songs.return_value = songs
+
+            duplicates = detector.detect_by_filesize()
+
+            self.assertEqual(len(duplicates), 1)
+            self.assertEqual([s['id'] for s in duplicates[0]['songs']], [0, 2])
+        finally:
+            for path in paths:
+                os.unlink(path)
+
+    def test_10c_detect_by_filesize_lists_large_directories(self):
+        """Test large directories are sized from one scandir listing"""
+        if self.detector_class is None:
+            self.skipTest("Detector not implemented")
+
+        from src.core import duplicate_detector
+
+        mock_db = Mock()
+        detector = self.detector_class(mock_db)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            songs = []
+            for i, size in enumerate([1000, 2000, 1000]):
+                path = os.path.join(tmp_dir, f'{i}.mp3')
+                with open(path, 'wb') as f:
+                    f.write(b'x' * size)
+                songs.append({'id': i, 'file_path': path})
+            songs.append({'id': 3, 'file_path': os.path.join(tmp_dir, 'missing.mp3')})
+            mock_db.get_all_songs.return_value = songs
+
+            with patch.object(duplicate_detector, '_SCANDIR_CACHES_STAT', True), \
+                    patch.object(duplicate_detector, 'SCANDIR_MIN_FILES', 2), \
+                    patch.object(duplicate_detector, '_file_size') as mock_stat:
+                duplicates = detector.detect_by_filesize()
+
+            mock_stat.assert_not_called()
+            self.assertEqual(len(duplicates), 1)
+            self.assertEqual([s['id'] for s in duplicates[0]['songs']], [0, 2])
+
     def test_11_detect_by_filesize_is_fast(self):
         """Test filesize detection completes quickly"""
         if self.detector_class is None:
@@ -386,6 +540,156 @@ class TestDuplicateDetector(unittest.TestCase):
         self.assertEqual(len(result), 0, "Single song should return no duplicates")
 
 
+    # ========== PERFORMANCE PATHS ==========
+
+    def test_16_cdist_pairs_match_pairwise_loop(self):
+        """Test vectorized (cdist) matching gives the same pairs as the Python loop"""
+        if self.detector_class is None:
+            self.skipTest("Detector not implemented")
+
+        from src.core import duplicate_detector
+        if not duplicate_detector.RAPIDFUZZ_AVAILABLE:
+            self.skipTest("rapidfuzz not installed")
+
+        detector = self.detector_class(Mock(), similarity_threshold=0.8)
+
+        songs = [
+            {'id': 1, 'title': 'Bohemian Rhapsody', 'artist': 'Queen', 'duration': 354},
+            {'id': 2, 'title': 'Bohemian Rhapsody (Remaster)', 'artist': 'Queen', 'duration': 356},
+            {'id': 3, 'title': 'Bohemian Rhapsody', 'artist': 'Queen', 'duration': 362},
+            {'id': 4, 'title': 'Hey Jude', 'artist': 'The Beatles', 'duration': 431},
+            {'id': 5, 'title': 'Hey Jude', 'artist': 'Beatles', 'duration': 430},
+            {'id': 6, 'title': None, 'artist': None, 'duration': None},
+        ]
+
+        loop_pairs = detector._find_similar_pairs_loop(songs)
+        cdist_pairs = detector._find_similar_pairs_cdist(songs)
+
+        self.assertEqual([p[:2] for p in loop_pairs], [p[:2] for p in cdist_pairs])
+        for loop_pair, cdist_pair in zip(loop_pairs, cdist_pairs):
+            self.assertAlmostEqual(loop_pair[2], cdist_pair[2])
+
+    def test_17_length_prefilter_keeps_all_matches(self):
+        """Test the title-length prefilter in the Python loop never drops a match"""
+        if self.detector_class is None:
+            self.skipTest("Detector not implemented")
+
+        detector = self.detector_class(Mock(), similarity_threshold=0.85)
+
+        songs = [
+            {'id': 1, 'title': 'Yesterday', 'artist': 'The Beatles', 'duration': 125},
+            {'id': 2, 'title': 'Yesterday (Remastered 2009 Version)', 'artist': 'The Beatles', 'duration': 125},
+            {'id': 3, 'title': 'Yesterdays', 'artist': 'The Beatles', 'duration': 126},
+            {'id': 4, 'title': 'Help!', 'artist': 'The Beatles', 'duration': 138},
+            {'id': 5, 'title': 'Help', 'artist': 'Beatles', 'duration': 139},
+        ]
+
+        expected = []
+        for i in range(len(songs)):
+            for j in range(i + 1, len(songs)):
+                similarity = detector._calculate_metadata_similarity(songs[i], songs[j])
+                if similarity >= detector.similarity_threshold:
+                    expected.append((i, j))
+
+        pairs = detector._find_similar_pairs_loop(songs)
+
+        self.assertEqual([p[:2] for p in pairs], expected)
+
+    def test_17b_loop_memoizes_repeated_title_artist(self):
+        """Test repeated (title, artist) pairs are scored once, and reused on rescan"""
+        if self.detector_class is None:
+            self.skipTest("Detector not implemented")
+
+        from src.core import duplicate_detector
+
+        detector = self.detector_class(Mock(), similarity_threshold=0.85)
+
+        # Two distinct (title, artist) keys, each appearing three times
+        songs = []
+        for i in range(3):
+            songs.append({'id': 2 * i, 'title': 'Hey Jude', 'artist': 'The Beatles', 'duration': 431})
+            songs.append({'id': 2 * i + 1, 'title': 'Hey Jud', 'artist': 'Beatles', 'duration': 430 + i})
+
+        with patch.object(duplicate_detector, '_string_ratio',
+                          wraps=duplicate_detector._string_ratio) as ratio:
+            pairs = detector._find_similar_pairs_loop(songs)
+
+        # Key pairs (a,a), (a,b), (b,a), (b,b) -> 4 title + 4 artist ratios
+        self.assertLessEqual(ratio.call_count, 8)
+        self.assertEqual(len(pairs), 15)
+
+        # Rescan on the same detector reuses the cross-scan cache
+        with patch.object(duplicate_detector, '_string_ratio',
+                          wraps=duplicate_detector._string_ratio) as ratio:
+            rescan_pairs = detector._find_similar_pairs_loop(songs)
+
+        ratio.assert_not_called()
+        self.assertEqual(rescan_pairs, pairs)
+
+    def test_17c_grouping_is_transitive_with_mean_confidence(self):
+        """Test chained matches form one group with mean pair confidence"""
+        if self.detector_class is None:
+            self.skipTest("Detector not implemented")
+
+        detector = self.detector_class(Mock())
+
+        # 0~2 and 2~5 (0 and 5 never matched directly), 3~4 separately
+        pairs = [(0, 2, 0.9), (2, 5, 0.8), (3, 4, 1.0)]
+
+        groups = detector._group_pairs(pairs)
+
+        self.assertEqual([members for members, _ in groups], [[0, 2, 5], [3, 4]])
+        self.assertAlmostEqual(groups[0][1], 0.85)
+        self.assertAlmostEqual(groups[1][1], 1.0)
+
+    def test_17d_duration_pruning_keeps_all_matches(self):
+        """Test duration-window pruning finds every pair a full comparison finds"""
+        if self.detector_class is None:
+            self.skipTest("Detector not implemented")
+
+        from src.core import duplicate_detector
+
+        songs = [
+            {'id': 1, 'title': 'Hey Jude', 'artist': 'The Beatles', 'duration': 431},
+            {'id': 2, 'title': 'Hey Jude', 'artist': 'The Beatles', 'duration': 434},
+            {'id': 3, 'title': 'Hey Jude', 'artist': 'The Beatles', 'duration': 440},
+            {'id': 4, 'title': 'Hey Jude', 'artist': 'The Beatles', 'duration': 200},
+            {'id': 5, 'title': 'Hey Jude', 'artist': 'Beatles', 'duration': None},
+            {'id': 6, 'title': 'Hey Jude (Live)', 'artist': 'The Beatles', 'duration': 438},
+        ]
+
+        for threshold in (0.8, 0.85, 0.95):
+            detector = self.detector_class(Mock(), similarity_threshold=threshold)
+
+            expected = []
+            for i in range(len(songs)):
+                for j in range(i + 1, len(songs)):
+                    if detector._calculate_metadata_similarity(songs[i], songs[j]) >= threshold:
+                        expected.append((i, j))
+
+            self.assertEqual([p[:2] for p in detector._find_similar_pairs_loop(songs)], expected)
+            if duplicate_detector.RAPIDFUZZ_AVAILABLE:
+                self.assertEqual([p[:2] for p in detector._find_similar_pairs_cdist(songs)], expected)
+
+    def test_18_exact_metadata_short_circuits(self):
+        """Test identical title/artist scores 1.0 without fuzzy matching"""
+        if self.detector_class is None:
+            self.skipTest("Detector not implemented")
+
+        from src.core import duplicate_detector
+
+        detector = self.detector_class(Mock(), similarity_threshold=0.85)
+
+        song1 = {'id': 1, 'title': 'Imagine', 'artist': 'John Lennon', 'duration': 183}
+        song2 = {'id': 2, 'title': 'imagine', 'artist': 'JOHN LENNON', 'duration': 184}
+
+        with patch.object(duplicate_detector, 'RAPIDFUZZ_AVAILABLE', False), \
+                patch.object(duplicate_detector, 'SequenceMatcher') as matcher:
+            similarity = detector._calculate_metadata_similarity(song1, song2)
+
+        self.assertEqual(similarity, 1.0)
+        matcher.assert_not_called()
+
 if __name__ == "__main__":
     # Run tests
     unittest.main(verbosity=2)
@@ -216,6 +216,40 @@ class TestKeyboardShortcutManager(unittest.TestCase):
         self.assertFalse(result, "Should not consume event in typing context")
         signal_mock.assert_not_called()
 
+    def test_13b_typing_context_follows_focus_changes(self):
+        """Typing context should be cached from QApplication.focusChanged"""
+        signal_mock = Mock()
+        self.manager.play_pause_requested.connect(signal_mock)
+
+        line_edit = QLineEdit()
+        widget = QWidget()
+        event = self._create_key_event(Qt.Key.Key_Space)
+
+        # Focus moves into a text field - shortcuts are ignored
+        self.app.focusChanged.emit(widget, line_edit)
+        self.assertFalse(self.manager.eventFilter(widget, event))
+        signal_mock.assert_not_called()
+
+        # Focus moves back to a plain widget - shortcuts work again
+        self.app.focusChanged.emit(line_edit, widget)
+        self.assertTrue(self.manager.eventFilter(widget, event))
+        signal_mock.assert_called_once()
+
+    def test_13c_unhandled_keys_and_modifiers_not_consumed(self):
+        """Non-shortcut keys and Shift/Alt combos should pass through"""
+        signal_mock = Mock()
+        self.manager.play_pause_requested.connect(signal_mock)
+        widget = QWidget()
+
+        for event in (
+            self._create_key_event(Qt.Key.Key_A),
+            self._create_key_event(Qt.Key.Key_Space, Qt.KeyboardModifier.ShiftModifier),
+            self._create_key_event(Qt.Key.Key_Space, Qt.KeyboardModifier.AltModifier),
+        ):
+            self.assertFalse(self.manager.eventFilter(widget, event))
+
+        signal_mock.assert_not_called()
+
     def test_14_all_shortcuts_listed(self):
         """get_shortcuts() should return list of all shortcuts"""
         shortcuts = self.manager.get_shortcuts()
@@ -77,6 +77,55 @@ class TestLibraryOrganizer(unittest.TestCase):
 
         self.assertEqual(str(path), expected)
 
+    def test_02b_organizer_caches_parsed_template(self):
+        """Test template is parsed once and formats like str.format"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        organizer = self.organizer_class(Mock())
+
+        template = "{genre}/{artist}/{album} ({year})/{track:02d} - {title}.mp3"
+        songs = [
+            {'title': 'Song A', 'artist': 'Queen', 'album': 'Jazz', 'genre': 'Rock', 'year': 1978, 'track': 3},
+            {'title': 'Song B', 'artist': 'Queen', 'album': 'Jazz', 'genre': 'Rock', 'year': 1978, 'track': 12},
+        ]
+
+        from src.core import library_organizer
+        formatter = library_organizer._FORMATTER
+
+        with patch.object(formatter, 'parse', wraps=formatter.parse) as mock_parse:
+            paths = [organizer.build_path(self.temp_dir, template, song) for song in songs]
+
+        self.assertEqual(mock_parse.call_count, 1)
+        for song, path in zip(songs, paths):
+            self.assertEqual(str(path), os.path.join(self.temp_dir, template.format(**song)))
+
+    def test_02c_organizer_compiles_plain_templates(self):
+        """Test plain templates are specialized and format like the generic path"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        organizer = self.organizer_class(Mock())
+
+        template = "{genre}/{artist}/{album} ({year!s})/{track:02d} - {title}.mp3"
+        song = {'title': 'Song?', 'artist': 'AC/DC', 'album': 'Back in Black',
+                'year': 1980, 'track': 6, 'genre': 'Rock'}
+
+        self.assertIsNotNone(organizer._compile_template(template))
+        self.assertIsNone(organizer._compile_template("{artist.upper}/{title}.mp3"))
+
+        compiled_path = organizer.build_path(self.temp_dir, template, song)
+
+        # Same result through the generic Formatter path
+        organizer._compiled_templates[template] = None
+        generic_path = organizer.build_path(self.temp_dir, template, song)
+
+        self.assertEqual(compiled_path, generic_path)
+        self.assertEqual(
+            str(compiled_path),
+            os.path.join(self.temp_dir, "Rock", "AC_DC", "Back in Black (1980)", "06 - Song_.mp3")
+        )
+
     def test_03_organizer_sanitizes_folder_names(self):
         """Test invalid characters removed from paths"""
         if self.organizer_class is None:
@@ -150,6 +199,32 @@ class TestLibraryOrganizer(unittest.TestCase):
         # Directory should now exist
         self.assertTrue(os.path.exists(target_dir))
 
+    def test_05b_organizer_creates_each_directory_once(self):
+        """Test songs sharing a folder trigger a single makedirs"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        organizer = self.organizer_class(Mock())
+
+        songs = []
+        for i in range(3):
+            source_file = os.path.join(self.temp_dir, f"track{i}.mp3")
+            with open(source_file, 'w') as f:
+                f.write("x")
+            songs.append({'id': i, 'title': f'Song {i}', 'artist': 'Artist',
+                          'album': 'Album', 'file_path': source_file})
+
+        output_dir = os.path.join(self.temp_dir, "library")
+        with patch('src.core.library_organizer.os.makedirs', wraps=os.makedirs) as mock_makedirs:
+            result = organizer.organize(output_dir, "{artist}/{album}/{title}.mp3", songs, move=True)
+
+        self.assertEqual(result['success'], 3)
+
+        # os.makedirs recurses into itself for missing parents; count our calls only
+        album_dir = os.path.join(output_dir, "Artist", "Album")
+        album_calls = [c for c in mock_makedirs.call_args_list if c.args[0] == album_dir]
+        self.assertEqual(len(album_calls), 1)
+
     def test_06_organizer_moves_files(self):
         """Test file moving works"""
         if self.organizer_class is None:
@@ -177,6 +252,90 @@ class TestLibraryOrganizer(unittest.TestCase):
 
         self.assertTrue(result)
 
+    def test_06b_organizer_moves_across_filesystems(self):
+        """Test cross-device moves fall back to shutil.move and are remembered"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        import errno
+
+        organizer = self.organizer_class(Mock())
+
+        sources = []
+        for i in range(2):
+            source_file = os.path.join(self.temp_dir, f"source{i}.mp3")
+            with open(source_file, 'w') as f:
+                f.write(f"content {i}")
+            sources.append(source_file)
+
+        target_dir = os.path.join(self.temp_dir, "other_fs")
+        cross_device = OSError(errno.EXDEV, "Invalid cross-device link")
+
+        def copy_and_delete(source, target):
+            shutil.copy2(source, target)
+            os.remove(source)
+
+        with patch('src.core.library_organizer.os.rename', side_effect=cross_device) as mock_rename, \
+             patch('src.core.library_organizer.shutil.move', side_effect=copy_and_delete) as mock_move:
+            for i, source_file in enumerate(sources):
+                self.assertTrue(organizer._move_file(source_file, os.path.join(target_dir, f"t{i}.mp3")))
+
+        # Rename tried once; the second move goes straight to copy + delete
+        mock_rename.assert_called_once()
+        self.assertEqual(mock_move.call_count, 2)
+        for i, source_file in enumerate(sources):
+            self.assertFalse(os.path.exists(source_file))
+            with open(os.path.join(target_dir, f"t{i}.mp3")) as f:
+                self.assertEqual(f.read(), f"content {i}")
+
+    def test_06c_organizer_copies_files_with_metadata(self):
+        """Test copies keep contents and modification time"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        from src.core import library_organizer
+
+        organizer = self.organizer_class(Mock())
+
+        source_file = os.path.join(self.temp_dir, "source.mp3")
+        with open(source_file, 'wb') as f:
+            f.write(os.urandom(300_000))
+        os.utime(source_file, (1_600_000_000, 1_600_000_000))
+
+        targets = [os.path.join(self.temp_dir, name) for name in ("fast.mp3", "fallback.mp3")]
+        self.assertTrue(organizer._copy_file(source_file, targets[0]))
+        with patch.object(library_organizer, 'COPY_FILE_RANGE_AVAILABLE', False):
+            self.assertTrue(organizer._copy_file(source_file, targets[1]))
+
+        with open(source_file, 'rb') as f:
+            content = f.read()
+        for target in targets:
+            with open(target, 'rb') as f:
+                self.assertEqual(f.read(), content)
+            self.assertEqual(os.stat(target).st_mtime, 1_600_000_000)
+
+    @unittest.skipUnless(hasattr(os, 'copy_file_range'), "os.copy_file_range not available")
+    def test_06d_organizer_copy_falls_back_when_unsupported(self):
+        """Test unsupported copy_file_range falls back to shutil.copy2"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        import errno
+
+        organizer = self.organizer_class(Mock())
+
+        source_file = os.path.join(self.temp_dir, "source.mp3")
+        with open(source_file, 'w') as f:
+            f.write("test content")
+        target_file = os.path.join(self.temp_dir, "target.mp3")
+
+        unsupported = OSError(errno.EXDEV, "Invalid cross-device link")
+        with patch('src.core.library_organizer.os.copy_file_range', side_effect=unsupported):
+            self.assertTrue(organizer._copy_file(source_file, target_file))
+
+        with open(target_file) as f:
+            self.assertEqual(f.read(), "test content")
+
     def test_07_organizer_updates_database_paths(self):
         """Test database updated after move"""
         if self.organizer_class is None:
@@ -213,6 +372,24 @@ class TestLibraryOrganizer(unittest.TestCase):
         self.assertNotEqual(new_path, existing_file)
         self.assertTrue("song" in os.path.basename(new_path))
 
+    def test_08b_organizer_conflicts_use_one_directory_listing(self):
+        """Test conflict resolution lists the directory instead of stat'ing names"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        organizer = self.organizer_class(Mock())
+
+        for name in ("song.mp3", "song_1.mp3", "song_2.mp3"):
+            with open(os.path.join(self.temp_dir, name), 'w') as f:
+                f.write("existing")
+
+        existing_file = os.path.join(self.temp_dir, "song.mp3")
+        with patch('src.core.library_organizer.os.scandir', wraps=os.scandir) as mock_scandir:
+            new_path = organizer._handle_name_conflict(existing_file)
+
+        self.assertEqual(new_path, os.path.join(self.temp_dir, "song_3.mp3"))
+        mock_scandir.assert_called_once_with(self.temp_dir)
+
     def test_09_organizer_preview_mode(self):
         """Test preview without actual moves"""
         if self.organizer_class is None:
@@ -249,6 +426,42 @@ class TestLibraryOrganizer(unittest.TestCase):
         # Should return preview data
         self.assertIn('preview', result)
 
+    def test_09b_organizer_streams_songs_in_chunks(self):
+        """Test generators are organized chunk by chunk with conflicts across chunks"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        from src.core import library_organizer
+
+        mock_db = Mock()
+        organizer = self.organizer_class(mock_db)
+
+        def song_stream():
+            for i in range(5):
+                source_file = os.path.join(self.temp_dir, f"track{i}.mp3")
+                with open(source_file, 'w') as f:
+                    f.write(f"content {i}")
+                yield {'id': i, 'title': 'Song', 'artist': 'Artist', 'file_path': source_file}
+
+        output_dir = os.path.join(self.temp_dir, "library")
+        previews = []
+        with patch.object(library_organizer, 'ORGANIZE_CHUNK_SIZE', 2):
+            preview = organizer.organize(output_dir, "{artist}/{title}.mp3", song_stream(),
+                                         dry_run=True, on_preview=previews.append)
+            result = organizer.organize(output_dir, "{artist}/{title}.mp3", song_stream())
+
+        # Previews go to the callback, not the result
+        self.assertEqual(len(previews), 5)
+        self.assertEqual(preview['preview'], [])
+
+        self.assertEqual(result['success'], 5)
+        self.assertEqual(mock_db.update_song_paths_bulk.call_count, 3)
+        artist_dir = os.path.join(output_dir, "Artist")
+        self.assertEqual(
+            sorted(os.listdir(artist_dir)),
+            ["Song.mp3", "Song_1.mp3", "Song_2.mp3", "Song_3.mp3", "Song_4.mp3"]
+        )
+
     def test_10_organizer_rollback_on_error(self):
         """Test rollback if error during organization"""
         if self.organizer_class is None:
@@ -266,6 +479,111 @@ class TestLibraryOrganizer(unittest.TestCase):
             "Organizer missing rollback capability"
         )
 
+    def test_10b_organizer_moves_files_concurrently(self):
+        """Test parallel organize keeps conflict names and DB updates in order"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        mock_db = Mock()
+        organizer = self.organizer_class(mock_db)
+
+        source_dir = os.path.join(self.temp_dir, "incoming")
+        os.makedirs(source_dir)
+
+        # Three songs that map to the same target file
+        songs = []
+        for i in range(3):
+            source_file = os.path.join(source_dir, f"track{i}.mp3")
+            with open(source_file, 'w') as f:
+                f.write(f"content {i}")
+            songs.append({'id': i, 'title': 'Song', 'artist': 'Artist',
+                          'album': 'Album', 'file_path': source_file})
+
+        output_dir = os.path.join(self.temp_dir, "library")
+        result = organizer.organize(output_dir, "{artist}/{album}/{title}.mp3", songs, move=True)
+
+        self.assertEqual(result['success'], 3)
+        self.assertEqual(result['failed'], 0)
+
+        album_dir = os.path.join(output_dir, "Artist", "Album")
+        expected = [os.path.join(album_dir, name) for name in ("Song.mp3", "Song_1.mp3", "Song_2.mp3")]
+        for i, path in enumerate(expected):
+            with open(path) as f:
+                self.assertEqual(f.read(), f"content {i}")
+
+        # One bulk database update, in input order
+        mock_db.update_song_paths_bulk.assert_called_once_with(list(enumerate(expected)))
+        mock_db.update_song_path.assert_not_called()
+
+    def test_10c_organizer_falls_back_to_per_song_db_updates(self):
+        """Test failed bulk update retries each song and reports failures"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        mock_db = Mock()
+        mock_db.update_song_paths_bulk.return_value = None
+        mock_db.update_song_path.side_effect = [True, RuntimeError("db locked")]
+        organizer = self.organizer_class(mock_db)
+
+        songs = []
+        for i in range(2):
+            source_file = os.path.join(self.temp_dir, f"track{i}.mp3")
+            with open(source_file, 'w') as f:
+                f.write("x")
+            songs.append({'id': i, 'title': f'Song {i}', 'artist': 'Artist',
+                          'file_path': source_file})
+
+        output_dir = os.path.join(self.temp_dir, "library")
+        result = organizer.organize(output_dir, "{artist}/{title}.mp3", songs, move=False)
+
+        self.assertEqual(mock_db.update_song_path.call_count, 2)
+        self.assertEqual(result['success'], 1)
+        self.assertEqual(result['failed'], 1)
+        self.assertIn("db locked", result['errors'][0])
+
+    def test_10d_organizer_treats_case_variants_as_conflicts(self):
+        """Test titles differing only in case get distinct names (case-insensitive filesystems)"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        mock_db = Mock()
+        organizer = self.organizer_class(mock_db)
+
+        songs = []
+        for i, title in enumerate(("Intro", "intro")):
+            source_file = os.path.join(self.temp_dir, f"track{i}.mp3")
+            with open(source_file, 'w') as f:
+                f.write(f"content {i}")
+            songs.append({'id': i, 'title': title, 'artist': 'X', 'file_path': source_file})
+
+        output_dir = os.path.join(self.temp_dir, "library")
+        result = organizer.organize(output_dir, "{artist}/{title}.mp3", songs, move=True)
+
+        self.assertEqual(result['success'], 2)
+        expected = [os.path.join(output_dir, "X", "Intro.mp3"), os.path.join(output_dir, "X", "intro_1.mp3")]
+        mock_db.update_song_paths_bulk.assert_called_once_with(list(enumerate(expected)))
+        for i, path in enumerate(expected):
+            with open(path) as f:
+                self.assertEqual(f.read(), f"content {i}")
+
+    def test_10e_organizer_reports_songs_without_id(self):
+        """Test songs without a database ID are reported as failures, not moved"""
+        if self.organizer_class is None:
+            self.skipTest("Organizer not implemented")
+
+        organizer = self.organizer_class(Mock())
+        source_file = os.path.join(self.temp_dir, "track.mp3")
+        with open(source_file, 'w') as f:
+            f.write("x")
+
+        output_dir = os.path.join(self.temp_dir, "library")
+        result = organizer.organize(output_dir, "{title}.mp3",
+                                    [{'title': 'Song', 'file_path': source_file}], move=True)
+
+        self.assertEqual(result['failed'], 1)
+        self.assertIn("no database ID", result['errors'][0])
+        self.assertTrue(os.path.exists(source_file))
+
     # ========== PERFORMANCE TEST ==========
 
     def test_11_organizer_processes_1000_files_fast(self):
@@ -265,6 +265,56 @@ class TestMetadataAutocompleter(unittest.TestCase):
             self.assertGreaterEqual(confidence, 90)
             self.assertLessEqual(confidence, 100)
 
+    def test_repeated_search_uses_cache(self):
+        """Test repeated (title, artist) pairs hit MusicBrainz once"""
+        if self.autocompleter_class is None:
+            self.fail("MetadataAutocompleter class not found")
+
+        autocompleter = self.autocompleter_class()
+
+        song = {'id': 'song-1', 'title': 'Song', 'artist': 'Artist'}
+        missing = {'id': 'song-2', 'title': 'Missing', 'artist': 'Artist'}
+
+        def mock_search(title, artist=None):
+            if title == 'Song':
+                return [{'title': 'Song', 'artist': 'Artist', 'album': 'Album',
+                         'year': '2020', 'genre': 'pop'}]
+            return []
+
+        with patch.object(autocompleter.mb_client, 'search_recording',
+                          side_effect=mock_search) as search:
+            first = autocompleter.autocomplete_single(song)
+            second = autocompleter.autocomplete_single(song)
+            autocompleter.autocomplete_single(missing)
+            autocompleter.autocomplete_single(missing)
+
+        self.assertEqual(first, second)
+        self.assertEqual(second[0]['album'], 'Album')
+
+        # Found once; empty results (possibly errors) are retried every time
+        titles = [call.args[0] for call in search.call_args_list]
+        self.assertEqual(titles, ['Song', 'Missing', 'Missing'])
+
+    def test_fuzzy_match_difflib_fallback_agrees(self):
+        """Test difflib fallback scores the same as rapidfuzz ratio"""
+        if self.autocompleter_class is None:
+            self.fail("MetadataAutocompleter class not found")
+
+        from src.core import metadata_autocompleter as module
+
+        autocompleter = self.autocompleter_class()
+        pairs = [('bohemian rhapsody', 'bohemian rapsody'),
+                 ('song title (radio edit)', 'song title'),
+                 ('queen', 'queen')]
+
+        fast = [autocompleter._fuzzy_match(a, b) for a, b in pairs]
+        with patch.object(module, 'RAPIDFUZZ_AVAILABLE', False):
+            slow = [autocompleter._fuzzy_match(a, b) for a, b in pairs]
+
+        for fast_ratio, slow_ratio in zip(fast, slow):
+            self.assertAlmostEqual(fast_ratio, slow_ratio, places=6)
+        self.assertEqual(autocompleter._fuzzy_match('', 'queen'), 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,191 @@
+"""
+Tests for MetadataFetcher (multi-source search, scoring and caching)
+"""
+import unittest
+from unittest.mock import Mock, patch
+
+
+def _mb_recording(title, artist, seconds=200):
+    """Raw MusicBrainz recording as returned by search_recordings()"""
+    return {'title': title, 'artist-credit': [{'name': artist}], 'length': seconds * 1000}
+
+
+def _spotify_track(title, artist, seconds=200):
+    """Raw Spotify track as returned by search_tracks()"""
+    return {'name': title, 'artists': [{'name': artist}], 'duration_ms': seconds * 1000}
+
+
+class TestMetadataFetcher(unittest.TestCase):
+    """Test MetadataFetcher source order, early stops and caches"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        from src.core import metadata_fetcher
+        self.module = metadata_fetcher
+        self.mb_client = Mock()
+        self.mb_client.search_recordings.return_value = []
+        self.spotify_client = Mock()
+        self.spotify_client.search_tracks.return_value = []
+        self.fetcher = metadata_fetcher.MetadataFetcher(self.mb_client, self.spotify_client)
+
+    def test_fetch_metadata_stops_at_perfect_match(self):
+        """Test a MusicBrainz match >= PERFECT_MATCH_SCORE skips Spotify"""
+        self.mb_client.search_recordings.return_value = [_mb_recording("Song", "Artist")]
+        self.spotify_client.search_tracks.return_value = [_spotify_track("Song", "Artist")]
+
+        best = self.fetcher.fetch_metadata("Song", "Artist", duration=200)
+
+        self.assertEqual(best['source'], 'musicbrainz')
+        self.assertGreaterEqual(best['score'], self.module.PERFECT_MATCH_SCORE)
+        self.mb_client.search_recordings.assert_called_once()
+        self.spotify_client.search_tracks.assert_not_called()
+
+    def test_fetch_metadata_falls_back_to_spotify(self):
+        """Test Spotify is queried when MusicBrainz has no near-perfect match"""
+        self.mb_client.search_recordings.return_value = [_mb_recording("Song (Live)", "Artist")]
+        self.spotify_client.search_tracks.return_value = [_spotify_track("Song", "Artist")]
+
+        best = self.fetcher.fetch_metadata("Song", "Artist", duration=200)
+
+        self.assertEqual(best['source'], 'spotify')
+        self.assertEqual(best['score'], 100.0)
+        self.spotify_client.search_tracks.assert_called_once()
+
+    def test_search_iter_yields_each_source_best_first(self):
+        """Test search_iter yields MusicBrainz then Spotify, each sorted by score"""
+        self.mb_client.search_recordings.return_value = [
+            _mb_recording("Other", "Someone"),
+            _mb_recording("Song", "Artist"),
+            _mb_recording("Song (Live)", "Artist"),
+        ]
+        self.spotify_client.search_tracks.return_value = [
+            _spotify_track("Song (Remix)", "Artist"),
+            _spotify_track("Song", "Artist"),
+        ]
+
+        results = list(self.fetcher.search_iter("Song", "Artist", duration=200))
+
+        self.assertEqual([r['source'] for r in results], ['musicbrainz'] * 3 + ['spotify'] * 2)
+        mb_scores = [r['score'] for r in results[:3]]
+        spotify_scores = [r['score'] for r in results[3:]]
+        self.assertEqual(mb_scores, sorted(mb_scores, reverse=True))
+        self.assertEqual(spotify_scores, sorted(spotify_scores, reverse=True))
+        self.assertEqual(results[0]['title'], "Song")
+
+    def test_search_iter_stopped_early_skips_spotify(self):
+        """Test a consumer stopping after the first result never queries Spotify"""
+        self.mb_client.search_recordings.return_value = [_mb_recording("Song", "Artist")]
+
+        first = next(self.fetcher.search_iter("Song", "Artist"))
+
+        self.assertEqual(first['source'], 'musicbrainz')
+        self.spotify_client.search_tracks.assert_not_called()
+
+    def test_lookup_cache_reuses_results(self):
+        """Test repeated lookups (any case/whitespace) skip the API calls"""
+        self.mb_client.search_recordings.return_value = [_mb_recording("Song", "Artist")]
+
+        first = self.fetcher.search_by_title_artist("Song", "Artist", duration=200)
+        first.clear()  # Callers get a copy, not the cached list
+        second = self.fetcher.search_by_title_artist(" SONG", "artist ", duration=200)
+
+        self.assertEqual(len(second), 1)
+        self.assertEqual(self.mb_client.search_recordings.call_count, 1)
+
+        # Duration is part of the key (it changes the scores)
+        self.fetcher.search_by_title_artist("Song", "Artist", duration=100)
+        self.assertEqual(self.mb_client.search_recordings.call_count, 2)
+
+    def test_lookup_cache_is_bounded_lru(self):
+        """Test the lookup cache evicts the least recently used query"""
+        self.mb_client.search_recordings.return_value = [_mb_recording("Song", "Artist")]
+
+        with patch.object(self.module, 'LOOKUP_CACHE_SIZE', 2):
+            self.fetcher.search_by_title_artist("A", "Artist")
+            self.fetcher.search_by_title_artist("B", "Artist")
+            self.fetcher.search_by_title_artist("A", "Artist")  # 'B' is now oldest
+            self.fetcher.search_by_title_artist("C", "Artist")
+            self.assertEqual(self.mb_client.search_recordings.call_count, 3)
+
+            self.fetcher.search_by_title_artist("A", "Artist")
+            self.assertEqual(self.mb_client.search_recordings.call_count, 3)
+            self.fetcher.search_by_title_artist("B", "Artist")
+            self.assertEqual(self.mb_client.search_recordings.call_count, 4)
+
+    def test_lookup_cache_skips_partial_results(self):
+        """Test results from a lookup where a source failed are not cached"""
+        self.mb_client.search_recordings.return_value = [_mb_recording("Song", "Artist")]
+        self.spotify_client.search_tracks.side_effect = ConnectionError("offline")
+
+        for _ in range(2):
+            results = self.fetcher.search_by_title_artist("Song", "Artist")
+            self.assertEqual([r['source'] for r in results], ['musicbrainz'])
+        self.assertEqual(list(self.fetcher.search_iter("Song", "Artist"))[0]['source'], 'musicbrainz')
+        self.assertEqual(self.spotify_client.search_tracks.call_count, 3)
+
+        # Once every source answers, the complete result list is cached
+        self.spotify_client.search_tracks.side_effect = None
+        self.spotify_client.search_tracks.return_value = [_spotify_track("Song", "Artist")]
+        self.assertEqual(len(self.fetcher.search_by_title_artist("Song", "Artist")), 2)
+        self.assertEqual(len(self.fetcher.search_by_title_artist("Song", "Artist")), 2)
+        self.assertEqual(self.spotify_client.search_tracks.call_count, 4)
+
+    def test_min_confidence_early_exit_stays_below_threshold(self):
+        """Test early-exit (partial) scores stay below min_confidence"""
+        candidates = [_mb_recording("Completely Different", "Artist"),
+                      _mb_recording("Song", "Artist")]
+        self.mb_client.search_recordings.return_value = candidates
+        fetcher = self.module.MetadataFetcher(self.mb_client)
+
+        full = fetcher.search_by_title_artist("Song", "Artist")
+        partial = fetcher.search_by_title_artist("Song", "Artist", min_confidence=70.0)
+
+        full_scores = {r['title']: r['score'] for r in full}
+        partial_scores = {r['title']: r['score'] for r in partial}
+
+        # The weak candidate skipped the artist comparison...
+        self.assertLess(partial_scores["Completely Different"],
+                        full_scores["Completely Different"])
+        self.assertLess(full_scores["Completely Different"], 70.0)
+        self.assertLess(partial_scores["Completely Different"], 70.0)
+        # ...while a candidate that can pass is scored in full
+        self.assertEqual(partial_scores["Song"], full_scores["Song"])
+        self.assertEqual(fetcher.get_best_match(partial, 70.0)['title'], "Song")
+
+    def test_negative_cache_skips_known_misses(self):
+        """Test a title/artist no source found is not searched again within the TTL"""
+        with patch.object(self.module.time, 'monotonic', return_value=1000.0):
+            self.assertEqual(self.fetcher.search_by_title_artist("Song", "Artist"), [])
+            self.assertEqual(list(self.fetcher.search_iter("Song", "Artist", duration=200)), [])
+        self.assertEqual(self.mb_client.search_recordings.call_count, 1)
+        self.assertEqual(self.spotify_client.search_tracks.call_count, 1)
+
+        expired = 1000.0 + self.module.NEGATIVE_CACHE_TTL
+        with patch.object(self.module.time, 'monotonic', return_value=expired):
+            self.fetcher.search_by_title_artist("Song", "Artist")
+        self.assertEqual(self.mb_client.search_recordings.call_count, 2)
+
+    def test_negative_cache_ignores_failed_sources(self):
+        """Test an outage of any source is not remembered as a miss"""
+        self.spotify_client.search_tracks.side_effect = ConnectionError("offline")
+
+        self.assertEqual(self.fetcher.search_by_title_artist("Song", "Artist"), [])
+        self.assertEqual(list(self.fetcher.search_iter("Song", "Artist")), [])
+        self.assertEqual(self.mb_client.search_recordings.call_count, 2)
+
+        self.spotify_client.search_tracks.side_effect = None
+        self.spotify_client.search_tracks.return_value = [_spotify_track("Song", "Artist")]
+        results = self.fetcher.search_by_title_artist("Song", "Artist")
+        self.assertEqual(results[0]['source'], 'spotify')
+
+    def test_negative_cache_is_bounded(self):
+        """Test the negative cache drops its oldest entries beyond NEGATIVE_CACHE_SIZE"""
+        with patch.object(self.module, 'NEGATIVE_CACHE_SIZE', 2):
+            for title in ("A", "B", "C"):
+                self.fetcher.search_by_title_artist(title, "Artist")
+
+        self.assertEqual(list(self.fetcher._negative_cache), [("b", "artist"), ("c", "artist")])
+
+
+if __name__ == '__main__':
+    unittest.main()
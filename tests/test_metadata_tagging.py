@@ -40,6 +40,14 @@ class TestMetadataTagger(unittest.TestCase):
         self.assertTrue(hasattr(self.tagger, 'autocompleter'))
         self.assertIsNotNone(self.tagger.autocompleter)
 
+    def test_metadata_tagger_shares_autocompleter(self):
+        """Test taggers share one MetadataAutocompleter (one MusicBrainz client)"""
+        if self.tagger_class is None:
+            self.fail("MetadataTagger class not found")
+
+        other = self.tagger_class()
+        self.assertIs(other.autocompleter, self.tagger.autocompleter)
+
     def test_metadata_tagger_tag_file_method_exists(self):
         """Test MetadataTagger has tag_file method"""
         if self.tagger is None:
@@ -153,6 +161,77 @@ class TestMetadataTagger(unittest.TestCase):
             # Genre tag should be written
             self.assertTrue(hasattr(self.tagger, 'tag_file'))
 
+    def test_metadata_tagger_skips_save_when_tags_match(self):
+        """Test tag_file does not rewrite a file whose tags already match"""
+        if self.tagger is None:
+            self.fail("MetadataTagger not initialized")
+
+        metadata = {'title': 'Test Song', 'artist': 'Test Artist', 'year': 1975}
+
+        with patch('src.core.metadata_tagger.MP3') as mock_mp3:
+            mock_audio = MagicMock()
+            mock_audio.tags = {
+                'TIT2': Mock(text=['Test Song']),
+                'TPE1': Mock(text=['Test Artist']),
+                'TDRC': Mock(text=['1975']),
+            }
+            mock_mp3.return_value = mock_audio
+
+            self.assertTrue(self.tagger.tag_file('test.mp3', metadata))
+            mock_audio.save.assert_not_called()
+
+            # A changed field is written and saved
+            self.assertTrue(self.tagger.tag_file('test.mp3', {**metadata, 'title': 'New Title'}))
+            mock_audio.save.assert_called_once()
+            self.assertEqual(list(mock_audio.tags['TIT2'].text), ['New Title'])
+
+    def test_metadata_tagger_tag_and_art_single_save(self):
+        """Test tag_and_art loads and saves the file once"""
+        if self.tagger is None:
+            self.fail("MetadataTagger not initialized")
+
+        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as img:
+            img.write(b'\x89PNG fake image')
+        self.addCleanup(os.unlink, img.name)
+
+        with patch('src.core.metadata_tagger.MP3') as mock_mp3:
+            mock_audio = MagicMock()
+            mock_audio.tags = {}
+            mock_mp3.return_value = mock_audio
+
+            result = self.tagger.tag_and_art('test.mp3', {'title': 'Song'}, img.name)
+
+            self.assertTrue(result)
+            mock_mp3.assert_called_once()
+            mock_audio.save.assert_called_once()
+            self.assertIn('TIT2', mock_audio.tags)
+            self.assertEqual(mock_audio.tags['APIC'].mime, 'image/png')
+
+    def test_metadata_tagger_tag_files_batch(self):
+        """Test tag_files tags every item and keeps per-file order"""
+        if self.tagger is None:
+            self.fail("MetadataTagger not initialized")
+
+        items = [
+            ('a.mp3', {'title': 'A1'}),
+            ('b.mp3', {'title': 'B'}),
+            ('a.mp3', {'title': 'A2'}),
+            ('missing.mp3', {'title': 'M'}),
+        ]
+        calls = []
+
+        def fake_tag_file(file_path, metadata):
+            calls.append((file_path, metadata['title']))
+            return file_path != 'missing.mp3'
+
+        with patch.object(self.tagger, 'tag_file', side_effect=fake_tag_file):
+            results = self.tagger.tag_files(items, workers=4)
+
+        self.assertEqual(results, [True, True, True, False])
+        self.assertEqual(len(calls), 4)
+        a_titles = [title for path, title in calls if path == 'a.mp3']
+        self.assertEqual(a_titles, ['A1', 'A2'])
+
     def test_metadata_tagger_handles_missing_file(self):
         """Test MetadataTagger handles missing file gracefully"""
         if self.tagger is None:
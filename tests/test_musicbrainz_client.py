@@ -248,6 +248,34 @@ class TestMusicBrainzClient(unittest.TestCase):
         self.assertTrue(hasattr(client, '_rate_limiter') or hasattr(client, '_last_request_time'),
                        "Client should have rate limiting mechanism")
 
+    def test_rate_limit_reserves_slots_across_threads(self):
+        """Test concurrent callers are spaced 1 second apart"""
+        if self.client_class is None:
+            self.fail("MusicBrainzClient class not found")
+
+        import threading
+
+        client = self.client_class()
+        client._last_request_time = 0
+        sleeps = []
+        sleeps_lock = threading.Lock()
+
+        def record_sleep(seconds):
+            with sleeps_lock:
+                sleeps.append(round(seconds, 3))
+
+        with patch('src.api.musicbrainz_client.time.time', return_value=1000.0), \
+             patch('src.api.musicbrainz_client.time.sleep', side_effect=record_sleep):
+            threads = [threading.Thread(target=client._enforce_rate_limit) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # First caller goes immediately, the rest wait for their own slot
+        self.assertEqual(sorted(sleeps), [1.0, 2.0, 3.0])
+        self.assertEqual(client._last_request_time, 1003.0)
+
     def test_search_recording_extracts_genre_from_tags(self):
         """Test genre extraction from MusicBrainz tags"""
         if self.client_class is None:
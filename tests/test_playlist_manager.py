@@ -16,7 +16,9 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
 import os
+import shutil
 from pathlib import Path
+from typing import List
 
 
 class TestPlaylistManager(unittest.TestCase):
@@ -28,7 +30,7 @@ class TestPlaylistManager(unittest.TestCase):
             from src.core.playlist_manager import PlaylistManager
 
             # Mock database manager
-            self.mock_db = Mock()
+            self.mock_db = MagicMock()
             self.manager = PlaylistManager(self.mock_db)
         except ImportError:
             self.manager = None
@@ -197,9 +199,9 @@ class TestPlaylistManager(unittest.TestCase):
         try:
             # Mock database methods
             self.mock_db.execute_query.return_value = 1  # New playlist ID
-            self.mock_db.fetch_one.side_effect = [
-                {'id': 100},  # Song A found
-                {'id': 200},  # Song B found
+            self.mock_db.fetch_all.return_value = [
+                {'id': 200, 'file_path': '/path/b.mp3'},  # Song B found
+                {'id': 100, 'file_path': '/path/a.mp3'},  # Song A found
             ]
 
             # Load playlist
@@ -209,6 +211,11 @@ class TestPlaylistManager(unittest.TestCase):
             self.assertIsInstance(playlist_id, int)
             self.assertGreater(playlist_id, 0)
 
+            # One lookup for all paths, songs inserted in file order
+            self.mock_db.fetch_all.assert_called_once()
+            rows = self.mock_db.execute_many.call_args[0][1]
+            self.assertEqual(rows, [(1, 100, 0), (1, 200, 1)])
+
         finally:
             # Cleanup
             if os.path.exists(temp_path):
@@ -281,6 +288,118 @@ class TestPlaylistManager(unittest.TestCase):
             self.assertEqual(stats['song_count'], 50)
 
 
+class TestPlaylistManagerDatabase(unittest.TestCase):
+    """Test Playlist Manager against a real DatabaseManager (migrated schema)"""
+
+    def setUp(self):
+        """Setup a temporary database with the real migrations applied"""
+        from src.core.playlist_manager import PlaylistManager
+        from src.database.manager import DatabaseManager
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.temp_dir, "library.db"))
+        self.manager = PlaylistManager(self.db)
+
+    def tearDown(self):
+        """Close the database and remove its files"""
+        self.db.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _add_songs(self, count: int, duration: float = 180.0) -> List[int]:
+        """Add songs /music/0.mp3 ... to the library, returning their IDs"""
+        return [
+            self.db.add_song({'title': f'Song {i}', 'file_path': f'/music/{i}.mp3',
+                              'duration': duration})
+            for i in range(count)
+        ]
+
+    def test_03b_add_song_appends_in_one_statement(self):
+        """Test appending computes the next position inside the INSERT"""
+        first, second = (self.manager.create_playlist(name) for name in ("One", "Two"))
+        song_ids = self._add_songs(4)
+
+        with patch.object(self.db, 'fetch_one', wraps=self.db.fetch_one) as fetch_one:
+            for song_id in song_ids[:3]:
+                self.assertTrue(self.manager.add_song(first, song_id))
+            self.assertTrue(self.manager.add_song(second, song_ids[3]))
+        fetch_one.assert_not_called()
+
+        rows = self.db.fetch_all(
+            "SELECT playlist_id, song_id, position FROM playlist_songs ORDER BY id")
+        self.assertEqual([(r['playlist_id'], r['song_id'], r['position']) for r in rows],
+                         [(first, song_ids[0], 0), (first, song_ids[1], 1),
+                          (first, song_ids[2], 2), (second, song_ids[3], 0)])
+
+    def test_05b_reorder_songs_single_update(self):
+        """Test reordering renumbers positions in one UPDATE"""
+        playlist_id = self.manager.create_playlist("Mix")
+        song_ids = self._add_songs(4)
+        self.assertTrue(self.manager.add_songs_bulk(playlist_id, song_ids))
+
+        with patch.object(self.db, 'execute_query', wraps=self.db.execute_query) as execute_query:
+            self.assertTrue(self.manager.reorder_songs(playlist_id, old_index=0, new_index=2))
+        self.assertEqual(execute_query.call_count, 1)
+
+        order = [song['id'] for song in self.manager.get_playlist_songs(playlist_id)]
+        self.assertEqual(order, [song_ids[1], song_ids[2], song_ids[0], song_ids[3]])
+
+    def test_06b_get_playlists_includes_stats(self):
+        """Test get_playlists returns song count and total duration in one query"""
+        playlist_b = self.manager.create_playlist("B")
+        self.manager.create_playlist("A")
+        first, second = self._add_songs(2)
+        self.db.update_song(second, {'duration': 200.5})
+        self.assertTrue(self.manager.add_songs_bulk(playlist_b, [first, second]))
+
+        with patch.object(self.db, 'fetch_all', wraps=self.db.fetch_all) as fetch_all:
+            playlists = self.manager.get_playlists()
+        fetch_all.assert_called_once()
+
+        stats = [(p['name'], p['song_count'], p['total_duration']) for p in playlists]
+        self.assertEqual(stats, [('A', 0, 0), ('B', 2, 380.5)])
+
+    def test_10b_duplicate_playlist_copies_songs_in_database(self):
+        """Test duplicating a playlist copies songs with one INSERT ... SELECT"""
+        original = self.manager.create_playlist("Original", "Best")
+        song_ids = self._add_songs(3)
+        for position, song_id in ((2, song_ids[2]), (0, song_ids[0]), (1, song_ids[1])):
+            self.assertTrue(self.manager.add_song(original, song_id, position))
+
+        with patch.object(self.db, 'fetch_all', wraps=self.db.fetch_all) as fetch_all:
+            new_id = self.manager.duplicate_playlist(original)
+        fetch_all.assert_not_called()
+
+        self.assertNotEqual(new_id, original)
+        copy = self.db.fetch_one("SELECT name, description FROM playlists WHERE id = ?", (new_id,))
+        self.assertEqual((copy['name'], copy['description']), ("Copy of Original", "Best"))
+        rows = self.db.fetch_all(
+            "SELECT song_id, position FROM playlist_songs WHERE playlist_id = ? ORDER BY position",
+            (new_id,)
+        )
+        self.assertEqual([(r['song_id'], r['position']) for r in rows],
+                         [(song_ids[0], 0), (song_ids[1], 1), (song_ids[2], 2)])
+
+    def test_load_playlist_skips_repeated_songs(self):
+        """Test a .m3u8 listing a song twice imports it once, keeping the rest"""
+        song_ids = self._add_songs(3)
+        playlist_path = os.path.join(self.temp_dir, "mix.m3u8")
+        with open(playlist_path, 'w', encoding='utf-8') as f:
+            f.write('#EXTM3U\n')
+            for i in (0, 1, 0, 2, 1):
+                f.write(f'#EXTINF:180,Artist - Song {i}\n/music/{i}.mp3\n')
+            f.write('/music/missing.mp3\n')
+
+        playlist_id = self.manager.load_playlist(playlist_path)
+
+        self.assertIsNotNone(playlist_id)
+        rows = self.db.fetch_all(
+            "SELECT song_id, position FROM playlist_songs WHERE playlist_id = ? ORDER BY position",
+            (playlist_id,)
+        )
+        self.assertEqual([(r['song_id'], r['position']) for r in rows],
+                         [(song_ids[0], 0), (song_ids[1], 1), (song_ids[2], 2)])
+
+
 if __name__ == "__main__":
     # Run tests
     unittest.main(verbosity=2)
@@ -0,0 +1,85 @@
+"""
+Tests for Response Cache (persistent API response cache)
+"""
+import unittest
+import tempfile
+import shutil
+import os
+from unittest.mock import Mock, patch
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test ResponseCache (stale-while-revalidate SQLite cache)"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        from src.core.response_cache import ResponseCache
+        self.cache_class = ResponseCache
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "cache", "api_cache.db")
+
+    def tearDown(self):
+        """Cleanup temp files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_fresh_stale_and_expired_entries(self):
+        """Test entries are fresh, then stale, then dropped"""
+        cache = self.cache_class(self.db_path, fresh_ttl=10, stale_ttl=100)
+        value = [{'title': 'Song', 'score': 95.5}]
+
+        with patch('src.core.response_cache.time.time', return_value=1000.0):
+            self.assertEqual(cache.get('key'), (None, False))
+            cache.set('key', value)
+            self.assertEqual(cache.get('key'), (value, True))
+
+        with patch('src.core.response_cache.time.time', return_value=1050.0):
+            self.assertEqual(cache.get('key'), (value, False))
+
+        with patch('src.core.response_cache.time.time', return_value=1200.0):
+            self.assertEqual(cache.get('key'), (None, False))
+            self.assertEqual(cache.prune(), 1)
+
+        cache.close()
+
+    def test_entries_persist_across_instances(self):
+        """Test a reopened cache still has earlier entries"""
+        cache = self.cache_class(self.db_path)
+        cache.set('key', ['value'])
+        cache.close()
+
+        reopened = self.cache_class(self.db_path)
+        self.assertEqual(reopened.get('key'), (['value'], True))
+        reopened.close()
+
+    def test_fetcher_serves_stale_results_and_revalidates(self):
+        """Test MetadataFetcher returns stale results and refreshes them in the background"""
+        from src.core.metadata_fetcher import MetadataFetcher
+
+        cache = self.cache_class(self.db_path, fresh_ttl=10, stale_ttl=100)
+        mb_client = Mock()
+        mb_client.search_recordings.return_value = [
+            {'title': 'Song', 'artist-credit': [{'name': 'Artist'}], 'length': 200000}
+        ]
+
+        with patch('src.core.response_cache.time.time', return_value=1000.0):
+            first = MetadataFetcher(mb_client, None, cache).search_by_title_artist('Song', 'Artist', 200)
+
+        # New session, entry still fresh: no network
+        with patch('src.core.response_cache.time.time', return_value=1005.0):
+            second = MetadataFetcher(mb_client, None, cache).search_by_title_artist('Song', 'Artist', 200)
+        self.assertEqual(mb_client.search_recordings.call_count, 1)
+        self.assertEqual(first, second)
+
+        # Stale: served from cache, refreshed in the background
+        fetcher = MetadataFetcher(mb_client, None, cache)
+        with patch('src.core.response_cache.time.time', return_value=1050.0):
+            stale = fetcher.search_by_title_artist('Song', 'Artist', 200)
+            fetcher._revalidate_executor.shutdown(wait=True)
+
+        self.assertEqual(stale, first)
+        self.assertEqual(mb_client.search_recordings.call_count, 2)
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
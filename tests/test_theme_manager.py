@@ -200,6 +200,49 @@ class TestThemeManager(unittest.TestCase):
 
             self.assertIn("invalid_theme", str(cm.exception))
 
+    @patch('src.core.theme_manager.QApplication')
+    def test_qss_read_once_per_theme(self, mock_qapp_class):
+        """apply_theme() should read each QSS file once until reload_themes()"""
+        mock_qapp_class.instance.return_value = self.mock_qapp
+
+        with patch.object(ThemeManager, 'config_path', self.config_path):
+            manager = ThemeManager()
+
+            with patch('builtins.open', wraps=open) as mock_open:
+                manager.apply_theme("dark")
+                manager.apply_theme("light")
+                manager.apply_theme("dark")
+                qss_reads = [c for c in mock_open.call_args_list if str(c.args[0]).endswith('.qss')]
+                self.assertEqual(len(qss_reads), 2)
+
+                manager.reload_themes()
+                manager.apply_theme("light")
+                qss_reads = [c for c in mock_open.call_args_list if str(c.args[0]).endswith('.qss')]
+                self.assertEqual(len(qss_reads), 4)
+
+    @patch('src.core.theme_manager.QApplication')
+    def test_save_preference_skips_unchanged_theme(self, mock_qapp_class):
+        """Re-applying or previewing a theme should not rewrite config.json"""
+        mock_qapp_class.instance.return_value = self.mock_qapp
+
+        with patch.object(ThemeManager, 'config_path', self.config_path):
+            manager = ThemeManager()
+
+            with patch.object(manager, '_load_qss', return_value="/* qss */"):
+                with patch('src.core.theme_manager.json.dump', wraps=json.dump) as mock_dump:
+                    manager.apply_theme("light")
+                    manager.apply_theme("light")
+                    self.assertEqual(mock_dump.call_count, 1)
+                    self.assertEqual(self.mock_qapp.setStyleSheet.call_count, 1)
+
+                    # Preview without persisting
+                    manager.apply_theme("dark", persist=False)
+                    self.assertEqual(manager.current_theme, "dark")
+                    self.assertEqual(mock_dump.call_count, 1)
+
+            with open(self.config_path) as f:
+                self.assertEqual(json.load(f)['theme'], 'light')
+
     @patch('src.core.theme_manager.QApplication')
     def test_missing_qss_file_fallback(self, mock_qapp_class):
         """_load_qss() should return empty string if QSS file missing"""
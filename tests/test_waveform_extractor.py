@@ -0,0 +1,181 @@
+"""
+Tests for WaveformExtractor (waveform/spectrum extraction and caching)
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+
+def _make_segment(samples: np.ndarray, sample_rate: int = 8000) -> MagicMock:
+    """Fake mono 16-bit pydub AudioSegment over the given samples"""
+    segment = MagicMock()
+    segment.channels = 1
+    segment.sample_width = 2
+    segment.frame_rate = sample_rate
+    segment.raw_data = samples.astype('<i2').tobytes()
+    segment.__len__.return_value = int(len(samples) * 1000 / sample_rate)
+    return segment
+
+
+class TestWaveformExtractor(unittest.TestCase):
+    """Test WaveformExtractor caches (memory LRU, .npz disk cache, spectrum)"""
+
+    def setUp(self):
+        """Setup test fixtures"""
+        from src.core import waveform_extractor
+        self.module = waveform_extractor
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "waveform_cache")
+        self.audio_path = os.path.join(self.temp_dir, "song.mp3")
+        with open(self.audio_path, 'wb') as f:
+            f.write(b"\x00" * 1024)
+
+        # One second of a 440 Hz tone at 8 kHz
+        t = np.arange(8000) / 8000
+        self.samples = (np.sin(2 * np.pi * 440 * t) * 16000).astype(np.int16)
+
+        # Decode through a mocked pydub (no ffmpeg/soundfile needed)
+        self.audio_segment = MagicMock()
+        self.audio_segment.from_file.return_value = _make_segment(self.samples)
+        patchers = [
+            patch.object(waveform_extractor, 'AudioSegment', self.audio_segment, create=True),
+            patch.object(waveform_extractor, 'PYDUB_AVAILABLE', True),
+            patch.object(waveform_extractor, 'SOUNDFILE_AVAILABLE', False),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Cleanup temp files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _extractor(self, **kwargs):
+        """New extractor persisting to the temp cache dir by default"""
+        kwargs.setdefault('cache_dir', self.cache_dir)
+        return self.module.WaveformExtractor(**kwargs)
+
+    def test_extract_returns_read_only_float32(self):
+        """Test extract() returns the cached read-only float32 array"""
+        extractor = self._extractor()
+
+        waveform = extractor.extract(self.audio_path, num_points=100)
+
+        self.assertEqual(waveform.dtype, np.float32)
+        self.assertEqual(len(waveform), 100)
+        self.assertFalse(waveform.flags.writeable)
+        with self.assertRaises(ValueError):
+            waveform[0] = 1.0
+
+        # Served from memory the second time (same array, no decode)
+        self.assertIs(extractor.extract(self.audio_path, num_points=100), waveform)
+        self.assertEqual(self.audio_segment.from_file.call_count, 1)
+
+    def test_disk_cache_keyed_by_sha1_of_path(self):
+        """Test waveforms persist as <sha1(abspath)>_<points>.npz with mtime/size"""
+        extractor = self._extractor()
+        waveform = extractor.extract(self.audio_path, num_points=100)
+
+        digest = hashlib.sha1(os.path.abspath(self.audio_path).encode('utf-8')).hexdigest()
+        cache_file = Path(self.cache_dir) / f"{digest}_100.npz"
+        self.assertTrue(cache_file.exists())
+
+        stat = os.stat(self.audio_path)
+        with np.load(cache_file) as stored:
+            np.testing.assert_array_equal(stored['waveform'], waveform)
+            self.assertEqual(int(stored['mtime_ns']), stat.st_mtime_ns)
+            self.assertEqual(int(stored['size']), stat.st_size)
+
+    def test_disk_cache_reused_by_new_instance(self):
+        """Test a new extractor loads an unchanged file's waveform without decoding"""
+        waveform = self._extractor().extract(self.audio_path, num_points=100)
+
+        self.audio_segment.from_file.side_effect = AssertionError("decoded again")
+        reloaded = self._extractor().extract(self.audio_path, num_points=100)
+
+        np.testing.assert_array_equal(reloaded, waveform)
+        self.assertEqual(reloaded.dtype, np.float32)
+        self.assertFalse(reloaded.flags.writeable)
+
+    def test_disk_cache_invalidated_by_mtime(self):
+        """Test a changed mtime_ns makes the persisted waveform stale"""
+        self._extractor().extract(self.audio_path, num_points=100)
+
+        stat = os.stat(self.audio_path)
+        os.utime(self.audio_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self._extractor().extract(self.audio_path, num_points=100)
+        self.assertEqual(self.audio_segment.from_file.call_count, 2)
+
+    def test_disk_cache_invalidated_by_size(self):
+        """Test a changed size makes the persisted waveform stale (same mtime)"""
+        self._extractor().extract(self.audio_path, num_points=100)
+
+        stat = os.stat(self.audio_path)
+        with open(self.audio_path, 'ab') as f:
+            f.write(b"\x00")
+        os.utime(self.audio_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self._extractor().extract(self.audio_path, num_points=100)
+        self.assertEqual(self.audio_segment.from_file.call_count, 2)
+
+    def test_disk_cache_disabled(self):
+        """Test cache_dir=None keeps waveforms in memory only"""
+        extractor = self._extractor(cache_dir=None)
+        self.assertIsNotNone(extractor.extract(self.audio_path, num_points=100))
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_memory_cache_is_bounded_lru(self):
+        """Test the memory cache evicts the least recently used entry"""
+        extractor = self._extractor(cache_dir=None, cache_size=2)
+
+        extractor._cache_put('a', 1)
+        extractor._cache_put('b', 2)
+        self.assertEqual(extractor._cache_get('a'), 1)  # 'b' is now oldest
+        extractor._cache_put('c', 3)
+
+        self.assertEqual(extractor.get_cache_size(), 2)
+        self.assertIsNone(extractor._cache_get('b'))
+        self.assertEqual(extractor._cache_get('a'), 1)
+        self.assertEqual(extractor._cache_get('c'), 3)
+
+        extractor.clear_cache()
+        self.assertEqual(extractor.get_cache_size(), 0)
+
+    def test_spectrum_cached_as_uint8(self):
+        """Test spectra are cached quantized and round-trip within half a level"""
+        extractor = self._extractor(cache_dir=None)
+
+        spectrum, duration = extractor.extract_spectrum(
+            self.audio_path, num_bars=16, window_size_ms=50
+        )
+        self.assertAlmostEqual(duration, 1.0)
+
+        quantized, cached_duration = extractor.cache[f"spectrum_{self.audio_path}_16_50"]
+        self.assertEqual(quantized.dtype, np.uint8)
+        self.assertEqual(quantized.shape, (len(spectrum), 16))
+        self.assertEqual(cached_duration, duration)
+
+        # Against the unquantized spectrum: at most half a level off
+        exact = extractor._compute_spectrum(
+            self.samples.astype(np.float32) / 32768, 8000, 16, 50
+        )
+        levels = self.module.SPECTRUM_LEVELS
+        np.testing.assert_allclose(np.array(spectrum), exact, atol=0.5 / levels + 1e-6)
+
+        # A cache hit returns the same values as the first extraction
+        self.assertEqual(
+            extractor.extract_spectrum(self.audio_path, num_bars=16, window_size_ms=50),
+            (spectrum, duration)
+        )
+        self.assertEqual(self.audio_segment.from_file.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()